@@ -5,10 +5,26 @@
 - Supabase 연결 정보 관리
 """
 import os
-from dotenv import load_dotenv
 
-# .env 파일 로드
-load_dotenv()
+
+def _find_env_file() -> str:
+    """config.py 위치부터 상위 디렉토리로 올라가며 .env 탐색 (python-dotenv find_dotenv와 같은 순서)"""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return ""
+        path = parent
+
+
+# .env 파일 로드 (파일이 없으면 dotenv import 생략 → CI처럼 환경변수만 쓰는 실행은 시작이 빠름)
+_ENV_FILE = _find_env_file()
+if _ENV_FILE:
+    from dotenv import load_dotenv
+    load_dotenv(_ENV_FILE)
 
 # Supabase 설정
 SUPABASE_URL = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
@@ -16,10 +32,81 @@ SUPABASE_URL = os.getenv("NEXT_PUBLIC_SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY") or os.getenv("NEXT_PUBLIC_SUPABASE_ANON_KEY")
 
 # 크롤링 설정
-CRAWL_DELAY = float(os.getenv("CRAWL_DELAY", "1.0"))
-MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))
+CRAWL_DELAY = float(os.getenv("CRAWL_DELAY", "1.0"))  # 크롤러별 요청 시작 최소 간격(초), 워커 전체가 공유
+MAX_RETRIES = int(os.getenv("MAX_RETRIES", "3"))  # 요청 재시도 횟수 (작업 큐 크롤러는 TASK_MAX_ATTEMPTS만 사용)
 TIMEOUT = int(os.getenv("TIMEOUT", "30"))
 
+# HTTP 전송 설정 (커넥션 풀 / HTTP/2)
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # 호스트별 풀 개수
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))  # 풀당 최대 커넥션 수
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "false").lower() == "true"  # httpx[http2] 필요
+
+# 작업 큐 크롤링 (CU/세븐일레븐: 페이지, 상세 요청 단위 작업)
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "3"))  # 동시에 처리할 작업 수 (요청 속도는 CRAWL_DELAY로 워커 전체 합산 제한)
+TASK_MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", "3"))  # 작업별 최대 시도 횟수 (요청 재시도 없이 이 횟수만 시도)
+TASK_RETRY_BACKOFF = float(os.getenv("TASK_RETRY_BACKOFF", "5"))  # 실패 작업 첫 재시도 대기(초), 이후 2배씩
+
+# 서킷 브레이커 설정 (호스트 + list/detail 별)
+CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "5"))
+CIRCUIT_RECOVERY_TIMEOUT = float(os.getenv("CIRCUIT_RECOVERY_TIMEOUT", "60"))
+
+# 로컬 데이터 경로 (JSON 백업, 체크포인트)
+DATA_DIR = os.getenv("CRAWLER_DATA_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data"))
+CHECKPOINT_DIR = os.path.join(DATA_DIR, "checkpoints")
+DEAD_LETTER_DIR = os.path.join(DATA_DIR, "dead_letter")  # 재시도 한도를 넘긴 페이지/상세 요청 (--resume 시 재시도)
+BACKUP_COMPRESSION = os.getenv("BACKUP_COMPRESSION", "gzip")  # gzip 또는 zstd (zstandard 필요)
+BACKUP_KEEP = int(os.getenv("BACKUP_KEEP", "5"))  # 브랜드별 보관할 백업 개수
+SEARCH_INDEX_DIR = os.getenv("SEARCH_INDEX_DIR", os.path.join(DATA_DIR, "search_index"))  # 검색 색인 출력
+SEARCH_INDEX_SHARDS = int(os.getenv("SEARCH_INDEX_SHARDS", "16"))  # 검색 색인 샤드 수
+EXPORT_DIR = os.getenv("EXPORT_DIR", os.path.join(DATA_DIR, "export"))  # 정적 JSON 내보내기 출력
+MIRROR_PATH = os.getenv("CRAWLER_MIRROR_PATH", os.path.join(DATA_DIR, "promo_mirror.sqlite3"))  # 로컬 promo 미러
+
+# 로그 설정 (logs/ 아래, 파일 쓰기는 별도 스레드)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))  # 이 크기를 넘으면 .1, .2 ...로 로테이션
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))  # 파일별 보관할 로테이션 개수
+LOG_JSON = os.getenv("LOG_JSON", "false").lower() == "true"  # logs/crawler.jsonl에 컨텍스트 포함 JSON lines 추가 기록
+
+# DB 조회 설정 (PostgREST max-rows보다 작거나 같게)
+DB_PAGE_SIZE = int(os.getenv("DB_PAGE_SIZE", "1000"))
+
+# DB 동기화 방식
+# - diff: 크롤러에서 diff 후 REST로 삭제/삽입/업데이트 (기본값)
+# - rpc: merge_promotions Postgres 함수로 한 번에 병합
+# - copy: DATABASE_URL로 직접 연결해 COPY + set 기반 병합 (대량 변경용, psycopg 필요)
+SYNC_MODE = os.getenv("SYNC_MODE", "diff").lower()
+
+# Postgres 직접 연결 (SYNC_MODE=copy, prisma와 같은 연결 문자열)
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# 스트리밍 저장 (diff 모드): 크롤링 중 페이지 단위로 INSERT/UPDATE, 삭제는 크롤링 완료 확인 후
+STREAMING_UPLOAD = os.getenv("STREAMING_UPLOAD", "false").lower() == "true"  # 검증 전까지 기본값 off (기존 저장 경로 사용)
+STREAM_BATCH_ROWS = int(os.getenv("STREAM_BATCH_ROWS", "200"))  # 이 행 수가 모이면 바로 쓰기
+STREAM_FLUSH_SECONDS = float(os.getenv("STREAM_FLUSH_SECONDS", "5.0"))  # 마지막 쓰기 후 이 시간이 지나면 모인 만큼 쓰기
+STREAM_QUEUE_SIZE = int(os.getenv("STREAM_QUEUE_SIZE", "4"))  # 쓰기 대기 배치 최대 수 (넘으면 크롤러가 기다림)
+
+# DB 쓰기 설정 (동시 배치 INSERT)
+DB_WRITE_CONCURRENCY = int(os.getenv("DB_WRITE_CONCURRENCY", "4"))  # 동시에 전송할 배치 수
+DB_BATCH_TARGET_BYTES = int(os.getenv("DB_BATCH_TARGET_BYTES", "512000"))  # 배치당 최대 payload (bytes)
+DB_BATCH_TARGET_LATENCY = float(os.getenv("DB_BATCH_TARGET_LATENCY", "2.0"))  # 배치당 목표 응답 시간 (초)
+
+# 전체 업로드 파이프라인 (크롤링 ↔ DB 저장 겹침): 저장을 기다리는 크롤링 결과 최대 개수
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "1"))
+
+# 근사 중복 탐지 (MinHash 추정 유사도가 이 값 이상이면 같은 상품명으로 간주)
+NEAR_DUPLICATE_THRESHOLD = float(os.getenv("NEAR_DUPLICATE_THRESHOLD", "0.8"))
+NEAR_DUPLICATE_REMOVE = os.getenv("NEAR_DUPLICATE_REMOVE", "false").lower() == "true"  # false면 리포트만 (스트리밍 저장 중에는 항상 리포트만)
+NEAR_DUPLICATE_REPORT_DIR = os.path.join(DATA_DIR, "near_duplicates")  # 브랜드별 클러스터 리포트 (검토용)
+
+# 데몬 모드 (python upload_to_db.py daemon)
+# 작업별 cron 일정 (로컬 시간, "작업1,작업2=분 시 일 월 요일;..."), refresh = 가격 비교/검색 색인/정적 내보내기
+DAEMON_SCHEDULE = os.getenv("DAEMON_SCHEDULE", "cu,seven,gs25,emart24=0 2 * * 1;refresh=0 4 * * 1")
+DAEMON_CONCURRENCY = int(os.getenv("DAEMON_CONCURRENCY", "2"))  # 동시에 실행할 최대 작업 수
+DAEMON_HEALTH_HOST = os.getenv("DAEMON_HEALTH_HOST", "127.0.0.1")  # 상태 엔드포인트 바인드 주소
+DAEMON_HEALTH_PORT = int(os.getenv("DAEMON_HEALTH_PORT", "8787"))  # 0이면 비활성화
+DAEMON_BROWSER_POOL_SIZE = int(os.getenv("DAEMON_BROWSER_POOL_SIZE", "1"))  # 재사용할 Chrome 최대 개수
+DAEMON_BROWSER_MAX_USES = int(os.getenv("DAEMON_BROWSER_MAX_USES", "20"))  # Chrome 하나를 교체하기 전 사용 횟수
+
 # 이미지 설정
 DOWNLOAD_IMAGES = os.getenv("DOWNLOAD_IMAGES", "true").lower() == "true"
 IMAGE_MAX_WIDTH = int(os.getenv("IMAGE_MAX_WIDTH", "800"))
@@ -1,45 +1,79 @@
 """
 기본 크롤러 클래스
 - 모든 편의점 크롤러가 상속받는 베이스 클래스
-- 공통 기능: HTTP 요청, 에러 처리, 재시도 로직 등
+- 공통 기능: HTTP 요청, 에러 처리, 재시도 로직, 서킷 브레이커 등
+- 요청 간격(CRAWL_DELAY)은 워커 스레드 수와 관계없이 크롤러 단위로 공유
 """
 import time
 import requests
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
-from utils.logger import setup_logger
+from typing import List, Dict, Any, Tuple, Callable
+from utils.logger import setup_logger, log_context, update_log_context
+from utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from utils.rate_limiter import RateLimiter
+from utils.checkpoint import CrawlCheckpoint
+from utils.http_transport import create_session, transport_stats
+from utils.promotion import content_hash, HASH_FIELD
+from utils.title_normalizer import normalize_products
+from utils.single_flight import SingleFlightMemo
 import config
 
 class BaseCrawler(ABC):
     """모든 편의점 크롤러의 기본 클래스"""
 
-    def __init__(self, brand_name: str):
+    REQUEST_ATTEMPTS = None  # _request 시도 횟수 (None이면 config.MAX_RETRIES)
+
+    def __init__(self, brand_name: str, session: requests.Session = None):
         """
         Args:
             brand_name: 브랜드명 (예: "Emart24")
+            session: 재사용할 HTTP 세션 (데몬 모드의 warm 세션, 없으면 새로 생성)
         """
         self.brand_name = brand_name
         self.logger = setup_logger(f"{brand_name.lower()}_crawler")
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': config.USER_AGENT
-        })
+        self.session = session or create_session(config.USER_AGENT)
+        # 호스트 + 엔드포인트 종류(list/detail)별 서킷 브레이커
+        self.circuits = CircuitBreakerRegistry()
+        # 모든 워커가 공유하는 요청 간격 (워커별로 CRAWL_DELAY를 쉬면 워커 수만큼 요청 속도가 늘어남)
+        self.rate_limiter = RateLimiter(config.CRAWL_DELAY)
+        self.detail_skipped = 0  # 서킷 OPEN으로 상세 수집을 생략한 횟수
+        # 상품 ID별 상세 정보 (run()마다 초기화, 여러 탭/조건에 나오는 상품은 한 번만 요청)
+        self.detail_memo = SingleFlightMemo()
+        self.checkpoint = None  # run() 시작 시 생성
+        self.resumed = False  # 마지막 run()이 --resume 이었는지
+        # 완료 여부 판단용 (시작한 유닛이 모두 끝났고 예외 없이 crawl()이 반환해야 완료)
+        self.units_started: set = set()
+        self.units_done: set = set()
+        self.crawl_failed = False
+        self.page_listeners: List[Callable[[List[Dict[str, Any]]], None]] = []  # 페이지 단위 상품 수신자
 
-    def _request(self, url: str, method: str = 'GET', **kwargs) -> requests.Response:
+    def _request(self, url: str, method: str = 'GET', endpoint: str = 'list', **kwargs) -> requests.Response:
         """
-        HTTP 요청 with 재시도 로직
+        HTTP 요청 with 재시도 로직 + 서킷 브레이커
 
         Args:
             url: 요청 URL
             method: HTTP 메서드 (GET, POST 등)
+            endpoint: 서킷 구분용 엔드포인트 종류 ('list' 또는 'detail')
             **kwargs: requests 라이브러리에 전달할 추가 파라미터
 
         Returns:
             Response 객체
+
+        Raises:
+            CircuitOpenError: 해당 호스트/엔드포인트 서킷이 열려 있을 때 (재시도 없이 즉시)
         """
-        for attempt in range(config.MAX_RETRIES):
+        breaker = self.circuits.get(url, endpoint)
+        attempts = self.REQUEST_ATTEMPTS or config.MAX_RETRIES
+
+        for attempt in range(attempts):
+            # OPEN 상태면 백오프 없이 즉시 실패 (HALF_OPEN이면 probe 1건만 통과)
+            if not breaker.allow_request():
+                raise CircuitOpenError(self.circuits.key_for(url, endpoint), breaker.retry_after())
+
             try:
-                self.logger.debug(f"Request {method} {url} (attempt {attempt + 1})")
+                self.rate_limiter.wait()  # 서버 부하 방지
+                self.logger.debug("Request %s %s (attempt %d)", method, url, attempt + 1)
 
                 if method == 'GET':
                     response = self.session.get(url, timeout=config.TIMEOUT, **kwargs)
@@ -49,15 +83,133 @@ class BaseCrawler(ABC):
                     raise ValueError(f"Unsupported method: {method}")
 
                 response.raise_for_status()
-                time.sleep(config.CRAWL_DELAY)  # 서버 부하 방지
+                breaker.record_success()
                 return response
 
             except requests.RequestException as e:
-                self.logger.warning(f"Request failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}")
-                if attempt == config.MAX_RETRIES - 1:
+                if self._is_server_failure(e):
+                    breaker.record_failure()
+                else:
+                    # 404 등 개별 요청 오류는 서버 장애가 아니므로 서킷에 반영하지 않음
+                    breaker.record_success()
+                self.logger.warning("Request failed (attempt %d/%d): %s", attempt + 1, attempts, e)
+                if attempt == attempts - 1:
                     raise
                 time.sleep(2 ** attempt)  # 지수 백오프
 
+            except BaseException:
+                # 성공/실패를 기록하지 못한 요청 (h2 ProtocolError, ValueError, KeyboardInterrupt 등)
+                # HALF_OPEN probe가 걸린 채로 남으면 서킷이 영원히 닫히지 않으므로 probe 해제
+                breaker.release_probe()
+                raise
+
+    def _is_server_failure(self, error: requests.RequestException) -> bool:
+        """
+        서킷 브레이커에 실패로 기록할 오류인지 판단
+
+        Args:
+            error: requests 예외
+
+        Returns:
+            연결 오류/타임아웃/5xx/429면 True
+        """
+        response = getattr(error, 'response', None)
+        if response is None:
+            return True
+        return response.status_code >= 500 or response.status_code == 429
+
+    def _resume_unit(self, unit: str) -> Tuple[int, List[Dict[str, Any]], bool]:
+        """
+        체크포인트에서 유닛 재개 지점 조회
+
+        Args:
+            unit: 유닛 키 (예: "tab:1")
+
+        Returns:
+            (시작 페이지, 이미 수집한 상품, 유닛 완료 여부)
+        """
+        self.units_started.add(unit)
+        if not self.checkpoint:
+            self._start_page(unit, 1)
+            return 1, [], False
+
+        start_page, products, done = self.checkpoint.resume_unit(unit)
+        self._start_page(unit, start_page)
+        if done:
+            self.units_done.add(unit)
+        if start_page > 1 or done:
+            self.logger.info(f"{unit}: resumed {len(products)} products (next page: {start_page}, done: {done})")
+            self._notify_listeners(products)
+        return start_page, products, done
+
+    def _start_page(self, unit: str, page: int):
+        """이후 로그에 유닛/페이지 컨텍스트 기록 (JSON 로그의 unit, page 필드)"""
+        update_log_context(unit=unit, page=page)
+
+    def add_page_listener(self, listener: Callable[[List[Dict[str, Any]]], None]):
+        """
+        페이지 단위 상품 리스너 등록 (백업 스트리밍 등)
+
+        Args:
+            listener: 페이지에서 파싱한 상품 리스트를 받는 함수
+        """
+        self.page_listeners.append(listener)
+
+    def _notify_listeners(self, products: List[Dict[str, Any]]):
+        """등록된 리스너에 상품 전달"""
+        for listener in self.page_listeners:
+            listener(products)
+
+    def _new_products(self, collected: List[Dict[str, Any]], parsed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        이미 수집한 상품과 원본 상품명이 같은 상품 제외 (페이지 간 중복, 페이지 안 중복)
+
+        수집한 상품은 _emit_page에서 title이 정규화되므로 title이 아닌 raw_title로 비교
+
+        Args:
+            collected: 이전 페이지까지 수집한 상품
+            parsed: 현재 페이지에서 파싱한 상품
+
+        Returns:
+            새 상품 리스트 (페이지 순서 유지)
+        """
+        seen = {p.get('raw_title') or p.get('title') for p in collected}
+        new_products = []
+        for product in parsed:
+            key = product.get('raw_title') or product.get('title')
+            if key not in seen:
+                seen.add(key)
+                new_products.append(product)
+        return new_products
+
+    def _finalize_products(self, products: List[Dict[str, Any]]):
+        """
+        페이지 단위 후처리 (상품명 정규화 후 콘텐츠 해시 계산)
+
+        Args:
+            products: 페이지에서 파싱한 상품 리스트 (제자리 수정)
+        """
+        normalize_products(products)
+        for product in products:
+            product[HASH_FIELD] = content_hash(product)
+
+    def _emit_page(self, unit: str, page: int, products: List[Dict[str, Any]]):
+        """페이지 파싱 완료 시 후처리, 체크포인트 기록 및 리스너 전달"""
+        self._record_page(unit, page, products)
+        self._notify_listeners(products)
+
+    def _record_page(self, unit: str, page: int, products: List[Dict[str, Any]]):
+        """페이지 후처리 + 체크포인트 기록 (리스너 전달은 호출한 쪽에서)"""
+        self._finalize_products(products)
+        if self.checkpoint:
+            self.checkpoint.save_page(unit, page, products)
+
+    def _checkpoint_done(self, unit: str):
+        """유닛(탭/조건 등) 크롤링 완료 시 체크포인트 기록"""
+        self.units_done.add(unit)
+        if self.checkpoint:
+            self.checkpoint.complete_unit(unit)
+
     @abstractmethod
     def crawl(self) -> List[Dict[str, Any]]:
         """
@@ -81,18 +233,53 @@ class BaseCrawler(ABC):
         """
         pass
 
-    def run(self) -> List[Dict[str, Any]]:
+    def run(self, resume: bool = False) -> List[Dict[str, Any]]:
         """
         크롤링 실행 및 로깅
 
+        Args:
+            resume: True면 마지막 체크포인트부터 이어서 크롤링
+
         Returns:
             크롤링한 프로모션 데이터
         """
+        with log_context(brand=self.brand_name, unit=None, page=None):
+            return self._run(resume)
+
+    def _run(self, resume: bool) -> List[Dict[str, Any]]:
+        """run() 본문 (브랜드 로그 컨텍스트 안에서 실행)"""
         self.logger.info(f"Starting {self.brand_name} crawler...")
+        self.units_started, self.units_done, self.crawl_failed = set(), set(), False
+        self.resumed = resume
+        self.detail_memo = SingleFlightMemo()
         try:
+            self.checkpoint = CrawlCheckpoint(self.brand_name, resume=resume)
             data = self.crawl()
             self.logger.info(f"Successfully crawled {len(data)} items from {self.brand_name}")
+            self.logger.info(f"Connection stats: {transport_stats(self.session)}")
+            if self.detail_memo.stats['misses']:
+                self.logger.info(f"Detail memo: {self.detail_memo.summary()}")
+            if self.detail_skipped:
+                self.logger.warning(
+                    f"Skipped detail enrichment for {self.detail_skipped} items (circuit open): {self.circuits.states()}"
+                )
             return data
         except Exception as e:
             self.logger.error(f"Failed to crawl {self.brand_name}: {e}", exc_info=True)
+            self.crawl_failed = True
             return []
+
+    def is_complete(self) -> bool:
+        """
+        마지막 run()이 끝까지 크롤링했는지 (삭제 반영 가능 여부)
+
+        Returns:
+            예외 없이 끝났고 시작한 유닛이 모두 완료 처리되었으면 True
+        """
+        incomplete = self.units_started - self.units_done
+        if self.crawl_failed or not self.units_started or incomplete:
+            self.logger.warning(
+                f"{self.brand_name} crawl incomplete (failed: {self.crawl_failed}, unfinished units: {sorted(incomplete)})"
+            )
+            return False
+        return True
@@ -2,110 +2,85 @@
 CU 크롤러
 - URL: https://cu.bgfretail.com/event/plus.do
 - API: /event/plusAjax.do
-- 방식: AJAX API 직접 호출
+- 방식: AJAX API 직접 호출 (조건별 페이지/상품 상세 요청을 작업 큐로 처리)
 - 난이도: 중 (API 엔드포인트 사용 가능)
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
-from .base_crawler import BaseCrawler
+from .queued_crawler import QueuedPageCrawler
 import re
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
-class CUCrawler(BaseCrawler):
+class CUCrawler(QueuedPageCrawler):
     """CU 행사상품 크롤러"""
 
     BASE_URL = "https://cu.bgfretail.com"
     API_URL = "https://cu.bgfretail.com/event/plusAjax.do"
 
-    def __init__(self):
-        super().__init__("CU")
+    def __init__(self, session=None):
+        super().__init__("CU", session=session)
 
-    def _crawl_by_condition(self, search_condition: str, condition_name: str) -> List[Dict[str, Any]]:
+    def crawl(self) -> List[Dict[str, Any]]:
         """
-        특정 행사 조건으로 크롤링
-
-        Args:
-            search_condition: '23' (1+1), '24' (2+1), '' (전체)
-            condition_name: 로깅용 이름
+        CU 행사상품 크롤링 (1+1, 2+1 모두)
 
         Returns:
-            상품 리스트
+            프로모션 데이터 리스트
         """
-        products = []
-        page_index = 1
-        max_pages = 50  # 안전장치
-
-        self.logger.info(f"Crawling {condition_name} products...")
-
-        while page_index <= max_pages:
-            try:
-                # API 호출
-                params = {
-                    'pageIndex': page_index,
-                    'searchCondition': search_condition,
-                    'listType': 0  # 0: 리스트 교체, 1: 리스트 추가
-                }
-
-                response = self._request(self.API_URL, method='GET', params=params)
-
-                # HTML 파싱
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 상품 목록 추출
-                product_items = soup.select('li.prod_list')
+        return self._crawl_units([
+            ('condition:23', '1+1'),
+            ('condition:24', '2+1'),
+        ])
 
-                if not product_items:
-                    self.logger.info(f"{condition_name}: No more products on page {page_index}")
-                    break
-
-                for item in product_items:
-                    try:
-                        product = self._parse_product(item, search_condition)
-                        if product:
-                            products.append(product)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse product: {e}")
-                        continue
-
-                self.logger.info(f"{condition_name} - Page {page_index}: {len(product_items)} products")
-                page_index += 1
-
-            except Exception as e:
-                self.logger.error(f"Failed to crawl {condition_name} page {page_index}: {e}")
-                break
-
-        return products
-
-    def crawl(self) -> List[Dict[str, Any]]:
+    def _fetch_list_page(self, unit: str, page: int) -> Optional[List[Tuple[Dict[str, Any], Optional[str]]]]:
         """
-        CU 행사상품 크롤링 (1+1, 2+1 모두)
+        행사 조건별 목록 페이지 요청 + 파싱
+
+        Args:
+            unit: 유닛 키 ("condition:23" = 1+1, "condition:24" = 2+1)
+            page: 페이지 번호
 
         Returns:
-            프로모션 데이터 리스트
+            [(상품, 상세 ID), ...], 목록이 비어 있으면 None (마지막 페이지 다음)
         """
-        all_products = []
+        search_condition = unit.split(':', 1)[1]
+        # API 호출
+        params = {
+            'pageIndex': page,
+            'searchCondition': search_condition,
+            'listType': 0  # 0: 리스트 교체, 1: 리스트 추가
+        }
+        response = self._request(self.API_URL, method='GET', params=params)
 
-        # 1+1 상품
-        products_1_1 = self._crawl_by_condition('23', '1+1')
-        all_products.extend(products_1_1)
+        # HTML 파싱
+        soup = BeautifulSoup(response.text, 'html.parser')
 
-        # 2+1 상품
-        products_2_1 = self._crawl_by_condition('24', '2+1')
-        all_products.extend(products_2_1)
+        # 상품 목록 추출
+        product_items = soup.select('li.prod_list')
+        if not product_items:
+            return None
 
-        return all_products
+        items = []
+        for item in product_items:
+            try:
+                product, product_id = self._parse_product(item, search_condition)
+                if product:
+                    items.append((product, product_id))
+            except Exception as e:
+                self.logger.warning("Failed to parse product: %s", e)
+        return items
 
-    def _parse_product(self, item, search_condition: str) -> Dict[str, Any]:
+    def _parse_product(self, item, search_condition: str) -> Tuple[Dict[str, Any], Optional[str]]:
         """
-        개별 상품 파싱
+        개별 상품 파싱 (상세 정보는 별도 작업에서 _apply_detail로 채움)
 
         Args:
             item: BeautifulSoup 상품 엘리먼트
             search_condition: '23' (1+1) or '24' (2+1)
 
         Returns:
-            상품 데이터 딕셔너리
+            (상품 데이터 딕셔너리, 상세 페이지 ID)
         """
         # 상품명
         name_elem = item.select_one('.name p')
@@ -140,17 +115,6 @@ class CUCrawler(BaseCrawler):
             if match:
                 product_id = match.group(1)
 
-        # 상세 페이지에서 추가 정보 수집 (카테고리, 바코드 등)
-        category = None
-        barcode = None
-        description = None
-
-        if product_id:
-            detail_info = self._fetch_product_detail(product_id)
-            category = detail_info.get('category')
-            barcode = detail_info.get('barcode')
-            description = detail_info.get('description')
-
         # 상품 링크 생성
         source_url = f"{self.BASE_URL}/product/view.do?category=product&gdIdx={product_id}" if product_id else None
 
@@ -168,64 +132,65 @@ class CUCrawler(BaseCrawler):
             'sale_price': price,
             'image_url': image_url,
             'source_url': source_url,
-            'category': category,
+            'category': None,  # 상세 페이지에서 채움
             'start_date': start_date,  # 당월 1일
             'end_date': last_day,       # 당월 말일
-            'barcode': barcode,
-            'description': description,  # 추가 정보
-        }
+            'barcode': None,
+            'description': None,  # 추가 정보
+        }, product_id
 
-    def _fetch_product_detail(self, product_id: str) -> Dict[str, Any]:
+    def _apply_detail(self, product: Dict[str, Any], detail: Dict[str, Any]):
+        """상세 페이지 정보(카테고리, 바코드, 설명) 반영"""
+        product['category'] = detail.get('category')
+        product['barcode'] = detail.get('barcode')
+        product['description'] = detail.get('description')
+
+    def _load_product_detail(self, product_id: str) -> Dict[str, Any]:
         """
-        상품 상세 페이지에서 추가 정보 수집
+        상품 상세 페이지에서 추가 정보 수집 (실패 시 예외 → 작업 큐에서 재시도)
 
         Args:
-            product_id: 상품 ID
+            product_id: 상품 ID (gdIdx)
 
         Returns:
             카테고리, 바코드 등 추가 정보
         """
-        try:
-            detail_url = f"{self.BASE_URL}/product/view.do?category=product&gdIdx={product_id}"
-            response = self._request(detail_url)
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 카테고리(태그) 정보 추출
-            category_tags = []
-            tag_list = soup.select('#taglist li')
-            for tag in tag_list:
-                tag_text = tag.text.strip()
-                if tag_text:
-                    category_tags.append(tag_text)
-
-            # 첫 번째 태그를 메인 카테고리로 사용
-            category = category_tags[0] if category_tags else None
-
-            # 바코드 정보 (이미지 파일명에서 추출)
-            barcode = None
-            img_elem = soup.select_one('.prodDetail-w img')
-            if img_elem:
-                img_src = img_elem.get('src', '')
-                # 이미지 파일명이 바코드인 경우가 많음 (예: 8801047161677.png)
-                match = re.search(r'/(\d{13,14})\.', img_src)
-                if match:
-                    barcode = match.group(1)
-
-            # 상품 설명
-            description = None
-            desc_elem = soup.select_one('.prodExplain li')
-            if desc_elem:
-                description = desc_elem.text.strip()
-
-            return {
-                'category': category,
-                'barcode': barcode,
-                'description': description,
-            }
-
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch detail for product {product_id}: {e}")
-            return {'category': None, 'barcode': None, 'description': None}
+        detail_url = f"{self.BASE_URL}/product/view.do?category=product&gdIdx={product_id}"
+        response = self._request(detail_url, endpoint='detail')
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        # 카테고리(태그) 정보 추출
+        category_tags = []
+        tag_list = soup.select('#taglist li')
+        for tag in tag_list:
+            tag_text = tag.text.strip()
+            if tag_text:
+                category_tags.append(tag_text)
+
+        # 첫 번째 태그를 메인 카테고리로 사용
+        category = category_tags[0] if category_tags else None
+
+        # 바코드 정보 (이미지 파일명에서 추출)
+        barcode = None
+        img_elem = soup.select_one('.prodDetail-w img')
+        if img_elem:
+            img_src = img_elem.get('src', '')
+            # 이미지 파일명이 바코드인 경우가 많음 (예: 8801047161677.png)
+            match = re.search(r'/(\d{13,14})\.', img_src)
+            if match:
+                barcode = match.group(1)
+
+        # 상품 설명
+        description = None
+        desc_elem = soup.select_one('.prodExplain li')
+        if desc_elem:
+            description = desc_elem.text.strip()
+
+        return {
+            'category': category,
+            'barcode': barcode,
+            'description': description,
+        }
 
     def _parse_price(self, price_text: str) -> int:
         """
@@ -39,12 +39,17 @@ class Emart24Crawler(BaseCrawler):
         '2+1': '2',
     }
 
-    def __init__(self):
-        super().__init__("Emart24")
+    def __init__(self, session=None, browser_pool=None):
+        super().__init__("Emart24", session=session)
         self.driver = None
+        self.browser_pool = browser_pool  # 데몬 모드: 풀에서 브라우저 대여
 
     def _setup_driver(self):
         """Selenium WebDriver 설정"""
+        if self.browser_pool:
+            self.driver = self.browser_pool.acquire()
+            return
+
         chrome_options = Options()
         chrome_options.add_argument('--headless')  # 백그라운드 실행
         chrome_options.add_argument('--no-sandbox')
@@ -58,7 +63,10 @@ class Emart24Crawler(BaseCrawler):
 
     def _close_driver(self):
         """WebDriver 종료"""
-        if self.driver:
+        if self.driver and self.browser_pool:
+            self.browser_pool.release(self.driver)
+            self.driver = None
+        elif self.driver:
             self.driver.quit()
             self.logger.info("Selenium WebDriver 종료")
 
@@ -101,7 +109,11 @@ class Emart24Crawler(BaseCrawler):
         for category_name, category_code in self.CATEGORIES.items():
             self.logger.info(f"{benefit_name} - {category_name} 크롤링 시작...")
 
-            category_products = []
+            unit = f"benefit:{benefit_code}:category:{category_code}"
+            start_page, category_products, done = self._resume_unit(unit)
+            if done:
+                products.extend(category_products)
+                continue
 
             # URL: category_seq=혜택타입, base_category_seq=카테고리
             url = f"{self.BASE_URL}?search=&category_seq={benefit_code}&base_category_seq={category_code}&align="
@@ -117,31 +129,22 @@ class Emart24Crawler(BaseCrawler):
                 )
 
                 # 페이지네이션 처리 (마지막 페이지까지)
-                page = 1
+                page = start_page
                 consecutive_no_new = 0
 
+                # 재개 시: 완료한 페이지까지 파싱 없이 순서대로 이동
+                for skip_page in range(2, start_page):
+                    if not self._go_to_page(skip_page, f"{benefit_name} - {category_name}"):
+                        break
+
                 while True:
-                    self.logger.info(f"{benefit_name} - {category_name} - Page {page} 크롤링 중...")
+                    self._start_page(unit, page)
+                    self.logger.info("%s - %s - Page %d 크롤링 중...", benefit_name, category_name, page)
 
                     # 페이지 이동 (2페이지부터)
-                    if page > 1:
-                        try:
-                            # 페이지 번호 클릭 (.pIndex span)
-                            page_buttons = self.driver.find_elements(By.CSS_SELECTOR, f'.pIndex span')
-                            clicked = False
-                            for btn in page_buttons:
-                                if btn.text.strip() == str(page):
-                                    btn.click()
-                                    time.sleep(2)
-                                    clicked = True
-                                    break
-
-                            if not clicked:
-                                self.logger.info(f"{benefit_name} - {category_name}: Page {page} 버튼을 찾을 수 없음 (마지막 페이지)")
-                                break
-                        except Exception as e:
-                            self.logger.warning(f"{benefit_name} - {category_name}: Failed to click page {page}: {e}")
-                            break
+                    if page > 1 and not self._go_to_page(page, f"{benefit_name} - {category_name}"):
+                        self._checkpoint_done(unit)
+                        break
 
                     # 현재 페이지 상품 수집
                     html = self.driver.page_source
@@ -150,28 +153,29 @@ class Emart24Crawler(BaseCrawler):
                     # 상품 리스트 파싱
                     product_items = soup.select('.itemWrap')
 
-                    # 중복 제거 (이미 수집한 상품 제외)
-                    existing_titles = {p['title'] for p in category_products}
-                    new_count = 0
-
+                    parsed = []
                     for item in product_items:
                         try:
                             product = self._parse_product(item, benefit_name, category_name)
-                            if product and product['title'] not in existing_titles:
-                                category_products.append(product)
-                                existing_titles.add(product['title'])
-                                new_count += 1
+                            if product:
+                                parsed.append(product)
                         except Exception as e:
-                            self.logger.warning(f"Failed to parse product: {e}")
+                            self.logger.warning("Failed to parse product: %s", e)
                             continue
 
-                    self.logger.info(f"{benefit_name} - {category_name} - Page {page}: {new_count}개 새 상품 (총: {len(category_products)}개)")
+                    # 중복 제거 (이미 수집한 상품 제외)
+                    page_products = self._new_products(category_products, parsed)
+                    category_products.extend(page_products)
+                    self._emit_page(unit, page, page_products)
+                    new_count = len(page_products)
+                    self.logger.info("%s - %s - Page %d: %d개 새 상품 (총: %d개)", benefit_name, category_name, page, new_count, len(category_products))
 
                     # 연속으로 새 상품이 없으면 종료
                     if new_count == 0:
                         consecutive_no_new += 1
                         if consecutive_no_new >= 2:
                             self.logger.info(f"{benefit_name} - {category_name}: No new products for 2 consecutive pages, stopping")
+                            self._checkpoint_done(unit)
                             break
                     else:
                         consecutive_no_new = 0
@@ -181,15 +185,42 @@ class Emart24Crawler(BaseCrawler):
                     # 안전장치: 최대 100페이지
                     if page > 100:
                         self.logger.warning(f"{benefit_name} - {category_name}: Reached max page limit (100)")
+                        self._checkpoint_done(unit)
                         break
 
                 products.extend(category_products)
 
             except Exception as e:
                 self.logger.error(f"Failed to crawl {benefit_name} - {category_name}: {e}")
+                # 실패 전까지 수집한 상품은 유지 (체크포인트에도 기록되어 있음)
+                products.extend(category_products)
 
         return products
 
+    def _go_to_page(self, page: int, label: str) -> bool:
+        """
+        페이지 번호 버튼 클릭으로 이동 (.pIndex span)
+
+        Args:
+            page: 이동할 페이지 번호
+            label: 로그용 이름 (혜택 - 카테고리)
+
+        Returns:
+            이동 성공 여부 (False면 마지막 페이지: 해당 번호 버튼 없음)
+
+        Raises:
+            클릭 중 Selenium 예외 (마지막 페이지로 보지 않음 → 유닛 미완료로 남아 삭제 반영 안 함)
+        """
+        page_buttons = self.driver.find_elements(By.CSS_SELECTOR, '.pIndex span')
+        for btn in page_buttons:
+            if btn.text.strip() == str(page):
+                btn.click()
+                time.sleep(2)
+                return True
+
+        self.logger.info(f"{label}: Page {page} 버튼을 찾을 수 없음 (마지막 페이지)")
+        return False
+
     def _parse_product(self, item, benefit_name: str, category_name: str) -> Dict[str, Any]:
         """
         개별 상품 파싱
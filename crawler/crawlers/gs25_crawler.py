@@ -24,12 +24,17 @@ class GS25Crawler(BaseCrawler):
 
     BASE_URL = "http://gs25.gsretail.com/gscvs/ko/products/event-goods"
 
-    def __init__(self):
-        super().__init__("GS25")
+    def __init__(self, session=None, browser_pool=None):
+        super().__init__("GS25", session=session)
         self.driver = None
+        self.browser_pool = browser_pool  # 데몬 모드: 풀에서 브라우저 대여
 
     def _setup_driver(self):
         """Selenium WebDriver 설정"""
+        if self.browser_pool:
+            self.driver = self.browser_pool.acquire()
+            return
+
         chrome_options = Options()
         chrome_options.add_argument('--headless')  # 백그라운드 실행
         chrome_options.add_argument('--no-sandbox')
@@ -43,7 +48,10 @@ class GS25Crawler(BaseCrawler):
 
     def _close_driver(self):
         """WebDriver 종료"""
-        if self.driver:
+        if self.driver and self.browser_pool:
+            self.browser_pool.release(self.driver)
+            self.driver = None
+        elif self.driver:
             self.driver.quit()
             self.logger.info("Selenium WebDriver 종료")
 
@@ -82,7 +90,10 @@ class GS25Crawler(BaseCrawler):
         Returns:
             상품 리스트
         """
-        products = []
+        unit = f"tab:{tab_index}"
+        start_page, products, done = self._resume_unit(unit)
+        if done:
+            return products
         self.logger.info(f"Crawling {tab_name} products...")
 
         try:
@@ -105,28 +116,22 @@ class GS25Crawler(BaseCrawler):
             )
 
             # 페이지네이션 처리 (마지막 페이지까지)
-            page = 1
+            page = start_page
             consecutive_no_new = 0  # 연속으로 새 상품이 없는 횟수
 
+            # 재개 시: 완료한 페이지까지 파싱 없이 이동 (마지막 이동은 아래 루프에서)
+            for _ in range(start_page - 2):
+                if not self._go_next_page(tab_name):
+                    break
+
             while True:
-                self.logger.info(f"{tab_name} - Page {page} 크롤링 중...")
+                self._start_page(unit, page)
+                self.logger.info("%s - Page %d 크롤링 중...", tab_name, page)
 
                 # 페이지 이동 (2페이지부터)
-                if page > 1:
-                    try:
-                        # 다음 버튼 클릭 (> 버튼으로 페이지 이동)
-                        next_button = self.driver.find_element(By.CSS_SELECTOR, '.paging a.next')
-
-                        # 버튼이 비활성화 상태인지 확인
-                        if 'disabled' in next_button.get_attribute('class'):
-                            self.logger.info(f"{tab_name}: Next button disabled (마지막 페이지)")
-                            break
-
-                        next_button.click()
-                        time.sleep(2)
-                    except Exception as e:
-                        self.logger.info(f"{tab_name}: Failed to click next button (마지막 페이지): {e}")
-                        break
+                if page > 1 and not self._go_next_page(tab_name):
+                    self._checkpoint_done(unit)
+                    break
 
                 # 현재 페이지 상품 수집
                 html = self.driver.page_source
@@ -135,28 +140,29 @@ class GS25Crawler(BaseCrawler):
                 # 상품 리스트 파싱
                 product_items = soup.select('.prod_list li')
 
-                # 중복 제거 (이미 수집한 상품 제외)
-                existing_titles = {p['title'] for p in products}
-                new_count = 0
-
+                parsed = []
                 for item in product_items:
                     try:
                         product = self._parse_product(item, tab_name)
-                        if product and product['title'] not in existing_titles:
-                            products.append(product)
-                            existing_titles.add(product['title'])
-                            new_count += 1
+                        if product:
+                            parsed.append(product)
                     except Exception as e:
-                        self.logger.warning(f"Failed to parse product: {e}")
+                        self.logger.warning("Failed to parse product: %s", e)
                         continue
 
-                self.logger.info(f"{tab_name} - Page {page}: Found {new_count} new products (total: {len(products)})")
+                # 중복 제거 (이미 수집한 상품 제외)
+                page_products = self._new_products(products, parsed)
+                products.extend(page_products)
+                self._emit_page(unit, page, page_products)
+                new_count = len(page_products)
+                self.logger.info("%s - Page %d: Found %d new products (total: %d)", tab_name, page, new_count, len(products))
 
                 # 연속으로 새 상품이 없으면 종료
                 if new_count == 0:
                     consecutive_no_new += 1
                     if consecutive_no_new >= 2:  # 2페이지 연속 새 상품 없으면 종료
                         self.logger.info(f"{tab_name}: No new products for 2 consecutive pages, stopping")
+                        self._checkpoint_done(unit)
                         break
                 else:
                     consecutive_no_new = 0
@@ -166,6 +172,7 @@ class GS25Crawler(BaseCrawler):
                 # 안전장치: 최대 150페이지
                 if page > 150:
                     self.logger.warning(f"{tab_name}: Reached max page limit (150)")
+                    self._checkpoint_done(unit)
                     break
 
         except Exception as e:
@@ -173,6 +180,34 @@ class GS25Crawler(BaseCrawler):
 
         return products
 
+    def _go_next_page(self, tab_name: str) -> bool:
+        """
+        다음 페이지로 이동 (> 버튼 클릭)
+
+        Args:
+            tab_name: 탭 이름 (로그용)
+
+        Returns:
+            이동 성공 여부 (False면 마지막 페이지: 다음 버튼이 없거나 비활성화)
+
+        Raises:
+            클릭/대기 중 Selenium 예외 (마지막 페이지로 보지 않음 → 유닛 미완료로 남아 삭제 반영 안 함)
+        """
+        try:
+            next_button = self.driver.find_element(By.CSS_SELECTOR, '.paging a.next')
+        except NoSuchElementException:
+            self.logger.info(f"{tab_name}: Next button not found (마지막 페이지)")
+            return False
+
+        # 버튼이 비활성화 상태인지 확인
+        if 'disabled' in (next_button.get_attribute('class') or ''):
+            self.logger.info(f"{tab_name}: Next button disabled (마지막 페이지)")
+            return False
+
+        next_button.click()
+        time.sleep(2)
+        return True
+
     def _parse_product(self, item, tab_name: str) -> Dict[str, Any]:
         """
         개별 상품 파싱
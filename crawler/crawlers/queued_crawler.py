@@ -0,0 +1,233 @@
+"""
+작업 큐 기반 페이지 크롤러
+- (유닛, 페이지)와 상품별 상세 요청을 각각 WorkQueue 작업으로 처리 (CU, 세븐일레븐처럼 requests로 페이지를 받는 크롤러)
+- 페이지 N 목록을 받으면 N+1 작업 추가, 빈 페이지가 나오면 그 유닛의 끝
+- 실패한 페이지는 백오프 후 재시도 (요청 단위 재시도 없이 작업 큐 한 곳에서만), 한도를 넘기면 dead-letter에 기록하고 다음 페이지로 계속
+  (그 페이지가 빠진 유닛은 완료 처리하지 않음 → 삭제 반영 안 함, 체크포인트 유지)
+- --resume 시 체크포인트에서 빠진 페이지와 이전 dead-letter의 페이지를 다시 크롤링
+"""
+import os
+import threading
+from typing import Any, Dict, List, Optional, Set, Tuple
+from .base_crawler import BaseCrawler
+from utils.circuit_breaker import CircuitOpenError
+from utils.work_queue import DeadLetterLog, Task, WorkQueue
+import config
+
+# 연속으로 이 수만큼 페이지가 최종 실패하면 그 유닛은 더 진행하지 않음 (사이트 장애 중 max_pages까지 헛도는 것 방지)
+MAX_CONSECUTIVE_DEAD_PAGES = 2
+
+
+class _UnitProgress:
+    """유닛 하나의 페이지 진행 상태"""
+
+    def __init__(self, unit: str, label: str, pages: Dict[int, List[Dict[str, Any]]], done: bool):
+        self.unit = unit
+        self.label = label
+        self.pages = pages            # 완료한 페이지 → 상품 (체크포인트에서 재개한 페이지 포함)
+        self.done = done
+        self.end: Optional[int] = None  # 빈 목록이 나온 페이지 (이 페이지 앞까지가 유닛 전체)
+        self.dead: Set[int] = set()     # 최종 실패한 페이지
+
+    def products(self) -> List[Dict[str, Any]]:
+        return [p for page in sorted(self.pages) for p in self.pages[page]]
+
+
+class _PageAssembly:
+    """상세 요청이 모두 끝나기를 기다리는 페이지"""
+
+    def __init__(self, products: List[Dict[str, Any]], remaining: int):
+        self.products = products
+        self.remaining = remaining
+
+
+class QueuedPageCrawler(BaseCrawler):
+    """
+    페이지/상세 요청을 작업 큐로 처리하는 크롤러
+
+    하위 클래스 구현:
+        _fetch_list_page(unit, page): 목록 페이지 요청 + 파싱 → [(상품, 상세 ID 또는 None), ...] (목록이 없으면 None = 마지막)
+        _load_product_detail(product_id): 상세 요청 + 파싱 (실패 시 예외)
+        _apply_detail(product, detail): 상세 정보를 상품에 반영
+    """
+
+    MAX_PAGES = 50  # 유닛별 안전장치
+    # 재시도는 작업 큐 한 곳에서만 (TASK_MAX_ATTEMPTS, 백오프 후 재시도) → 요청 단위 재시도와 곱해지지 않도록
+    REQUEST_ATTEMPTS = 1
+
+    def _fetch_list_page(self, unit: str, page: int) -> Optional[List[Tuple[Dict[str, Any], Optional[str]]]]:
+        raise NotImplementedError
+
+    def _load_product_detail(self, product_id: str) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def _apply_detail(self, product: Dict[str, Any], detail: Dict[str, Any]):
+        raise NotImplementedError
+
+    def _crawl_units(self, units: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """
+        유닛(탭/조건)들을 작업 큐로 크롤링
+
+        Args:
+            units: [(유닛 키, 로그용 이름), ...] (결과는 이 순서, 유닛 안에서는 페이지 순서)
+
+        Returns:
+            상품 리스트
+        """
+        self._lock = threading.Lock()
+        self._listener_lock = threading.Lock()  # 리스너는 한 번에 한 페이지씩 (진행 상태 락과 분리)
+        self._units: Dict[str, _UnitProgress] = {}
+        self._assembling: Dict[Tuple[str, int], _PageAssembly] = {}
+        self.dead_letter = DeadLetterLog(os.path.join(config.DEAD_LETTER_DIR, f"{self.brand_name.lower()}.jsonl"))
+
+        # 이전 실행에서 최종 실패한 페이지 (상세 실패는 그 상품이 있던 페이지를 다시 크롤링)
+        retry_pages: Dict[str, Set[int]] = {}
+        if self.resumed:
+            for entry in self.dead_letter.load():
+                payload = entry.get('payload', {})
+                if 'unit' in payload and 'page' in payload:
+                    retry_pages.setdefault(payload['unit'], set()).add(payload['page'])
+            if retry_pages:
+                summary = {unit: sorted(pages) for unit, pages in retry_pages.items()}
+                self.logger.info(f"Retrying dead-lettered pages: {summary}")
+        # 이전 기록은 지우지 않고 .1로 보관 (--resume 없이 실행해도 남아 있음)
+        self.dead_letter.rotate()
+
+        self._queue = WorkQueue(
+            {'page': self._page_task, 'detail': self._detail_task},
+            on_dead=self._on_dead_task, dead_letter=self.dead_letter,
+            log_fields={'brand': self.brand_name},
+        )
+        for unit, label in units:
+            for page in self._seed_unit(unit, label, retry_pages.get(unit, set())):
+                self._submit_page(unit, page)
+
+        stats = self._queue.run()
+        self.logger.info(
+            f"Work queue: {stats['submitted']} tasks, {stats['retried']} retries, {stats['dead']} dead-lettered"
+            + (f" ({self.dead_letter.path})" if stats['dead'] else "")
+        )
+        return [p for unit, _ in units for p in self._units[unit].products()]
+
+    def _seed_unit(self, unit: str, label: str, retry: Set[int]) -> List[int]:
+        """
+        유닛 재개 상태 로드 후 처음 넣을 페이지 결정
+
+        Returns:
+            크롤링할 페이지 번호 (처음 실행이면 [1], 재개면 빠진 페이지 + 이어서 할 페이지 + 재시도 페이지)
+        """
+        self.units_started.add(unit)
+        pages, done = self.checkpoint.unit_pages(unit) if self.checkpoint else ({}, False)
+        progress = self._units[unit] = _UnitProgress(unit, label, pages, done)
+        if done:
+            self.units_done.add(unit)
+
+        seeds = set(retry)
+        if not done:
+            last = max(pages, default=0)
+            seeds.update(page for page in range(1, last + 2) if page not in pages)
+        seeds = sorted(page for page in seeds if page <= self.MAX_PAGES)
+
+        if pages:
+            self.logger.info(f"{unit}: resumed {len(pages)} pages (crawling: {seeds}, done: {done})")
+            # 다시 크롤링할 페이지는 새 결과로 전달
+            self._notify_listeners([p for page in sorted(pages) if page not in seeds for p in pages[page]])
+        if not done:
+            self.logger.info(f"Crawling {label} products...")
+        return seeds
+
+    def _submit_page(self, unit: str, page: int):
+        self._queue.submit('page', f"{unit}:page:{page}", {'unit': unit, 'page': page})
+
+    def _page_task(self, task: Task):
+        """목록 페이지 작업: 파싱 후 다음 페이지와 상세 요청 작업 추가"""
+        unit, page = task.payload['unit'], task.payload['page']
+        progress = self._units[unit]
+        self._start_page(unit, page)
+
+        items = self._fetch_list_page(unit, page)
+        if items is None:
+            self.logger.info("%s: No more products on page %d", progress.label, page)
+            with self._lock:
+                progress.end = page if progress.end is None else min(progress.end, page)
+            self._check_unit_done(progress)
+            return
+
+        if page >= self.MAX_PAGES:
+            with self._lock:
+                progress.end = self.MAX_PAGES + 1
+        elif page + 1 not in progress.pages:
+            self._submit_page(unit, page + 1)
+
+        details = [(index, product_id) for index, (_, product_id) in enumerate(items) if product_id]
+        with self._lock:
+            self._assembling[(unit, page)] = _PageAssembly([product for product, _ in items], len(details))
+        for index, product_id in details:
+            self._queue.submit('detail', f"{unit}:page:{page}:item:{index}",
+                               {'unit': unit, 'page': page, 'index': index, 'product_id': product_id})
+        if not details:
+            self._finish_page(unit, page)
+
+    def _detail_task(self, task: Task):
+        """상세 요청 작업 (같은 상품 ID는 실행당 한 번, 서킷 OPEN이면 상세 없이 진행)"""
+        payload = task.payload
+        self._start_page(payload['unit'], payload['page'])
+        try:
+            detail = self.detail_memo.get(payload['product_id'], self._load_product_detail)
+        except CircuitOpenError:
+            # 상세 서버 장애 중 → 목록 데이터만 저장하고 상세 정보는 생략
+            with self._lock:
+                self.detail_skipped += 1
+            detail = None
+        if detail:
+            assembly = self._assembling[(payload['unit'], payload['page'])]
+            self._apply_detail(assembly.products[payload['index']], detail)
+        self._detail_finished(payload['unit'], payload['page'])
+
+    def _on_dead_task(self, task: Task):
+        """최종 실패: 상세는 목록 데이터만으로 진행, 페이지는 건너뛰고 다음 페이지 시도"""
+        unit, page = task.payload['unit'], task.payload['page']
+        if task.kind == 'detail':
+            self._detail_finished(unit, page)
+            return
+
+        progress = self._units[unit]
+        with self._lock:
+            progress.dead.add(page)
+            give_up = all(p in progress.dead for p in range(page - MAX_CONSECUTIVE_DEAD_PAGES + 1, page + 1))
+            past_end = progress.end is not None and page + 1 >= progress.end
+        if give_up:
+            self.logger.error(f"{progress.label}: {MAX_CONSECUTIVE_DEAD_PAGES} consecutive pages failed, stopping at page {page}")
+        elif not past_end and page < self.MAX_PAGES and page + 1 not in progress.pages:
+            self._submit_page(unit, page + 1)
+
+    def _detail_finished(self, unit: str, page: int):
+        with self._lock:
+            assembly = self._assembling[(unit, page)]
+            assembly.remaining -= 1
+            ready = assembly.remaining == 0
+        if ready:
+            self._finish_page(unit, page)
+
+    def _finish_page(self, unit: str, page: int):
+        """페이지 완료: 후처리/체크포인트 기록 후 리스너 전달 (리스너는 한 번에 한 페이지씩)"""
+        progress = self._units[unit]
+        with self._lock:
+            products = self._assembling.pop((unit, page)).products
+            progress.pages[page] = products
+            self._record_page(unit, page, products)
+        # 리스너(백업 스트리밍, DB sink)는 느릴 수 있으므로 진행 상태 락 밖에서 호출 (다른 워커는 계속 진행)
+        with self._listener_lock:
+            self._notify_listeners(products)
+        self.logger.info("%s - Page %d: %d products", progress.label, page, len(products))
+        self._check_unit_done(progress)
+
+    def _check_unit_done(self, progress: _UnitProgress):
+        """끝 페이지 앞까지 모든 페이지가 완료됐으면 유닛 완료 기록"""
+        with self._lock:
+            if progress.done or progress.end is None:
+                return
+            if any(page not in progress.pages for page in range(1, progress.end)):
+                return
+            progress.done = True
+            self._checkpoint_done(progress.unit)
@@ -0,0 +1,73 @@
+"""
+크롤러 레지스트리
+- config.BRAND_MAPPING의 브랜드마다 CLI 키, 크롤러 클래스 위치, Selenium 사용 여부 등록
+- 크롤러 모듈은 실제로 실행할 때만 import (selenium은 gs25/emart24에서만 로드)
+- 새 브랜드는 크롤러 클래스 작성 후 register() 한 줄 추가로 업로드/데몬/CLI에 연결
+"""
+import importlib
+from typing import Dict, List, NamedTuple
+import config
+
+
+class BrandSpec(NamedTuple):
+    key: str            # CLI/백업 파일용 키 (예: "cu")
+    label: str          # 로그 표시명 = BRAND_MAPPING 키 (예: "세븐일레븐")
+    brand_name: str     # brand 테이블 name = BRAND_MAPPING 값 (예: "SevenEleven")
+    module: str         # 크롤러 모듈 (예: "crawlers.cu_crawler")
+    class_name: str     # 크롤러 클래스명
+    browser: bool       # Selenium 브라우저 사용 여부 (데몬 브라우저 풀 대상)
+
+
+# 등록 순서 = 전체 업로드 순서
+REGISTRY: Dict[str, BrandSpec] = {}
+
+
+def register(key: str, label: str, module: str, class_name: str, browser: bool = False) -> BrandSpec:
+    """
+    브랜드 크롤러 등록
+
+    Args:
+        key: CLI 키 (예: "cu")
+        label: config.BRAND_MAPPING 키 (예: "CU")
+        module: 크롤러 모듈 경로
+        class_name: 크롤러 클래스명
+        browser: Selenium 사용 여부
+
+    Returns:
+        등록된 BrandSpec
+    """
+    if label not in config.BRAND_MAPPING:
+        raise ValueError(f"Unknown brand label (not in BRAND_MAPPING): {label}")
+    spec = BrandSpec(key, label, config.BRAND_MAPPING[label], module, class_name, browser)
+    REGISTRY[key] = spec
+    return spec
+
+
+def get_spec(key: str) -> BrandSpec:
+    """CLI 키로 브랜드 조회"""
+    return REGISTRY[key.lower()]
+
+
+def brands() -> List[BrandSpec]:
+    """등록된 브랜드 (업로드 순서)"""
+    return list(REGISTRY.values())
+
+
+def load_crawler(key: str):
+    """
+    브랜드 크롤러 클래스 지연 로드
+
+    Args:
+        key: CLI 키 (예: "cu")
+
+    Returns:
+        크롤러 클래스
+    """
+    spec = get_spec(key)
+    return getattr(importlib.import_module(spec.module), spec.class_name)
+
+
+register('cu', 'CU', 'crawlers.cu_crawler', 'CUCrawler')
+register('seven', '세븐일레븐', 'crawlers.seveneleven_crawler', 'SevenElevenCrawler')
+register('gs25', 'GS25', 'crawlers.gs25_crawler', 'GS25Crawler', browser=True)
+register('emart24', '이마트24', 'crawlers.emart24_crawler', 'Emart24Crawler', browser=True)
@@ -2,24 +2,26 @@
 세븐일레븐 크롤러
 - URL: http://www.7-eleven.co.kr/product/presentList.asp
 - API: /product/listMoreAjax.asp
-- 방식: AJAX API 호출
+- 방식: AJAX API 호출 (탭별 페이지/상품 상세 요청을 작업 큐로 처리)
 - 난이도: 중
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
-from .base_crawler import BaseCrawler
+from .queued_crawler import QueuedPageCrawler
 import re
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
-class SevenElevenCrawler(BaseCrawler):
+class SevenElevenCrawler(QueuedPageCrawler):
     """세븐일레븐 행사상품 크롤러"""
 
     BASE_URL = "http://www.7-eleven.co.kr"
     API_URL = "http://www.7-eleven.co.kr/product/listMoreAjax.asp"
+    PAGE_SIZE = 20
+    MAX_PAGES = 30
 
-    def __init__(self):
-        super().__init__("SevenEleven")
+    def __init__(self, session=None):
+        super().__init__("SevenEleven", session=session)
 
     def crawl(self) -> List[Dict[str, Any]]:
         """
@@ -28,86 +30,56 @@ class SevenElevenCrawler(BaseCrawler):
         Returns:
             프로모션 데이터 리스트
         """
-        all_products = []
+        return self._crawl_units([
+            ('tab:1', '1+1'),     # 1+1 상품 (pTab=1)
+            ('tab:2', '2+1'),     # 2+1 상품 (pTab=2)
+            ('tab:4', '할인'),    # 할인행사 (pTab=4)
+        ])
 
-        # 1+1 상품 (pTab=1)
-        products_1_1 = self._crawl_by_tab('1', '1+1')
-        all_products.extend(products_1_1)
-
-        # 2+1 상품 (pTab=2)
-        products_2_1 = self._crawl_by_tab('2', '2+1')
-        all_products.extend(products_2_1)
-
-        # 할인행사 (pTab=4)
-        products_discount = self._crawl_by_tab('4', '할인')
-        all_products.extend(products_discount)
-
-        return all_products
-
-    def _crawl_by_tab(self, tab: str, tab_name: str) -> List[Dict[str, Any]]:
+    def _fetch_list_page(self, unit: str, page: int) -> Optional[List[Tuple[Dict[str, Any], Optional[str]]]]:
         """
-        탭별 상품 크롤링
+        탭별 목록 페이지 요청 + 파싱
 
         Args:
-            tab: pTab 값 ('1', '2', '4')
-            tab_name: 탭 이름 (로그용)
+            unit: 유닛 키 ("tab:1", "tab:2", "tab:4" = pTab 값)
+            page: 페이지 번호
 
         Returns:
-            상품 리스트
+            [(상품, 상세 ID), ...], 목록이 비어 있으면 None (마지막 페이지 다음)
         """
-        products = []
-        page = 1
-        page_size = 20
-        max_pages = 30
+        # AJAX API 호출
+        params = {
+            'intPageSize': self.PAGE_SIZE,
+            'intCurrPage': page,
+            'pTab': unit.split(':', 1)[1]
+        }
+        response = self._request(self.API_URL, params=params)
+        soup = BeautifulSoup(response.text, 'html.parser')
 
-        self.logger.info(f"Crawling {tab_name} products...")
+        # 상품 목록 추출
+        product_items = soup.select('li')
+        if not product_items:
+            return None
 
-        while page <= max_pages:
+        items = []
+        for item in product_items:
             try:
-                # AJAX API 호출
-                params = {
-                    'intPageSize': page_size,
-                    'intCurrPage': page,
-                    'pTab': tab
-                }
-
-                response = self._request(self.API_URL, params=params)
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 상품 목록 추출
-                product_items = soup.select('li')
-
-                if not product_items:
-                    self.logger.info(f"{tab_name}: No more products on page {page}")
-                    break
-
-                for item in product_items:
-                    try:
-                        product = self._parse_product(item)
-                        if product:
-                            products.append(product)
-                    except Exception as e:
-                        self.logger.warning(f"Failed to parse product: {e}")
-                        continue
-
-                self.logger.info(f"{tab_name} - Page {page}: Found {len(product_items)} products")
-                page += 1
-
+                product, product_id = self._parse_product(item)
+                if product:
+                    items.append((product, product_id))
             except Exception as e:
-                self.logger.error(f"Failed to crawl {tab_name} page {page}: {e}")
-                break
-
-        return products
+                self.logger.warning("Failed to parse product: %s", e)
+        return items
 
-    def _parse_product(self, item) -> Dict[str, Any]:
+    def _parse_product(self, item) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
         """
-        개별 상품 파싱
+        개별 상품 파싱 (상세 정보는 별도 작업에서 _apply_detail로 채움)
 
         Args:
             item: BeautifulSoup 상품 엘리먼트
 
         Returns:
-            상품 데이터 딕셔너리
+            (상품 데이터 딕셔너리, 상세 페이지 ID), 상품명이 없으면 (None, None)
         """
         # 상품명
         name_elem = item.select_one('.tit_product')
@@ -117,7 +89,7 @@ class SevenElevenCrawler(BaseCrawler):
 
         # title이 없으면 None 반환 (필터링)
         if not title:
-            return None
+            return None, None
 
         # 이미지
         img_elem = item.select_one('.pic_product img')
@@ -169,37 +141,6 @@ class SevenElevenCrawler(BaseCrawler):
             if match:
                 product_id = match.group(1)
 
-        # 상세 페이지에서 추가 정보 수집
-        description = None
-        weight = None
-        barcode = None
-
-        if product_id:
-            detail_info = self._fetch_product_detail(product_id)
-            # 설명과 중량을 합쳐서 description에 저장
-            desc_text = detail_info.get('description')
-            weight_text = detail_info.get('weight')
-
-            # 중량 정보를 description에 포함
-            if weight_text:
-                description = f"중량: {weight_text}g"
-                if desc_text and desc_text != title:  # 설명이 제목과 다르면 추가
-                    description += f" | {desc_text}"
-            elif desc_text:
-                description = desc_text
-
-            barcode = detail_info.get('barcode')
-
-            # 상세 페이지에서 가격 정보 가져오기 (할인 상품의 경우 정상가가 있음)
-            detail_normal_price = detail_info.get('normal_price')
-            detail_sale_price = detail_info.get('sale_price')
-
-            # 상세 페이지에 가격 정보가 있으면 우선 사용
-            if detail_normal_price:
-                normal_price = detail_normal_price
-            if detail_sale_price:
-                sale_price = detail_sale_price
-
         # 상품 링크 생성 (POST 방식이지만 URL은 표시용)
         source_url = f"{self.BASE_URL}/product/presentView.asp?pCd={product_id}" if product_id else None
 
@@ -219,81 +160,100 @@ class SevenElevenCrawler(BaseCrawler):
             'category': None,  # 세븐일레븐은 카테고리 정보 없음
             'start_date': start_date,
             'end_date': last_day,
-            'barcode': barcode,
-            'description': description,  # 중량 + 설명 포함
-        }
+            'barcode': None,
+            'description': None,  # 상세 페이지의 중량 + 설명
+        }, product_id
 
-    def _fetch_product_detail(self, product_id: str) -> Dict[str, Any]:
+    def _apply_detail(self, product: Dict[str, Any], detail: Dict[str, Any]):
+        """상세 페이지 정보 반영 (중량 + 설명, 바코드, 상세 페이지 가격 우선)"""
+        # 설명과 중량을 합쳐서 description에 저장
+        desc_text = detail.get('description')
+        weight_text = detail.get('weight')
+
+        # 중량 정보를 description에 포함
+        description = None
+        if weight_text:
+            description = f"중량: {weight_text}g"
+            if desc_text and desc_text != product['title']:  # 설명이 제목과 다르면 추가
+                description += f" | {desc_text}"
+        elif desc_text:
+            description = desc_text
+        product['description'] = description
+
+        product['barcode'] = detail.get('barcode')
+
+        # 상세 페이지에 가격 정보가 있으면 우선 사용 (할인 상품의 경우 정상가가 있음)
+        if detail.get('normal_price'):
+            product['normal_price'] = detail['normal_price']
+        if detail.get('sale_price'):
+            product['sale_price'] = detail['sale_price']
+
+    def _load_product_detail(self, product_id: str) -> Dict[str, Any]:
         """
-        상품 상세 페이지에서 추가 정보 수집 (POST 방식)
+        상품 상세 페이지에서 추가 정보 수집 (POST 방식, 실패 시 예외 → 작업 큐에서 재시도)
 
         Args:
-            product_id: 상품 ID
+            product_id: 상품 ID (pCd)
 
         Returns:
             중량, 바코드, 설명, 정상가, 할인가 등 추가 정보
         """
-        try:
-            detail_url = f"{self.BASE_URL}/product/presentView.asp"
-            # POST 방식으로 요청
-            response = self._request(detail_url, method='POST', data={'pCd': product_id})
-            soup = BeautifulSoup(response.text, 'html.parser')
-
-            # 상품 설명
-            description = None
-            desc_elem = soup.select_one('.txt')
-            if desc_elem:
-                description = desc_elem.text.strip()
-
-            # 중량 정보
-            weight = None
-            weight_elem = soup.select_one('.productView_content_ul li strong')
-            if weight_elem and '중량' in weight_elem.text:
-                weight_value = weight_elem.find_next('span')
-                if weight_value:
-                    weight = weight_value.text.strip()
-
-            # 바코드 (이미지 경로에서 추출)
-            barcode = None
-            img_elem = soup.select_one('.product_img img')
-            if img_elem:
-                img_src = img_elem.get('src', '')
-                # /upload/product/8801104/212601.1.jpg 형태에서 바코드 추출
-                match = re.search(r'/upload/product/(\d+)/', img_src)
-                if match:
-                    barcode = match.group(1)
-
-            # 가격 정보 (상세 페이지에서 추출)
-            # HTML 구조: <span class="product_price"><del>정상가</del><strong>할인가</strong></span>
-            normal_price = None
-            sale_price = None
-
-            price_container = soup.select_one('.product_price')
-            if price_container:
-                # 정상가 (del 태그)
-                del_elem = price_container.select_one('del')
-                if del_elem:
-                    normal_price = self._parse_price(del_elem.text)
-
-                # 할인가 (strong 태그)
-                strong_elem = price_container.select_one('strong')
-                if strong_elem:
-                    # hide 클래스 제거
-                    for hide in strong_elem.select('.hide'):
-                        hide.decompose()
-                    sale_price = self._parse_price(strong_elem.get_text(strip=True))
-
-            return {
-                'description': description,
-                'weight': weight,
-                'barcode': barcode,
-                'normal_price': normal_price,
-                'sale_price': sale_price,
-            }
-
-        except Exception as e:
-            self.logger.warning(f"Failed to fetch detail for product {product_id}: {e}")
-            return {'description': None, 'weight': None, 'barcode': None, 'normal_price': None, 'sale_price': None}
+        detail_url = f"{self.BASE_URL}/product/presentView.asp"
+        # POST 방식으로 요청
+        response = self._request(detail_url, method='POST', endpoint='detail', data={'pCd': product_id})
+        soup = BeautifulSoup(response.text, 'html.parser')
+
+        # 상품 설명
+        description = None
+        desc_elem = soup.select_one('.txt')
+        if desc_elem:
+            description = desc_elem.text.strip()
+
+        # 중량 정보
+        weight = None
+        weight_elem = soup.select_one('.productView_content_ul li strong')
+        if weight_elem and '중량' in weight_elem.text:
+            weight_value = weight_elem.find_next('span')
+            if weight_value:
+                weight = weight_value.text.strip()
+
+        # 바코드 (이미지 경로에서 추출)
+        barcode = None
+        img_elem = soup.select_one('.product_img img')
+        if img_elem:
+            img_src = img_elem.get('src', '')
+            # /upload/product/8801104/212601.1.jpg 형태에서 바코드 추출
+            match = re.search(r'/upload/product/(\d+)/', img_src)
+            if match:
+                barcode = match.group(1)
+
+        # 가격 정보 (상세 페이지에서 추출)
+        # HTML 구조: <span class="product_price"><del>정상가</del><strong>할인가</strong></span>
+        normal_price = None
+        sale_price = None
+
+        price_container = soup.select_one('.product_price')
+        if price_container:
+            # 정상가 (del 태그)
+            del_elem = price_container.select_one('del')
+            if del_elem:
+                normal_price = self._parse_price(del_elem.text)
+
+            # 할인가 (strong 태그)
+            strong_elem = price_container.select_one('strong')
+            if strong_elem:
+                # hide 클래스 제거
+                for hide in strong_elem.select('.hide'):
+                    hide.decompose()
+                sale_price = self._parse_price(strong_elem.get_text(strip=True))
+
+        return {
+            'description': description,
+            'weight': weight,
+            'barcode': barcode,
+            'normal_price': normal_price,
+            'sale_price': sale_price,
+        }
 
     def _parse_deal_type(self, tag_text: str) -> str:
         """
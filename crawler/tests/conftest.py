@@ -0,0 +1,78 @@
+"""
+크롤러 테스트 공용 설정
+- crawler/ 디렉토리를 import 경로에 추가 (config, utils 등을 스크립트와 같은 방식으로 import)
+- pg_dsn: PG_TEST_DSN이 가리키는 Postgres에 일회용 스키마를 만들고 supabase/migrations 적용 (없으면 skip)
+"""
+import glob
+import os
+import sys
+import uuid
+import pytest
+
+CRAWLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MIGRATIONS_DIR = os.path.join(os.path.dirname(CRAWLER_DIR), 'supabase', 'migrations')
+
+sys.path.insert(0, CRAWLER_DIR)
+
+# prisma/schema.prisma의 brand/promo (+ 크롤러가 저장하는 description) - 마이그레이션은 이 위에 적용
+BASE_SCHEMA_SQL = """
+CREATE TYPE deal_type AS ENUM ('ONE_PLUS_ONE', 'TWO_PLUS_ONE', 'DISCOUNT');
+
+CREATE TABLE brand (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  name text NOT NULL UNIQUE,
+  url text,
+  created_at timestamptz NOT NULL DEFAULT now()
+);
+
+CREATE TABLE promo (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  brand_id uuid NOT NULL REFERENCES brand(id) ON DELETE CASCADE,
+  title text NOT NULL,
+  raw_title text NOT NULL,
+  barcode text,
+  category text,
+  deal_type deal_type NOT NULL,
+  normal_price integer,
+  sale_price integer,
+  start_date date NOT NULL,
+  end_date date NOT NULL,
+  image_url text,
+  source_url text,
+  description text,
+  created_at timestamptz NOT NULL DEFAULT now(),
+  updated_at timestamptz NOT NULL DEFAULT now()
+);
+"""
+
+# promo 테이블만 필요한 마이그레이션 (promo_summary 등은 RLS 정책이 Supabase 역할을 전제로 함)
+MIGRATIONS = ['*_add_promo_content_hash.sql', '*_merge_promotions_function.sql']
+
+
+@pytest.fixture
+def pg_dsn():
+    """
+    일회용 스키마를 search_path로 지정한 연결 문자열 (테스트가 끝나면 스키마 삭제)
+    """
+    dsn = os.getenv('PG_TEST_DSN')
+    if not dsn:
+        pytest.skip('PG_TEST_DSN is not set')
+    psycopg = pytest.importorskip('psycopg')
+    from psycopg.conninfo import make_conninfo
+
+    schema = f"crawler_test_{uuid.uuid4().hex[:12]}"
+    with psycopg.connect(dsn, autocommit=True) as conn:
+        conn.execute(f"CREATE SCHEMA {schema}")
+    test_dsn = make_conninfo(dsn, options=f"-csearch_path={schema}")
+
+    try:
+        with psycopg.connect(test_dsn) as conn:
+            conn.execute(BASE_SCHEMA_SQL)
+            for pattern in MIGRATIONS:
+                for path in sorted(glob.glob(os.path.join(MIGRATIONS_DIR, pattern))):
+                    with open(path, encoding='utf-8') as f:
+                        conn.execute(f.read())
+        yield test_dsn
+    finally:
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            conn.execute(f"DROP SCHEMA {schema} CASCADE")
@@ -0,0 +1,88 @@
+"""
+Selenium 크롤러 테스트용 가짜 WebDriver
+- GS25(.prod_list li, .paging a.next)와 이마트24(.itemWrap, .pIndex span) 페이지 구조만 흉내
+- 마지막 페이지를 넘겨 이동하면 사이트처럼 마지막 페이지 내용을 다시 보여줌
+"""
+from typing import Dict, List, Optional
+from selenium.common.exceptions import NoSuchElementException
+
+
+class FakeElement:
+    def __init__(self, text: str = '', classes: str = '', on_click=None):
+        self.text = text
+        self.classes = classes
+        self.on_click = on_click
+
+    def is_displayed(self):
+        return True
+
+    def is_enabled(self):
+        return True
+
+    def get_attribute(self, name):
+        return self.classes if name == 'class' else None
+
+    def click(self):
+        if self.on_click is not None:
+            self.on_click()
+
+
+class FakeDriver:
+    """
+    Args:
+        site: 'gs25' 또는 'emart24'
+        pages: 페이지별 상품명
+        last_page: 이 페이지에서 다음 버튼 비활성화 / 페이지 버튼 없음 (None이면 계속 이동 가능)
+        click_errors: {이동할 페이지 번호: 클릭 시 던질 예외}
+        hide_next: True면 마지막 페이지에서 다음 버튼을 비활성화하지 않고 아예 없앰 (GS25)
+    """
+
+    def __init__(self, site: str, pages: List[List[str]], last_page: Optional[int] = None,
+                 click_errors: Dict[int, Exception] = None, hide_next: bool = False):
+        self.site = site
+        self.pages = pages
+        self.last_page = last_page
+        self.click_errors = click_errors or {}
+        self.hide_next = hide_next
+        self.page = 1
+        self.visited: List[int] = []
+
+    def get(self, url):
+        self.page = 1
+
+    def _go(self, page: int):
+        if page in self.click_errors:
+            raise self.click_errors[page]
+        self.page = page
+        self.visited.append(page)
+
+    @property
+    def page_source(self) -> str:
+        titles = self.pages[min(self.page, len(self.pages)) - 1]
+        if self.site == 'gs25':
+            items = ''.join(
+                f'<li><p class="tit">{t}</p><div class="price"><span class="cost">1,000원</span></div></li>'
+                for t in titles
+            )
+            return f'<html><ul class="prod_list">{items}</ul></html>'
+        items = ''.join(
+            f'<div class="itemWrap"><div class="itemtitle"><p><a>{t}</a></p></div>'
+            f'<div class="price">1,000원</div></div>'
+            for t in titles
+        )
+        return f'<html>{items}</html>'
+
+    def find_element(self, by, selector):
+        if selector == '.paging a.next':
+            disabled = self.last_page is not None and self.page >= self.last_page
+            if disabled and self.hide_next:
+                raise NoSuchElementException(selector)
+            return FakeElement(classes='next disabled' if disabled else 'next',
+                               on_click=lambda: self._go(self.page + 1))
+        return FakeElement()
+
+    def find_elements(self, by, selector):
+        if selector == '.pIndex span':
+            last = self.last_page or 200
+            return [FakeElement(text=str(n), on_click=lambda n=n: self._go(n)) for n in range(1, last + 1)]
+        return [FakeElement()]
@@ -0,0 +1,153 @@
+"""
+테스트용 가짜 Supabase(PostgREST) 클라이언트
+- 테이블별 row를 메모리에 두고 select/upsert/update/delete 쿼리 빌더를 흉내 (eq/gt/in_/order/limit)
+- SupabaseClient, StreamingSink, promo_summary를 실제 코드 그대로 실행해서 DB에 남은 row로 확인
+- requests: (테이블, 동작) 요청 기록 (청크 단위 요청 수 확인용)
+"""
+import threading
+import uuid
+from typing import Any, Dict, List
+from utils.supabase_client import SupabaseClient
+
+
+class FakeResponse:
+    def __init__(self, data: List[Dict[str, Any]], count: int = None):
+        self.data = data
+        self.count = count
+
+
+class FakeQuery:
+    """한 번의 요청을 만드는 쿼리 빌더"""
+
+    def __init__(self, db: 'FakePostgrest', table: str):
+        self.db = db
+        self.table = table
+        self.action = 'select'
+        self.payload = None
+        self.options: Dict[str, Any] = {}
+        self.filters = []
+        self.count = None
+        self.order_by = None
+        self.limit_rows = None
+
+    def select(self, columns: str = '*', count: str = None, head: bool = False):
+        self.columns = None if columns == '*' else columns.split(',')
+        self.count = count
+        self.head = head
+        return self
+
+    def upsert(self, rows, on_conflict: str = 'id', ignore_duplicates: bool = False, returning: str = None):
+        self.action = 'upsert'
+        self.payload = rows
+        self.options = {'on_conflict': on_conflict.split(','), 'ignore_duplicates': ignore_duplicates}
+        return self
+
+    def update(self, row: Dict[str, Any]):
+        self.action = 'update'
+        self.payload = row
+        return self
+
+    def delete(self):
+        self.action = 'delete'
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row.get(column) == value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row.get(column) is not None and row[column] > value)
+        return self
+
+    def in_(self, column, values):
+        values = list(values)
+        self.filters.append(lambda row: row.get(column) in values)
+        return self
+
+    def order(self, column, desc: bool = False):
+        self.order_by = (column, desc)
+        return self
+
+    def limit(self, rows: int):
+        self.limit_rows = rows
+        return self
+
+    def _matches(self) -> List[Dict[str, Any]]:
+        return [row for row in self.db.tables.setdefault(self.table, []) if all(f(row) for f in self.filters)]
+
+    def execute(self) -> FakeResponse:
+        with self.db.lock:
+            self.db.requests.append((self.table, self.action))
+            return getattr(self, f"_{self.action}")()
+
+    def _select(self) -> FakeResponse:
+        rows = self._matches()
+        total = len(rows)
+        if self.order_by:
+            column, desc = self.order_by
+            rows = sorted(rows, key=lambda row: row.get(column) or '', reverse=desc)
+        if self.limit_rows is not None:
+            rows = rows[:self.limit_rows]
+        if self.head:
+            rows = []
+        data = [dict(row) if self.columns is None else {c: row.get(c) for c in self.columns} for row in rows]
+        return FakeResponse(data, total if self.count else None)
+
+    def _upsert(self) -> FakeResponse:
+        table = self.db.tables.setdefault(self.table, [])
+        keys = self.options['on_conflict']
+        written = []
+        for new in self.payload:
+            new = dict(new)
+            current = next((row for row in table if all(row.get(k) == new.get(k) for k in keys)), None)
+            if current is None:
+                new.setdefault('id', str(uuid.uuid4()))
+                table.append(new)
+                written.append(dict(new))
+            elif not self.options['ignore_duplicates']:
+                current.update(new)
+                written.append(dict(current))
+        return FakeResponse(written)
+
+    def _update(self) -> FakeResponse:
+        rows = self._matches()
+        for row in rows:
+            row.update(self.payload)
+        return FakeResponse([dict(row) for row in rows])
+
+    def _delete(self) -> FakeResponse:
+        rows = self._matches()
+        self.db.tables[self.table] = [row for row in self.db.tables[self.table] if row not in rows]
+        return FakeResponse([dict(row) for row in rows])
+
+
+class FakePostgrest:
+    """supabase Client 대신 쓰는 메모리 DB (client.table(name)만 지원)"""
+
+    def __init__(self, tables: Dict[str, List[Dict[str, Any]]] = None):
+        self.tables = {name: [dict(row) for row in rows] for name, rows in (tables or {}).items()}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def table(self, name: str) -> FakeQuery:
+        return FakeQuery(self, name)
+
+    def rows(self, table: str = 'promo') -> List[Dict[str, Any]]:
+        return self.tables.get(table, [])
+
+
+def make_client(brands: Dict[str, str], tables: Dict[str, List[Dict[str, Any]]] = None) -> SupabaseClient:
+    """
+    가짜 DB에 연결된 SupabaseClient (__init__은 supabase 패키지와 환경변수가 필요하므로 건너뜀)
+
+    Args:
+        brands: 브랜드명 → 브랜드 ID
+        tables: 테이블명 → 초기 row
+    """
+    tables = dict(tables or {})
+    tables['brand'] = [{'id': brand_id, 'name': name} for name, brand_id in brands.items()]
+    client = SupabaseClient.__new__(SupabaseClient)
+    client.client = FakePostgrest(tables)
+    client._brand_ids = None
+    client._brand_lock = threading.Lock()
+    return client
@@ -0,0 +1,50 @@
+"""
+BackupWriter 테스트
+- 페이지 단위로 쓴 상품을 그대로 다시 읽기 (gzip)
+- 쓰는 중에는 .partial로만 존재 (최신 백업 목록에 나오지 않음)
+- 오래된 백업 정리 시 DB 동기화 기준 백업은 유지
+"""
+import os
+import pytest
+import config
+from utils.backup import BackupWriter, latest_backup, list_backups, read_backup
+from utils.snapshot_diff import mark_synced
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'BACKUP_COMPRESSION', 'gzip')
+    return tmp_path
+
+
+def fake_backup(data_dir, stamp):
+    path = data_dir / f"cu_products_{stamp}.ndjson.gz"
+    path.write_bytes(b'')
+    return str(path)
+
+
+def test_round_trip():
+    backup = BackupWriter('cu')
+    backup.write([{'title': '콜라', 'sale_price': 1000}])
+    backup.write([])
+    backup.write([{'title': '우유', 'sale_price': 1500}])
+
+    assert list_backups('cu') == []
+    report = backup.close()
+
+    assert report['rows'] == 2
+    assert list(read_backup(report['path'])) == [{'title': '콜라', 'sale_price': 1000}, {'title': '우유', 'sale_price': 1500}]
+    assert latest_backup('cu') == report['path']
+    assert not os.path.exists(report['path'] + '.partial')
+
+
+def test_rotation_keeps_synced_backup(data_dir, monkeypatch):
+    monkeypatch.setattr(config, 'BACKUP_KEEP', 2)
+    synced = fake_backup(data_dir, '20260901_020000')
+    old = [fake_backup(data_dir, f"202609{day:02d}_020000") for day in (8, 15)]
+    mark_synced('cu', synced, '2026-09-01', 0)
+
+    current = BackupWriter('cu').close()['path']
+
+    assert list_backups('cu') == [synced, old[1], current]
@@ -0,0 +1,102 @@
+"""
+BaseCrawler 완료 판단 / 체크포인트 재개 테스트
+- is_complete: 예외 없이 끝났고 시작한 유닛이 모두 완료돼야 True (삭제 반영 조건)
+- --resume: 완료한 페이지는 다시 요청하지 않고 체크포인트의 상품으로 이어서 진행
+"""
+import pytest
+import config
+from crawlers.base_crawler import BaseCrawler
+
+PAGES = {
+    'tab:1': {1: ['콜라', '사이다'], 2: ['우유']},
+    'tab:2': {1: ['빵']},
+}
+
+
+class FakeCrawler(BaseCrawler):
+    """유닛별 페이지 목록을 순서대로 크롤링 (빈 페이지가 유닛의 끝)"""
+
+    def __init__(self, pages=PAGES, fail_at=None, stop_early=None):
+        super().__init__("Fake")
+        self.pages = pages
+        self.fail_at = fail_at          # 이 (유닛, 페이지)에서 예외
+        self.stop_early = stop_early    # 이 유닛은 끝 페이지를 확인하지 않고 반환
+        self.requested = []
+
+    def crawl(self):
+        collected = []
+        for unit, pages in self.pages.items():
+            page, products, done = self._resume_unit(unit)
+            collected.extend(products)
+            while not done:
+                if (unit, page) == self.fail_at:
+                    raise ConnectionError(f"{unit} page {page} failed")
+                self.requested.append((unit, page))
+                titles = pages.get(page)
+                if not titles:
+                    self._checkpoint_done(unit)
+                    break
+                items = [{'title': t, 'start_date': '2026-10-01'} for t in titles]
+                self._emit_page(unit, page, items)
+                collected.extend(items)
+                if unit == self.stop_early:
+                    break
+                page += 1
+        return collected
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'CHECKPOINT_DIR', str(tmp_path))
+
+
+def titles(products):
+    return [p['title'] for p in products]
+
+
+def test_complete_run():
+    crawler = FakeCrawler()
+    assert titles(crawler.run()) == ['콜라', '사이다', '우유', '빵']
+    assert crawler.is_complete()
+
+
+def test_exception_is_incomplete():
+    crawler = FakeCrawler(fail_at=('tab:2', 1))
+    assert crawler.run() == []
+    assert not crawler.is_complete()
+
+
+def test_unfinished_unit_is_incomplete():
+    crawler = FakeCrawler(stop_early='tab:1')
+    crawler.run()
+    assert not crawler.is_complete()
+
+
+def test_no_units_is_incomplete():
+    crawler = FakeCrawler(pages={})
+    crawler.run()
+    assert not crawler.is_complete()
+
+
+def test_resume_skips_finished_pages():
+    FakeCrawler(fail_at=('tab:1', 2)).run()
+
+    crawler = FakeCrawler()
+    received = []
+    crawler.add_page_listener(received.extend)
+    products = crawler.run(resume=True)
+
+    assert titles(products) == ['콜라', '사이다', '우유', '빵']
+    assert crawler.requested == [('tab:1', 2), ('tab:1', 3), ('tab:2', 1), ('tab:2', 2)]
+    # 체크포인트에서 재개한 상품도 리스너(백업)에 전달
+    assert sorted(titles(received)) == sorted(titles(products))
+    assert crawler.is_complete()
+
+
+def test_run_without_resume_starts_over():
+    FakeCrawler(fail_at=('tab:1', 2)).run()
+
+    crawler = FakeCrawler()
+    crawler.run()
+
+    assert crawler.requested[0] == ('tab:1', 1)
@@ -0,0 +1,94 @@
+"""
+BatchWriter 테스트
+- rows는 서버가 실제로 INSERT한 row 수 (이미 있던 id는 제외), submitted는 전송한 row 수
+- 실패한 배치는 같은 id로 재전송 (중복 없음)
+"""
+import threading
+import pytest
+import config
+from utils.batch_writer import BatchWriter
+
+
+class FakeUpsert:
+    def __init__(self, table, rows, kwargs):
+        self.table = table
+        self.rows = rows
+        self.kwargs = kwargs
+
+    def execute(self):
+        return self.table.upsert(self.rows, self.kwargs)
+
+
+class FakeTable:
+    """ON CONFLICT (id) DO NOTHING처럼 동작, fail_once에 있는 배치 번호는 저장 후 예외 (응답 유실)"""
+
+    def __init__(self, fail_once=()):
+        self.stored = {}
+        self.fail_once = set(fail_once)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def upsert(self, rows, kwargs):
+        assert kwargs == {'on_conflict': 'id', 'ignore_duplicates': True, 'returning': 'representation'}
+        with self._lock:
+            call = self.calls
+            self.calls += 1
+            inserted = [row for row in rows if row['id'] not in self.stored]
+            self.stored.update((row['id'], row) for row in inserted)
+        if call in self.fail_once:
+            raise ConnectionError('response lost')
+        return type('Response', (), {'data': inserted})()
+
+
+class FakeClient:
+    def __init__(self, table):
+        self.promo = table
+
+    def table(self, name):
+        return self
+
+    def upsert(self, rows, **kwargs):
+        return FakeUpsert(self.promo, rows, kwargs)
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr('utils.batch_writer.time.sleep', lambda seconds: None)
+    monkeypatch.setattr(config, 'MAX_RETRIES', 3)
+
+
+def make_rows(count):
+    return [{'title': f"상품 {i}"} for i in range(count)]
+
+
+def test_insert_counts_server_rows():
+    table = FakeTable()
+    stats = BatchWriter(FakeClient(table), max_workers=2, initial_batch=10, min_batch=10, max_batch=10) \
+        .insert(make_rows(35))
+
+    assert stats['rows'] == stats['submitted'] == 35
+    assert stats['batches'] == 4
+    assert len(table.stored) == 35
+
+
+def test_existing_ids_are_not_counted():
+    table = FakeTable()
+    rows = make_rows(10)
+    rows[0]['id'] = 'existing'
+    table.stored['existing'] = {'id': 'existing'}
+
+    stats = BatchWriter(FakeClient(table), max_workers=1, initial_batch=5, min_batch=5, max_batch=5).insert(rows)
+
+    assert stats['submitted'] == 10
+    assert stats['rows'] == 9
+    assert len(table.stored) == 10
+
+
+def test_failed_batch_is_resent_with_same_ids():
+    table = FakeTable(fail_once={0})
+    stats = BatchWriter(FakeClient(table), max_workers=1, initial_batch=5, min_batch=5, max_batch=5) \
+        .insert(make_rows(10))
+
+    assert stats['retries'] == 1
+    assert stats['submitted'] == 10
+    assert len(table.stored) == 10
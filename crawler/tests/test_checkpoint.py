@@ -0,0 +1,70 @@
+"""
+CrawlCheckpoint 저널 테스트
+- 페이지/유닛 완료 기록 후 --resume으로 다시 읽기
+- 다른 달의 저널, 기록 도중 잘린 마지막 줄 처리
+"""
+import json
+import pytest
+import config
+from utils.checkpoint import CrawlCheckpoint
+
+
+@pytest.fixture(autouse=True)
+def checkpoint_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'CHECKPOINT_DIR', str(tmp_path))
+
+
+def products(*titles):
+    return [{'title': t} for t in titles]
+
+
+def test_resume_reads_pages_and_done_units():
+    checkpoint = CrawlCheckpoint('CU')
+    checkpoint.save_page('tab:1', 1, products('콜라'))
+    checkpoint.save_page('tab:1', 2, products('우유'))
+    checkpoint.complete_unit('tab:1')
+    checkpoint.save_page('tab:2', 1, products('빵'))
+
+    resumed = CrawlCheckpoint('CU', resume=True)
+
+    assert resumed.resume_unit('tab:1') == (3, products('콜라', '우유'), True)
+    assert resumed.resume_unit('tab:2') == (2, products('빵'), False)
+    assert resumed.resume_unit('tab:3') == (1, [], False)
+    assert resumed.unit_pages('tab:2') == ({1: products('빵')}, False)
+
+
+def test_without_resume_starts_new_journal():
+    CrawlCheckpoint('CU').save_page('tab:1', 1, products('콜라'))
+
+    CrawlCheckpoint('CU')
+
+    assert CrawlCheckpoint('CU', resume=True).resume_unit('tab:1') == (1, [], False)
+
+
+def test_torn_last_line_is_ignored():
+    checkpoint = CrawlCheckpoint('CU')
+    checkpoint.save_page('tab:1', 1, products('콜라'))
+    with open(checkpoint.path, 'a', encoding='utf-8') as f:
+        f.write('{"unit": "tab:1", "page": 2, "prod')
+
+    assert CrawlCheckpoint('CU', resume=True).resume_unit('tab:1') == (2, products('콜라'), False)
+
+
+def test_checkpoint_from_another_month_is_not_resumed():
+    checkpoint = CrawlCheckpoint('CU')
+    checkpoint.save_page('tab:1', 1, products('콜라'))
+    with open(checkpoint.path, 'r', encoding='utf-8') as f:
+        lines = f.readlines()
+    lines[0] = json.dumps({'brand': 'CU', 'run_month': '2000-01'}) + '\n'
+    with open(checkpoint.path, 'w', encoding='utf-8') as f:
+        f.writelines(lines)
+
+    assert CrawlCheckpoint('CU', resume=True).resume_unit('tab:1') == (1, [], False)
+
+
+def test_clear_removes_journal():
+    checkpoint = CrawlCheckpoint('CU')
+    checkpoint.save_page('tab:1', 1, products('콜라'))
+    checkpoint.clear()
+
+    assert CrawlCheckpoint('CU', resume=True).resume_unit('tab:1') == (1, [], False)
@@ -0,0 +1,76 @@
+"""
+서킷 브레이커 테스트
+- HALF_OPEN probe가 requests 외 예외로 끝나도 다음 요청이 다시 probe 할 수 있는지
+"""
+import pytest
+import requests
+import config
+from crawlers.base_crawler import BaseCrawler
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError, HALF_OPEN, OPEN
+
+
+class FakeSession:
+    """get 호출마다 errors의 예외를 순서대로 던지고, 없으면 200 응답"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+
+    def get(self, url, **kwargs):
+        if self.errors:
+            raise self.errors.pop(0)
+        response = requests.Response()
+        response.status_code = 200
+        return response
+
+
+class FakeCrawler(BaseCrawler):
+    def crawl(self):
+        return []
+
+
+def open_breaker(breaker):
+    for _ in range(breaker.failure_threshold):
+        breaker.allow_request()
+        breaker.record_failure()
+    assert breaker.state == OPEN
+    breaker.opened_at -= breaker.recovery_timeout  # 복구 대기 시간 경과
+
+
+def test_release_probe_allows_next_probe():
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    open_breaker(breaker)
+
+    assert breaker.allow_request()
+    assert breaker.state == HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.release_probe()
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow_request()
+
+
+@pytest.mark.parametrize('error', [ValueError('bad header'), KeyboardInterrupt()])
+def test_request_releases_probe_on_unexpected_error(monkeypatch, error):
+    monkeypatch.setattr(config, 'CRAWL_DELAY', 0)
+    url = 'https://example.com/list'
+    crawler = FakeCrawler("Fake", session=FakeSession([error]))
+    breaker = crawler.circuits.get(url, 'list')
+    open_breaker(breaker)
+
+    with pytest.raises(type(error)):
+        crawler._request(url)
+
+    # probe가 풀려 있으므로 다음 요청이 probe로 나가고 성공하면 CLOSED
+    crawler._request(url)
+    assert breaker.state == 'closed'
+
+
+def test_open_circuit_still_fails_fast():
+    url = 'https://example.com/list'
+    crawler = FakeCrawler("Fake", session=FakeSession([]))
+    breaker = crawler.circuits.get(url, 'list')
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+
+    with pytest.raises(CircuitOpenError):
+        crawler._request(url)
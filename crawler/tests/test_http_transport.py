@@ -0,0 +1,67 @@
+"""
+HTTP2Adapter 테스트
+- verify/cert/proxies/stream이 기본값이 아닌 요청은 HTTP/1.1 어댑터로 보내는지 (httpx에서 조용히 무시되지 않도록)
+"""
+import pytest
+import requests
+from requests.adapters import BaseAdapter
+
+httpx = pytest.importorskip('httpx')
+from utils.http_transport import HTTP2Adapter  # noqa: E402
+
+URL = 'https://example.com/list'
+
+
+class RecordingAdapter(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(kwargs)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'http1'
+        response.request = request
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def adapters():
+    fallback = RecordingAdapter()
+    adapter = HTTP2Adapter(pool_maxsize=2, fallback=fallback)
+    adapter.client = httpx.Client(transport=httpx.MockTransport(lambda request: httpx.Response(200, content=b'http2')))
+    yield adapter, fallback
+    adapter.close()
+
+
+def send(adapter, **kwargs):
+    request = requests.Request('GET', URL).prepare()
+    return adapter.send(request, timeout=5, **kwargs)
+
+
+def test_default_request_uses_httpx(adapters):
+    adapter, fallback = adapters
+    assert send(adapter).content == b'http2'
+    assert send(adapter, proxies={'http': 'http://proxy:8080'}).content == b'http2'
+    assert fallback.calls == []
+    assert adapter.stats()['requests'] == 2
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'verify': False},
+    {'verify': '/etc/ssl/custom-ca.pem'},
+    {'cert': ('/tmp/client.crt', '/tmp/client.key')},
+    {'proxies': {'https': 'http://proxy:8080'}},
+    {'stream': True},
+])
+def test_non_default_settings_fall_back(adapters, kwargs):
+    adapter, fallback = adapters
+    assert send(adapter, **kwargs).content == b'http1'
+    assert len(fallback.calls) == 1
+    for key, value in kwargs.items():
+        assert fallback.calls[0][key] == value
+    assert adapter.stats()['requests'] == 0
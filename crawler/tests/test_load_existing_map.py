@@ -0,0 +1,74 @@
+"""
+load_existing_map 로컬 스냅샷 검증 테스트
+- 개수와 기록 당시 max(updated_at)가 모두 같을 때만 DB 조회 생략
+- 개수가 같아도 다른 경로로 수정/교체됐거나 기록이 없으면 DB에서 다시 읽음
+"""
+import pytest
+from utils.snapshot_diff import Snapshot, mark_synced, load_previous_snapshot
+from utils.backup import BackupWriter
+from utils.supabase_client import SupabaseClient
+from utils.promotion import make_promotion_key
+import config
+
+BRAND_ID = 'brand-1'
+START_DATE = '2026-10-01'
+UPDATED_AT = '2026-10-05T01:00:00+00:00'
+
+
+def make_promo(title):
+    return {'title': title, 'raw_title': title, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': 1000,
+            'start_date': START_DATE, 'end_date': '2026-10-31'}
+
+
+def make_client(rows, updated_at):
+    # __init__은 supabase 패키지와 환경변수가 필요하므로 건너뛰고 조회 메서드만 대체
+    client = SupabaseClient.__new__(SupabaseClient)
+    client.db_reads = 0
+
+    def iter_existing_promotions(brand_id, start_date):
+        client.db_reads += 1
+        return iter([{**make_promo('DB'), 'id': 'db-1'}])
+
+    client.promotions_version = lambda brand_id, start_date: (rows, updated_at)
+    client.iter_existing_promotions = iter_existing_promotions
+    return client
+
+
+def make_snapshot(db_updated_at):
+    promo = make_promo('A')
+    return Snapshot({make_promotion_key(promo): promo}, db_updated_at)
+
+
+def test_uses_snapshot_when_count_and_updated_at_match():
+    client = make_client(1, UPDATED_AT)
+    snapshot = make_snapshot(UPDATED_AT)
+
+    assert client.load_existing_map(BRAND_ID, START_DATE, snapshot) is snapshot
+    assert client.db_reads == 0
+
+
+@pytest.mark.parametrize('rows, updated_at, recorded', [
+    (1, '2026-10-06T00:00:00+00:00', UPDATED_AT),  # 같은 개수로 다른 경로에서 수정/교체
+    (2, UPDATED_AT, UPDATED_AT),                   # 개수 불일치
+    (1, UPDATED_AT, None),                         # updated_at 기록 전 스냅샷
+])
+def test_reads_db_when_snapshot_is_stale(rows, updated_at, recorded):
+    client = make_client(rows, updated_at)
+
+    existing = client.load_existing_map(BRAND_ID, START_DATE, make_snapshot(recorded))
+
+    assert [p['title'] for p in existing.values()] == ['DB']
+    assert client.db_reads == 1
+
+
+def test_sync_marker_keeps_db_updated_at(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATA_DIR', str(tmp_path))
+    backup = BackupWriter('cu')
+    backup.write([make_promo('A'), make_promo('B')])
+    path = backup.close()['path']
+
+    mark_synced('cu', path, START_DATE, 2, UPDATED_AT)
+    snapshot = load_previous_snapshot('cu', START_DATE)
+
+    assert len(snapshot) == 2
+    assert snapshot.db_updated_at == UPDATED_AT
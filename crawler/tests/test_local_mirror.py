@@ -0,0 +1,101 @@
+"""
+LocalMirror 테스트
+- sync 전 first_seen 조회 (이번에 새로 나온 제목), 집계 갱신 실패 기록
+- brand.id NOT NULL (이전 파일 마이그레이션 포함)
+- 기준 스냅샷과 함께 DB max(updated_at) 기록
+"""
+import sqlite3
+import pytest
+from utils.local_mirror import LocalMirror
+from utils.promotion import content_hash
+
+START_DATE = '2026-10-01'
+
+
+def make_promo(title, price):
+    promo = {'title': title, 'raw_title': title, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': price,
+             'start_date': START_DATE, 'end_date': '2026-10-31'}
+    promo['content_hash'] = content_hash(promo)
+    return promo
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = LocalMirror(str(tmp_path / 'mirror.sqlite3'))
+    yield mirror
+    mirror.close()
+
+
+def test_first_seen_before_sync_includes_new_titles(mirror):
+    mirror.sync('CU', START_DATE, [make_promo('A', 1000)], 'brand-cu')
+    mirror.conn.execute("UPDATE promo SET first_seen_at = '2026-10-01T00:00:00'")
+
+    seen = mirror.first_seen('CU', START_DATE, [make_promo('A', 1100), make_promo('B', 2000)])
+
+    assert seen['A'] == '2026-10-01T00:00:00'
+    assert seen['B'] > seen['A']
+    assert mirror.first_seen('CU', START_DATE) == {'A': '2026-10-01T00:00:00'}
+
+
+def test_summary_pending_round_trip(mirror):
+    assert not mirror.summary_pending('CU', START_DATE)
+
+    mirror.set_summary_pending('CU', START_DATE, True)
+    mirror.set_summary_pending('CU', START_DATE, True)
+    assert mirror.summary_pending('CU', START_DATE)
+    assert not mirror.summary_pending('GS25', START_DATE)
+
+    mirror.set_summary_pending('CU', START_DATE, False)
+    assert not mirror.summary_pending('CU', START_DATE)
+
+
+def test_sync_records_brand_id(mirror):
+    mirror.sync('CU', START_DATE, [make_promo('A', 1000)], 'brand-cu')
+    assert mirror.query("SELECT name, id FROM brand") == [{'name': 'CU', 'id': 'brand-cu'}]
+
+    with pytest.raises(sqlite3.IntegrityError):
+        mirror.sync('GS25', START_DATE, [make_promo('A', 1000)], None)
+
+
+def test_migrates_nullable_brand_id(tmp_path):
+    path = str(tmp_path / 'old.sqlite3')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE brand (name TEXT PRIMARY KEY, id TEXT);
+        INSERT INTO brand VALUES ('CU', NULL), ('GS25', 'brand-gs25');
+    """)
+    conn.close()
+
+    mirror = LocalMirror(path)
+    try:
+        assert mirror.query("SELECT name, id FROM brand") == [{'name': 'GS25', 'id': 'brand-gs25'}]
+        mirror.sync('CU', START_DATE, [make_promo('A', 1000)], 'brand-cu')
+        assert mirror.query("SELECT id FROM brand WHERE name = 'CU'") == [{'id': 'brand-cu'}]
+    finally:
+        mirror.close()
+
+
+def test_snapshot_keeps_db_updated_at(mirror):
+    mirror.sync('CU', START_DATE, [make_promo('A', 1000)], 'brand-cu', '2026-10-05T01:00:00+00:00')
+
+    snapshot = mirror.load_snapshot('CU', START_DATE)
+    assert [p['title'] for p in snapshot.values()] == ['A']
+    assert snapshot.db_updated_at == '2026-10-05T01:00:00+00:00'
+
+
+def test_migrates_sync_state_without_db_updated_at(tmp_path):
+    path = str(tmp_path / 'old.sqlite3')
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE sync_state (brand TEXT NOT NULL, start_date TEXT NOT NULL, rows INTEGER NOT NULL,
+                                 synced_at TEXT NOT NULL, PRIMARY KEY (brand, start_date));
+        INSERT INTO sync_state VALUES ('CU', '2026-10-01', 0, '2026-10-01T00:00:00');
+    """)
+    conn.close()
+
+    mirror = LocalMirror(path)
+    try:
+        # 기록이 없던 달은 DB와 일치 여부를 확인할 수 없음 → load_existing_map이 DB 조회
+        assert mirror.load_snapshot('CU', START_DATE).db_updated_at is None
+    finally:
+        mirror.close()
@@ -0,0 +1,31 @@
+"""
+로그 라우팅 테스트
+- 날짜별 로그 파일이 기록 시각의 날짜를 따라가는지 (자정을 넘겨 실행되는 데몬)
+"""
+import logging
+from datetime import datetime
+from utils.logger import _RoutingHandler
+
+
+def make_record(name, msg, when):
+    record = logging.makeLogRecord({'name': name, 'msg': msg, 'levelno': logging.INFO, 'levelname': 'INFO'})
+    record.created = when.timestamp()
+    return record
+
+
+def test_daily_file_follows_record_date(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'logs').mkdir()
+    router = _RoutingHandler()
+    router.console.setLevel(logging.CRITICAL + 1)
+    try:
+        router.handle(make_record('cu_crawler', 'before midnight', datetime(2026, 10, 19, 23, 59, 59)))
+        router.handle(make_record('cu_crawler', 'after midnight', datetime(2026, 10, 20, 0, 0, 1)))
+        router.handle(make_record('upload_to_db', 'upload', datetime(2026, 10, 20, 0, 0, 2)))
+    finally:
+        router.close()
+
+    assert 'before midnight' in (tmp_path / 'logs' / '20261019.log').read_text(encoding='utf-8')
+    day2 = (tmp_path / 'logs' / '20261020.log').read_text(encoding='utf-8')
+    assert 'after midnight' in day2 and 'before midnight' not in day2
+    assert 'upload' in (tmp_path / 'logs' / 'upload_to_db.log').read_text(encoding='utf-8')
@@ -0,0 +1,90 @@
+"""
+merge_promotions 함수 (supabase/migrations) 테스트
+- PG_TEST_DSN의 일회용 스키마에 마이그레이션을 적용하고 신규/변경/유지/삭제/중복 제목 처리를 확인
+"""
+import pytest
+from utils.promotion import content_hash, to_promo_row
+
+psycopg = pytest.importorskip('psycopg')
+from psycopg.types.json import Jsonb  # noqa: E402
+
+START_DATE = '2026-10-01'
+
+
+def make_promo(title, price, start_date=START_DATE):
+    promo = {
+        'title': title,
+        'raw_title': title,
+        'category': '음료',
+        'deal_type': 'ONE_PLUS_ONE',
+        'normal_price': price,
+        'sale_price': price,
+        'start_date': start_date,
+        'end_date': '2026-10-31',
+    }
+    promo['content_hash'] = content_hash(promo)
+    return promo
+
+
+def merge(conn, brand_id, promotions, start_date=START_DATE):
+    rows = [to_promo_row(p, brand_id) for p in promotions]
+    result = conn.execute("SELECT merge_promotions(%s, %s, %s)", (brand_id, start_date, Jsonb(rows))).fetchone()[0]
+    conn.commit()
+    return result
+
+
+def promo_prices(conn, brand_id, start_date=START_DATE):
+    rows = conn.execute(
+        "SELECT title, sale_price FROM promo WHERE brand_id = %s AND start_date = %s", (brand_id, start_date)
+    ).fetchall()
+    return dict(rows)
+
+
+@pytest.fixture
+def conn(pg_dsn):
+    with psycopg.connect(pg_dsn) as conn:
+        yield conn
+
+
+@pytest.fixture
+def brand_id(conn):
+    brand_id = str(conn.execute("INSERT INTO brand (name) VALUES ('CU') RETURNING id").fetchone()[0])
+    conn.commit()
+    return brand_id
+
+
+def test_merge_inserts_updates_and_deletes(conn, brand_id):
+    first = merge(conn, brand_id, [make_promo('A', 1000), make_promo('B', 2000), make_promo('C', 3000)])
+    assert first == {'new': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 3}
+
+    # A 유지, B 가격 변경, C 삭제, D 신규
+    second = merge(conn, brand_id, [make_promo('A', 1000), make_promo('B', 2500), make_promo('D', 4000)])
+    assert second == {'new': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1, 'total': 3}
+    assert promo_prices(conn, brand_id) == {'A': 1000, 'B': 2500, 'D': 4000}
+
+    # 같은 입력을 다시 보내면 변경 없음
+    third = merge(conn, brand_id, [make_promo('A', 1000), make_promo('B', 2500), make_promo('D', 4000)])
+    assert third == {'new': 0, 'updated': 0, 'deleted': 0, 'unchanged': 3, 'total': 3}
+
+
+def test_merge_uses_last_duplicate_title(conn, brand_id):
+    merge(conn, brand_id, [make_promo('A', 1000)])
+
+    result = merge(conn, brand_id, [
+        make_promo('A', 1100), make_promo('B', 2000), make_promo('A', 1200), make_promo('B', 2100),
+    ])
+    assert result == {'new': 1, 'updated': 1, 'deleted': 0, 'unchanged': 0, 'total': 2}
+    assert promo_prices(conn, brand_id) == {'A': 1200, 'B': 2100}
+
+
+def test_merge_only_touches_brand_and_month(conn, brand_id):
+    other_brand = str(conn.execute("INSERT INTO brand (name) VALUES ('GS25') RETURNING id").fetchone()[0])
+    conn.commit()
+    merge(conn, other_brand, [make_promo('A', 1000)])
+    merge(conn, brand_id, [make_promo('A', 1000, start_date='2026-09-01')], start_date='2026-09-01')
+
+    # 다른 달 row는 입력에서 제외, 다른 브랜드/달의 기존 row는 삭제하지 않음
+    result = merge(conn, brand_id, [make_promo('B', 2000), make_promo('C', 3000, start_date='2026-09-01')])
+    assert result == {'new': 1, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 1}
+    assert promo_prices(conn, other_brand) == {'A': 1000}
+    assert promo_prices(conn, brand_id, start_date='2026-09-01') == {'A': 1000}
@@ -0,0 +1,88 @@
+"""
+근사 중복 탐지 테스트
+- 기본값은 리포트만 (목록 그대로), remove=True일 때만 같은 행사의 표기 변형 제거
+"""
+import json
+import pytest
+import config
+import upload_to_db
+from crawlers.registry import get_spec
+from utils.backup import read_backup
+from utils.near_duplicate import dedupe_promotions, find_clusters
+
+
+def promo(title, price=1000, deal_type='ONE_PLUS_ONE'):
+    return {'title': title, 'raw_title': title, 'deal_type': deal_type, 'sale_price': price,
+            'start_date': '2026-10-01'}
+
+
+PROMOTIONS = [
+    promo('코카콜라 500ml'),
+    promo('코카-콜라 500ML'),           # 표기만 다른 같은 행사
+    promo('코카콜라 355ml'),            # 용량이 다른 상품
+    promo('코카콜라 500ml', price=900),  # 같은 상품, 다른 행사가격 → 유지
+    promo('신라면'),
+]
+
+
+@pytest.fixture(autouse=True)
+def report_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'NEAR_DUPLICATE_REPORT_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'NEAR_DUPLICATE_REMOVE', False)
+    return tmp_path
+
+
+def test_clusters_ignore_different_volumes():
+    clusters = find_clusters(PROMOTIONS)
+    assert [c['members'] for c in clusters] == [[0, 1, 3]]
+
+
+def test_report_only_by_default(report_dir):
+    result = dedupe_promotions('cu', PROMOTIONS)
+
+    assert result == PROMOTIONS
+    report = json.loads((report_dir / 'cu.json').read_text(encoding='utf-8'))
+    assert report['removed'] is False
+    assert report['clusters'][0]['duplicates'] == [{'title': '코카-콜라 500ML', 'kept_title': '코카콜라 500ml'}]
+
+
+def test_remove_drops_same_deal_variants(report_dir):
+    result = dedupe_promotions('cu', PROMOTIONS, remove=True)
+
+    assert [p['title'] for p in result] == ['코카콜라 500ml', '코카콜라 355ml', '코카콜라 500ml', '신라면']
+    assert json.loads((report_dir / 'cu.json').read_text(encoding='utf-8'))['removed'] is True
+
+
+def test_report_is_rewritten_without_clusters(report_dir):
+    dedupe_promotions('cu', PROMOTIONS)
+    dedupe_promotions('cu', [promo('신라면')])
+    assert json.loads((report_dir / 'cu.json').read_text(encoding='utf-8'))['clusters'] == []
+
+
+class FakeCrawler:
+    """페이지 리스너로 두 페이지를 내보내는 크롤러"""
+
+    def __init__(self):
+        self.listeners = []
+
+    def add_page_listener(self, listener):
+        self.listeners.append(listener)
+
+    def run(self, resume=False):
+        pages = [PROMOTIONS[:2], PROMOTIONS[2:]]
+        for page in pages:
+            for listener in self.listeners:
+                listener(page)
+        return [p for page in pages for p in page]
+
+
+@pytest.mark.parametrize('remove', [False, True])
+def test_backup_matches_saved_products(tmp_path, monkeypatch, remove):
+    monkeypatch.setattr(config, 'DATA_DIR', str(tmp_path))
+    monkeypatch.setattr(config, 'NEAR_DUPLICATE_REMOVE', remove)
+    monkeypatch.setattr(upload_to_db, 'load_crawler', lambda key: FakeCrawler)
+
+    _, _, products, backup_report, _ = upload_to_db.crawl_stage(get_spec('cu'))
+
+    assert len(products) == (4 if remove else 5)
+    assert list(read_backup(backup_report['path'])) == products
@@ -0,0 +1,76 @@
+"""
+PostgresCopyBackend (SYNC_MODE=copy) 테스트
+- PG_TEST_DSN의 일회용 스키마에서 advisory lock + COPY + 병합 경로 전체를 실행
+"""
+import threading
+import pytest
+from utils.promotion import content_hash
+
+psycopg = pytest.importorskip('psycopg')
+from utils.pg_backend import PostgresCopyBackend  # noqa: E402
+
+START_DATE = '2026-10-01'
+
+
+def make_promo(title, price):
+    promo = {
+        'title': title,
+        'raw_title': title,
+        'deal_type': 'TWO_PLUS_ONE',
+        'normal_price': price,
+        'sale_price': price,
+        'start_date': START_DATE,
+        'end_date': '2026-10-31',
+        'description': f"{title} 설명",
+    }
+    promo['content_hash'] = content_hash(promo)
+    return promo
+
+
+@pytest.fixture
+def backend(pg_dsn):
+    with psycopg.connect(pg_dsn) as conn:
+        conn.execute("INSERT INTO brand (name) VALUES ('CU')")
+    backend = PostgresCopyBackend(pg_dsn)
+    yield backend
+    backend.close()
+
+
+def promo_prices(backend):
+    with backend.conn.cursor() as cur:
+        rows = cur.execute("SELECT title, sale_price FROM promo WHERE start_date = %s", (START_DATE,)).fetchall()
+    backend.conn.commit()
+    return dict(rows)
+
+
+def test_copy_backend_merges(backend):
+    first = backend.save_promotions("CU", [make_promo('A', 1000), make_promo('B', 2000), make_promo('C', 3000)])
+    assert first == {'new': 3, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 3}
+
+    second = backend.save_promotions("CU", [
+        make_promo('A', 1000), make_promo('B', 2500), make_promo('D', 4000), make_promo('D', 4100),
+    ])
+    assert second == {'new': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1, 'total': 3}
+    assert promo_prices(backend) == {'A': 1000, 'B': 2500, 'D': 4100}
+
+
+def test_copy_backend_serializes_same_brand_month(backend, pg_dsn):
+    brand_id = backend.get_brand_id("CU")
+    finished = threading.Event()
+
+    # 다른 연결이 같은 키로 advisory lock을 잡고 있는 동안 저장은 대기해야 함
+    with psycopg.connect(pg_dsn) as holder:
+        holder.execute("SELECT pg_advisory_xact_lock(hashtext(%s::text || %s::text))", (brand_id, START_DATE))
+
+        def save():
+            backend.save_promotions("CU", [make_promo('A', 1000)])
+            finished.set()
+
+        thread = threading.Thread(target=save)
+        thread.start()
+        assert not finished.wait(0.5)
+        holder.commit()
+
+    thread.join(5)
+    assert finished.is_set()
+    assert promo_prices(backend) == {'A': 1000}
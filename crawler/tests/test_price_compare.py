@@ -0,0 +1,63 @@
+"""
+가격 비교 그룹 테스트
+- 유효한 EAN 바코드만 연결에 사용, 브랜드 안에서 여러 상품이 공유하는 바코드(제조사 코드)로 그룹이 이어지지 않는지
+"""
+import pytest
+from utils.price_compare import build_compare_groups, effective_unit_price, valid_barcode
+
+START_DATE = '2026-10-01'
+
+
+def promo(promo_id, title, price, barcode=None, deal_type='DISCOUNT'):
+    return {'id': promo_id, 'title': title, 'barcode': barcode, 'deal_type': deal_type,
+            'sale_price': price, 'start_date': START_DATE}
+
+
+@pytest.mark.parametrize('barcode, expected', [
+    ('8801043014809', True),     # EAN-13
+    ('96385074', True),          # EAN-8
+    ('18801043014806', True),    # EAN-14
+    ('8801043014808', False),    # 체크 디지트 불일치
+    ('8801043', False),          # 세븐일레븐 이미지 경로의 제조사 디렉토리
+    ('', False),
+    ('880104301480A', False),
+])
+def test_valid_barcode(barcode, expected):
+    assert valid_barcode(barcode) is expected
+
+
+def test_manufacturer_code_does_not_chain_products():
+    groups = build_compare_groups({
+        'SevenEleven': [promo('s1', '신라면', 900, '8801043'), promo('s2', '짜파게티', 800, '8801043')],
+        'CU': [promo('c1', '신라면', 1000)],
+        'GS25': [promo('g1', '짜파게티', 850)],
+    })
+
+    by_title = {frozenset(g['promo_ids']): g for g in groups}
+    assert set(by_title) == {frozenset({'s1', 'c1'}), frozenset({'s2', 'g1'})}
+    assert all(g['match_type'] == 'title' and g['barcode'] is None for g in groups)
+    assert by_title[frozenset({'s1', 'c1'})]['title'] == '신라면'
+
+
+def test_valid_barcode_shared_by_titles_within_brand_is_ignored():
+    # 한 브랜드가 같은 (유효한) 바코드를 서로 다른 상품에 쓰면 상품 식별자로 믿지 않음
+    groups = build_compare_groups({
+        'CU': [promo('c1', '신라면', 1000, '8801043014809'), promo('c2', '너구리', 1000, '8801043014809')],
+        'GS25': [promo('g1', '신라면 컵', 1100, '8801043014809')],
+    })
+    assert groups == []
+
+
+def test_barcode_groups_across_brands():
+    groups = build_compare_groups({
+        'CU': [promo('c1', '코카콜라 500ml', 2000, '8801094017200', 'ONE_PLUS_ONE')],
+        'GS25': [promo('g1', '코카-콜라 500ML', 1800, '8801094017200')],
+        'Emart24': [promo('e1', '펩시 500ml', 1500)],
+    })
+
+    assert len(groups) == 1
+    group = groups[0]
+    assert group['group_key'] == 'barcode:8801094017200'
+    assert group['promo_ids'] == ['c1', 'g1']
+    assert group['cheapest_brand'] == 'CU'
+    assert group['min_unit_price'] == effective_unit_price({'sale_price': 2000, 'deal_type': 'ONE_PLUS_ONE'})
@@ -0,0 +1,70 @@
+"""
+promo_summary 집계 테스트
+- 그룹별 개수, 실질 개당 가격(1+1은 1/2) 최소/중앙/최대, 최신 상품
+- 변경된 그룹만 upsert, 상품이 모두 빠진 그룹은 삭제 (전체 계산이면 DB에 남은 그룹과 비교)
+"""
+from fake_supabase import make_client
+from utils.promo_summary import compute_summaries, touched_groups, update_summaries
+from utils.snapshot_diff import diff_snapshots
+from utils.promotion import content_hash, make_promotion_key
+
+CU = 'brand-cu'
+START_DATE = '2026-10-01'
+
+
+def promo(title, price, category='음료', deal_type='ONE_PLUS_ONE'):
+    p = {'title': title, 'category': category, 'deal_type': deal_type, 'sale_price': price, 'start_date': START_DATE}
+    p['content_hash'] = content_hash(p)
+    return p
+
+
+def snapshot(*promotions):
+    return {make_promotion_key(p): p for p in promotions}
+
+
+def groups(client):
+    return {(r['category'], r['deal_type']): r['item_count'] for r in client.client.rows('promo_summary')}
+
+
+def test_compute_summaries():
+    promotions = [promo('콜라', 2000), promo('사이다', 1000), promo('우유', 3000), promo('빵', 1500, '빵', 'DISCOUNT')]
+    first_seen = {'콜라': '2026-10-01', '사이다': '2026-10-03', '우유': '2026-10-02'}
+
+    summaries = compute_summaries(promotions, first_seen=first_seen)
+
+    drinks = summaries[('음료', 'ONE_PLUS_ONE')]
+    assert (drinks['item_count'], drinks['min_price'], drinks['median_price'], drinks['max_price']) == (3, 500, 1000, 1500)
+    assert [p['title'] for p in drinks['newest']] == ['사이다', '우유', '콜라']
+    assert summaries[('빵', 'DISCOUNT')]['median_price'] == 1500
+
+
+def test_touched_groups_include_previous_group_of_moved_item():
+    changes = diff_snapshots(snapshot(promo('콜라', 2000), promo('빵', 1500, '빵')),
+                             [promo('콜라', 2000, '탄산'), promo('빵', 1500, '빵')])
+    assert touched_groups(changes) == {('음료', 'ONE_PLUS_ONE'), ('탄산', 'ONE_PLUS_ONE')}
+
+
+def test_update_only_touched_groups_and_delete_emptied():
+    client = make_client({'CU': CU})
+    before = [promo('콜라', 2000), promo('빵', 1500, '빵')]
+    update_summaries(client, 'CU', START_DATE, before, None)
+    assert groups(client) == {('음료', 'ONE_PLUS_ONE'): 1, ('빵', 'ONE_PLUS_ONE'): 1}
+
+    after = [promo('콜라', 2000, '탄산'), promo('빵', 1500, '빵')]
+    stats = update_summaries(client, 'CU', START_DATE, after, diff_snapshots(snapshot(*before), after))
+
+    assert stats == {'upserted': 1, 'deleted': 1}
+    assert groups(client) == {('탄산', 'ONE_PLUS_ONE'): 1, ('빵', 'ONE_PLUS_ONE'): 1}
+
+
+def test_full_recompute_deletes_stale_groups():
+    client = make_client({'CU': CU}, {'promo_summary': [
+        {'brand_id': CU, 'month': START_DATE, 'category': '단종', 'deal_type': 'DISCOUNT', 'item_count': 4},
+        {'brand_id': 'brand-gs25', 'month': START_DATE, 'category': '단종', 'deal_type': 'DISCOUNT', 'item_count': 4},
+    ]})
+
+    stats = update_summaries(client, 'CU', START_DATE, [promo('콜라', 2000)], None)
+
+    assert stats == {'upserted': 1, 'deleted': 1}
+    assert sorted((r['brand_id'], r['category']) for r in client.client.rows('promo_summary')) == \
+        [('brand-cu', '음료'), ('brand-gs25', '단종')]
@@ -0,0 +1,139 @@
+"""
+QueuedPageCrawler 테스트
+- 리스너는 진행 상태 락 밖에서 호출
+- 이전 dead-letter 파일은 지우지 않고 .1로 보관
+- 재시도는 작업 큐 한 곳에서만 (요청 재시도와 곱해지지 않음), 요청 간격은 워커 전체가 공유
+"""
+import json
+import threading
+import time
+import pytest
+import requests
+import config
+from crawlers.queued_crawler import QueuedPageCrawler
+from utils.rate_limiter import RateLimiter
+
+
+class FakeCrawler(QueuedPageCrawler):
+    """페이지 1~3에 상품 2개씩, 4페이지는 빈 목록 (fail_pages는 항상 실패)"""
+
+    def __init__(self, fail_pages=()):
+        super().__init__("Fake")
+        self.fail_pages = set(fail_pages)
+
+    def crawl(self):
+        return self._crawl_units([('unit', 'Unit')])
+
+    def _fetch_list_page(self, unit, page):
+        if page in self.fail_pages:
+            raise ValueError(f"page {page} failed")
+        if page > 3:
+            return None
+        return [({'title': f"상품 {page}-{i}", 'start_date': '2026-10-01'}, f"{page}-{i}") for i in range(2)]
+
+    def _load_product_detail(self, product_id):
+        return {'barcode': product_id}
+
+    def _apply_detail(self, product, detail):
+        product.update(detail)
+
+
+@pytest.fixture(autouse=True)
+def queue_config(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DEAD_LETTER_DIR', str(tmp_path / 'dead_letter'))
+    monkeypatch.setattr(config, 'TASK_RETRY_BACKOFF', 0)
+    monkeypatch.setattr(config, 'TASK_MAX_ATTEMPTS', 2)
+    monkeypatch.setattr(config, 'CRAWL_WORKERS', 3)
+
+
+def test_listeners_run_outside_progress_lock():
+    crawler = FakeCrawler()
+    received = []
+
+    def listener(products):
+        # 진행 상태 락을 잡은 채로 호출되면 다른 워커가 모두 멈춤
+        assert crawler._lock.acquire(blocking=False)
+        crawler._lock.release()
+        received.extend(products)
+
+    crawler.add_page_listener(listener)
+    products = crawler.crawl()
+
+    assert len(products) == 6
+    assert sorted(p['title'] for p in received) == sorted(p['title'] for p in products)
+    assert all(p['barcode'] for p in products)
+
+
+def test_previous_dead_letters_are_kept(tmp_path):
+    path = tmp_path / 'dead_letter' / 'fake.jsonl'
+    path.parent.mkdir()
+    path.write_text(json.dumps({'kind': 'page', 'payload': {'unit': 'unit', 'page': 9}}) + '\n', encoding='utf-8')
+
+    crawler = FakeCrawler(fail_pages={2})
+    products = crawler.crawl()
+
+    assert len(products) == 4
+    previous = (tmp_path / 'dead_letter' / 'fake.jsonl.1').read_text(encoding='utf-8')
+    assert '"page": 9' in previous
+    current = [json.loads(line) for line in path.read_text(encoding='utf-8').splitlines()]
+    assert [entry['payload']['page'] for entry in current] == [2]
+
+
+class FlakySession:
+    """fail_pages 목록 요청은 항상 연결 오류, 나머지는 빈 응답"""
+
+    def __init__(self, fail_pages):
+        self.fail_pages = set(fail_pages)
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def get(self, url, timeout=None, params=None):
+        with self._lock:
+            self.calls[params['page']] = self.calls.get(params['page'], 0) + 1
+        if params['page'] in self.fail_pages:
+            raise requests.ConnectionError(f"page {params['page']} down")
+        return type('Response', (), {'raise_for_status': lambda self: None})()
+
+
+class RequestCrawler(FakeCrawler):
+    """목록 페이지를 _request로 받는 크롤러"""
+
+    def __init__(self, session):
+        super().__init__()
+        self.session = session
+
+    def _fetch_list_page(self, unit, page):
+        self._request('https://example.com/list', params={'page': page})
+        return super()._fetch_list_page(unit, page)
+
+
+def test_retries_only_in_work_queue(monkeypatch):
+    monkeypatch.setattr(config, 'MAX_RETRIES', 3)
+    monkeypatch.setattr(config, 'CRAWL_DELAY', 0)
+    session = FlakySession(fail_pages={2})
+
+    products = RequestCrawler(session).crawl()
+
+    assert len(products) == 4
+    # TASK_MAX_ATTEMPTS(2)번만 시도 (요청 재시도까지 곱해지면 6번)
+    assert session.calls[2] == config.TASK_MAX_ATTEMPTS
+
+
+def test_rate_limit_is_shared_between_workers():
+    limiter = RateLimiter(0.02)
+    started = []
+
+    def worker():
+        for _ in range(3):
+            limiter.wait()
+            started.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    started.sort()
+    # 워커 3개가 동시에 요청해도 요청 시작 간격은 interval 이상 (워커별 대기였다면 3개씩 동시에 시작)
+    assert all(b - a >= 0.015 for a, b in zip(started, started[1:]))
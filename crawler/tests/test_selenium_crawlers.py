@@ -0,0 +1,99 @@
+"""
+GS25/이마트24 페이지 순회 테스트 (가짜 WebDriver)
+- 중복 판단은 정규화 전 원본 상품명으로 (앞 페이지 상품은 이미 title이 정규화된 상태)
+- 다음 버튼이 없거나 비활성화일 때만 마지막 페이지, 클릭/대기 예외는 유닛 미완료 (삭제 반영 안 함)
+"""
+import pytest
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from crawlers.gs25_crawler import GS25Crawler
+from crawlers.emart24_crawler import Emart24Crawler
+from fake_selenium import FakeDriver
+
+# 정규화하면 title이 바뀌는 상품명 (전각 문자, 행사 표기)
+PAGE_1 = ['코카콜라 ５００ＭＬ', '신라면(1+1)']
+PAGE_2 = ['칸쵸컵', '포카리스웨트 ６２０ＭＬ']
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    monkeypatch.setattr('crawlers.gs25_crawler.time.sleep', lambda seconds: None)
+    monkeypatch.setattr('crawlers.emart24_crawler.time.sleep', lambda seconds: None)
+
+
+def test_new_products_compares_raw_titles():
+    crawler = GS25Crawler()
+    collected = [{'title': '코카콜라 500ml', 'raw_title': '코카콜라 ５００ＭＬ'}]
+    parsed = [
+        {'title': '코카콜라 ５００ＭＬ', 'raw_title': '코카콜라 ５００ＭＬ'},
+        {'title': '칸쵸컵', 'raw_title': '칸쵸컵'},
+        {'title': '칸쵸컵', 'raw_title': '칸쵸컵'},
+    ]
+    assert [p['raw_title'] for p in crawler._new_products(collected, parsed)] == ['칸쵸컵']
+
+
+def test_gs25_stops_when_pages_repeat():
+    crawler = GS25Crawler()
+    crawler.driver = FakeDriver('gs25', [PAGE_1, PAGE_2])
+
+    products = crawler._crawl_by_tab(1, '1+1')
+
+    assert sorted(p['raw_title'] for p in products) == sorted(PAGE_1 + PAGE_2)
+    # 3, 4페이지가 2페이지와 같은 내용 → 2페이지 연속 새 상품 없음으로 종료
+    assert crawler.driver.visited == [2, 3, 4]
+    assert 'tab:1' in crawler.units_done
+
+
+def test_emart24_stops_when_pages_repeat(monkeypatch):
+    monkeypatch.setattr(Emart24Crawler, 'CATEGORIES', {'음료': '5'})
+    crawler = Emart24Crawler()
+    crawler.driver = FakeDriver('emart24', [PAGE_1, PAGE_2])
+
+    products = crawler._crawl_by_benefit('1', '1+1')
+
+    assert sorted(p['raw_title'] for p in products) == sorted(PAGE_1 + PAGE_2)
+    assert crawler.driver.visited == [2, 3, 4]
+    assert 'benefit:1:category:5' in crawler.units_done
+
+
+@pytest.mark.parametrize('hide_next', [False, True])
+def test_gs25_last_page_completes_unit(hide_next):
+    crawler = GS25Crawler()
+    crawler.driver = FakeDriver('gs25', [PAGE_1, PAGE_2], last_page=2, hide_next=hide_next)
+
+    products = crawler._crawl_by_tab(1, '1+1')
+
+    assert len(products) == 4
+    assert crawler.is_complete()
+
+
+@pytest.mark.parametrize('error', [TimeoutException('page load'), WebDriverException('click intercepted')])
+def test_gs25_click_failure_leaves_unit_incomplete(error):
+    crawler = GS25Crawler()
+    crawler.driver = FakeDriver('gs25', [PAGE_1, PAGE_2, ['새 상품']], click_errors={3: error})
+
+    products = crawler._crawl_by_tab(1, '1+1')
+
+    assert len(products) == 4
+    assert 'tab:1' not in crawler.units_done
+    assert not crawler.is_complete()
+
+
+def test_emart24_last_page_completes_unit(monkeypatch):
+    monkeypatch.setattr(Emart24Crawler, 'CATEGORIES', {'음료': '5'})
+    crawler = Emart24Crawler()
+    crawler.driver = FakeDriver('emart24', [PAGE_1, PAGE_2], last_page=2)
+
+    assert len(crawler._crawl_by_benefit('1', '1+1')) == 4
+    assert crawler.is_complete()
+
+
+def test_emart24_click_failure_leaves_unit_incomplete(monkeypatch):
+    monkeypatch.setattr(Emart24Crawler, 'CATEGORIES', {'음료': '5'})
+    crawler = Emart24Crawler()
+    crawler.driver = FakeDriver('emart24', [PAGE_1, PAGE_2, ['새 상품']],
+                                click_errors={3: WebDriverException('stale element')})
+
+    products = crawler._crawl_by_benefit('1', '1+1')
+
+    assert len(products) == 4
+    assert not crawler.is_complete()
@@ -0,0 +1,77 @@
+"""
+SingleFlightMemo 테스트
+- 같은 키 동시 요청은 한 번만 가져와서 공유, 이후 요청은 캐시
+- 실패는 기다리던 호출에 같은 예외로 전달하고 저장하지 않음 (다음 요청은 다시 시도)
+"""
+import threading
+import time
+import pytest
+from utils.single_flight import SingleFlightMemo
+
+
+def wait_for_callers(memo, count):
+    """모든 호출이 fetch 중인 요청에 합류할 때까지 대기"""
+    deadline = time.monotonic() + 5
+    while memo.stats['misses'] + memo.stats['shared'] < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def run_concurrently(count, target):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(target())
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_requests_fetch_once():
+    memo = SingleFlightMemo()
+    release = threading.Event()
+    calls = []
+
+    def fetch(key):
+        calls.append(key)
+        release.wait(5)
+        return {'barcode': key}
+
+    threads, results, _ = run_concurrently(4, lambda: memo.get('8801', fetch))
+    wait_for_callers(memo, 4)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ['8801']
+    assert results == [{'barcode': '8801'}] * 4
+    assert memo.get('8801', fetch) == {'barcode': '8801'}
+    assert memo.stats == {'hits': 1, 'shared': 3, 'misses': 1, 'errors': 0}
+
+
+def test_failure_is_shared_but_not_cached():
+    memo = SingleFlightMemo()
+    release = threading.Event()
+
+    def failing(key):
+        release.wait(5)
+        raise ConnectionError('detail down')
+
+    threads, _, errors = run_concurrently(3, lambda: memo.get('8801', failing))
+    wait_for_callers(memo, 3)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 3 and all(isinstance(e, ConnectionError) for e in errors)
+    assert memo.get('8801', lambda key: 'ok') == 'ok'
+    assert memo.stats['errors'] == 1
+
+
+def test_errors_propagate_to_caller():
+    with pytest.raises(KeyError):
+        SingleFlightMemo().get('8801', lambda key: {}[key])
@@ -0,0 +1,77 @@
+"""
+스냅샷 diff 테스트
+- 신규/업데이트/삭제/변경 없음 분류 (content_hash 비교)
+- 기준 스냅샷은 같은 달, 백업 파일이 있고 마커의 개수와 맞을 때만 사용
+"""
+import os
+import pytest
+import config
+from utils.backup import BackupWriter
+from utils.promotion import content_hash, make_promotion_key
+from utils.snapshot_diff import diff_snapshots, load_previous_snapshot, mark_synced
+
+START_DATE = '2026-10-01'
+
+
+def promo(title, price=1000, start_date=START_DATE):
+    return {'title': title, 'raw_title': title, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': price,
+            'start_date': start_date, 'end_date': '2026-10-31'}
+
+
+def snapshot(*promotions):
+    return {make_promotion_key(p): {**p, 'content_hash': content_hash(p)} for p in promotions}
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'DATA_DIR', str(tmp_path))
+    return tmp_path
+
+
+def write_backup(promotions):
+    backup = BackupWriter('cu')
+    backup.write(promotions)
+    return backup.close()['path']
+
+
+def test_diff_classifies_changes():
+    previous = snapshot(promo('콜라'), promo('사이다'), promo('단종'))
+    changes = diff_snapshots(previous, [promo('콜라'), promo('사이다', 900), promo('우유')])
+
+    assert [p['title'] for p in changes.added.values()] == ['우유']
+    assert [p['sale_price'] for p in changes.updated.values()] == [900]
+    assert [p['sale_price'] for p in changes.previous.values()] == [1000]
+    assert [p['title'] for p in changes.deleted.values()] == ['단종']
+    assert changes.stats() == {'new': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1, 'total': 3}
+
+
+def test_row_without_hash_counts_as_updated():
+    changes = diff_snapshots({make_promotion_key(promo('콜라')): promo('콜라')}, [promo('콜라')])
+    assert len(changes.updated) == 1
+
+
+def test_previous_snapshot_round_trip():
+    # 해시 컬럼 도입 전 백업도 읽을 때 해시를 채움
+    mark_synced('cu', write_backup([promo('콜라'), promo('우유')]), START_DATE, 2)
+
+    previous = load_previous_snapshot('cu', START_DATE)
+
+    assert diff_snapshots(previous, [promo('콜라'), promo('우유')]).stats()['unchanged'] == 2
+
+
+def test_previous_snapshot_from_another_month_is_ignored():
+    mark_synced('cu', write_backup([promo('콜라')]), START_DATE, 1)
+    assert load_previous_snapshot('cu', '2026-11-01') is None
+
+
+def test_missing_backup_is_ignored():
+    path = write_backup([promo('콜라')])
+    mark_synced('cu', path, START_DATE, 1)
+    os.remove(path)
+
+    assert load_previous_snapshot('cu', START_DATE) is None
+
+
+def test_marker_row_count_mismatch_is_ignored():
+    mark_synced('cu', write_backup([promo('콜라'), promo('우유')]), START_DATE, 3)
+    assert load_previous_snapshot('cu', START_DATE) is None
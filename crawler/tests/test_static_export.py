@@ -0,0 +1,54 @@
+"""
+정적 JSON 내보내기 테스트
+- 같은 입력이면 같은 바이트 (입력 순서와 무관), 바뀌지 않은 샤드는 다시 쓰지 않음
+- 내용이 바뀐 샤드는 새 해시 파일명으로 쓰고 이전 파일(.gz 포함)은 정리
+"""
+import gzip
+import json
+import os
+from utils.static_export import export_static
+
+START_DATE = '2026-10-01'
+
+
+def promo(promo_id, title, price, category='음료', deal_type='ONE_PLUS_ONE'):
+    return {'id': promo_id, 'title': title, 'category': category, 'deal_type': deal_type, 'sale_price': price}
+
+
+PROMOTIONS = {
+    'CU': [promo('1', '콜라', 2000), promo('2', '사이다', 1800), promo('3', '빵', 1500, '빵/과자', 'DISCOUNT')],
+    'GS25': [promo('4', '콜라', 2100)],
+}
+
+
+def manifest(output_dir):
+    with open(os.path.join(output_dir, 'manifest.json'), encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_export_is_deterministic(tmp_path):
+    first, second = tmp_path / 'a', tmp_path / 'b'
+    export_static(PROMOTIONS, START_DATE, str(first))
+    export_static({brand: list(reversed(items)) for brand, items in PROMOTIONS.items()}, START_DATE, str(second))
+
+    assert (first / 'manifest.json').read_bytes() == (second / 'manifest.json').read_bytes()
+    entry = manifest(first)['shards']['CU/ONE_PLUS_ONE/음료']
+    shard = json.loads((first / entry['path']).read_bytes())
+    assert [p['title'] for p in shard['items']] == ['사이다', '콜라']
+    assert gzip.decompress((first / (entry['path'] + '.gz')).read_bytes()) == (first / entry['path']).read_bytes()
+    # 파일명에 쓸 수 없는 문자는 치환
+    assert 'CU/DISCOUNT/빵_과자' in manifest(first)['shards']
+
+
+def test_unchanged_shards_are_skipped_and_stale_files_removed(tmp_path):
+    output_dir = str(tmp_path)
+    assert export_static(PROMOTIONS, START_DATE, output_dir)['written'] == 3
+    old_path = os.path.join(output_dir, manifest(output_dir)['shards']['GS25/ONE_PLUS_ONE/음료']['path'])
+
+    changed = {**PROMOTIONS, 'GS25': [promo('4', '콜라', 1900)]}
+    stats = export_static(changed, START_DATE, output_dir)
+
+    assert (stats['written'], stats['skipped'], stats['removed']) == (1, 2, 1)
+    assert not os.path.exists(old_path) and not os.path.exists(old_path + '.gz')
+    new_path = os.path.join(output_dir, manifest(output_dir)['shards']['GS25/ONE_PLUS_ONE/음료']['path'])
+    assert json.loads(open(new_path, encoding='utf-8').read())['items'][0]['sale_price'] == 1900
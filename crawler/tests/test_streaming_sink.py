@@ -0,0 +1,82 @@
+"""
+StreamingSink 테스트 (가짜 PostgREST)
+- 페이지 단위로 쓰고 finish()에서 최종 목록으로 맞춤
+- 삭제는 크롤링이 완료된 경우에만 (미완료/쓰기 실패면 기존 row 유지)
+"""
+import pytest
+from fake_supabase import make_client
+from utils.promotion import content_hash
+from utils.streaming_sink import StreamingSink
+
+CU = 'brand-cu'
+START_DATE = '2026-10-01'
+
+
+def promo(title, price=1000):
+    return {'title': title, 'raw_title': title, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': price,
+            'start_date': START_DATE, 'end_date': '2026-10-31'}
+
+
+def db_row(title, price=1000):
+    p = promo(title, price)
+    return {'id': f"id-{title}", 'brand_id': CU, **p, 'content_hash': content_hash(p)}
+
+
+def make_sink(rows):
+    client = make_client({'CU': CU}, {'promo': rows})
+    return client, StreamingSink(client, 'CU', batch_rows=2, flush_seconds=0.05)
+
+
+def stream(sink, pages):
+    for page in pages:
+        sink.write(page)
+
+
+def saved(client):
+    return {r['title']: r['sale_price'] for r in client.client.rows()}
+
+
+def test_complete_crawl_deletes_unseen_rows():
+    client, sink = make_sink([db_row('콜라'), db_row('단종 상품')])
+    pages = [[promo('콜라', 900), promo('우유')], [promo('빵')]]
+    stream(sink, pages)
+
+    stats = sink.finish(True, [p for page in pages for p in page])
+
+    assert saved(client) == {'콜라': 900, '우유': 1000, '빵': 1000}
+    assert (stats['new'], stats['updated'], stats['deleted']) == (2, 1, 1)
+
+
+def test_incomplete_crawl_keeps_unseen_rows():
+    client, sink = make_sink([db_row('콜라'), db_row('다음 페이지 상품')])
+    page = [promo('콜라'), promo('우유')]
+    stream(sink, [page])
+
+    stats = sink.finish(False, page)
+
+    assert saved(client) == {'콜라': 1000, '다음 페이지 상품': 1000, '우유': 1000}
+    assert stats['deleted'] == 0
+
+
+def test_rows_written_but_missing_from_final_list_are_deleted():
+    client, sink = make_sink([])
+    # 스트리밍 중에 썼지만 최종 목록에서는 빠진 상품 (예: 최종 단계에서 걸러진 중복)
+    stream(sink, [[promo('콜라'), promo('콜라 중복')]])
+
+    sink.finish(True, [promo('콜라')])
+
+    assert saved(client) == {'콜라': 1000}
+
+
+def test_write_failure_is_raised_without_deleting(monkeypatch):
+    client, sink = make_sink([db_row('단종 상품'), db_row('콜라')])
+
+    def update_promotion(*args):
+        raise ConnectionError('down')
+
+    monkeypatch.setattr(client, 'update_promotion', update_promotion)
+    stream(sink, [[promo('콜라', 900), promo('우유')]])
+    with pytest.raises(ConnectionError):
+        sink.finish(True, [promo('콜라', 900), promo('우유')])
+
+    assert '단종 상품' in saved(client)
@@ -0,0 +1,71 @@
+"""
+SupabaseClient 저장 경로 테스트 (가짜 PostgREST)
+- delete_promotions: DB row는 id로, 로컬 스냅샷 row는 브랜드/시작일 범위 안의 제목으로만 삭제
+- save_promotions_with_diff: 크롤링 미완료(allow_delete=False)면 이번에 보이지 않은 row를 지우지 않음
+"""
+from fake_supabase import make_client
+from utils.promotion import content_hash
+
+CU, GS25 = 'brand-cu', 'brand-gs25'
+START_DATE = '2026-10-01'
+
+
+def promo(title, price=1000, start_date=START_DATE):
+    return {'title': title, 'raw_title': title, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': price,
+            'start_date': start_date, 'end_date': '2026-10-31'}
+
+
+def db_row(title, brand_id=CU, start_date=START_DATE, row_id=None):
+    p = promo(title, start_date=start_date)
+    return {'id': row_id or f"{brand_id}-{title}-{start_date}", 'brand_id': brand_id, **p,
+            'content_hash': content_hash(p), 'updated_at': '2026-10-01T00:00:00+00:00'}
+
+
+def titles(client, brand_id=CU, start_date=START_DATE):
+    return sorted(r['title'] for r in client.client.rows() if r['brand_id'] == brand_id and r['start_date'] == start_date)
+
+
+def test_delete_by_id_in_chunks():
+    rows = [db_row(f"상품{i:03d}") for i in range(250)]
+    client = make_client({'CU': CU}, {'promo': rows + [db_row('남길 상품')]})
+
+    client.delete_promotions(CU, START_DATE, rows)
+
+    assert titles(client) == ['남길 상품']
+    assert client.client.requests.count(('promo', 'delete')) == 3
+
+
+def test_delete_by_title_stays_in_brand_and_month():
+    client = make_client({'CU': CU, 'GS25': GS25}, {'promo': [
+        db_row('콜라'), db_row('사이다'),
+        db_row('콜라', brand_id=GS25),
+        db_row('콜라', start_date='2026-09-01'),
+    ]})
+
+    # 로컬 스냅샷 row에는 id가 없음
+    client.delete_promotions(CU, START_DATE, [promo('콜라')])
+
+    assert titles(client) == ['사이다']
+    assert titles(client, brand_id=GS25) == ['콜라']
+    assert titles(client, start_date='2026-09-01') == ['콜라']
+
+
+def test_incomplete_crawl_keeps_unseen_promotions():
+    client = make_client({'CU': CU}, {'promo': [db_row('콜라'), db_row('사이다')]})
+
+    stats = client.save_promotions_with_diff('CU', [promo('콜라', price=900), promo('우유')], allow_delete=False)
+
+    assert stats['deleted'] == 0
+    assert titles(client) == ['사이다', '우유', '콜라']
+
+
+def test_complete_crawl_deletes_unseen_and_bumps_updated_at():
+    client = make_client({'CU': CU}, {'promo': [db_row('콜라'), db_row('사이다')]})
+
+    stats = client.save_promotions_with_diff('CU', [promo('콜라', price=900)])
+
+    assert (stats['updated'], stats['deleted']) == (1, 1)
+    [row] = client.client.rows()
+    assert row['sale_price'] == 900
+    assert row['updated_at'] > '2026-10-01T00:00:00+00:00'
+    assert client.promotions_version(CU, START_DATE) == (1, row['updated_at'])
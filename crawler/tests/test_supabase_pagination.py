@@ -0,0 +1,111 @@
+"""
+iter_existing_promotions keyset 페이지네이션 테스트
+- PostgREST max-rows처럼 응답을 조용히 잘라내는 가짜 쿼리 빌더로 전체 row를 빠짐없이 읽는지 확인
+"""
+import pytest
+from utils.supabase_client import SupabaseClient
+
+BRAND_ID = 'brand-1'
+START_DATE = '2026-10-01'
+
+
+class FakeQuery:
+    """table/select/eq/gt/order/limit/execute만 흉내내는 PostgREST 쿼리 빌더"""
+
+    def __init__(self, table):
+        self.table = table
+        self.filters = []
+        self.order_column = None
+        self.limit_rows = None
+
+    def select(self, columns):
+        self.columns = columns.split(',')
+        return self
+
+    def eq(self, column, value):
+        self.filters.append(lambda row: row[column] == value)
+        return self
+
+    def gt(self, column, value):
+        self.filters.append(lambda row: row[column] > value)
+        return self
+
+    def order(self, column):
+        self.order_column = column
+        return self
+
+    def limit(self, rows):
+        self.limit_rows = rows
+        return self
+
+    def execute(self):
+        rows = [row for row in self.table.rows if all(f(row) for f in self.filters)]
+        if self.order_column:
+            rows.sort(key=lambda row: row[self.order_column])
+        if self.limit_rows is not None:
+            rows = rows[:self.limit_rows]
+        # 서버 max-rows: 요청한 limit보다 작으면 오류 없이 잘라냄
+        rows = rows[:self.table.max_rows]
+        self.table.requests += 1
+        return type('Response', (), {'data': [{c: row[c] for c in self.columns} for row in rows]})()
+
+
+class FakeTable:
+    def __init__(self, rows, max_rows):
+        self.rows = rows
+        self.max_rows = max_rows
+        self.requests = 0
+
+
+class FakePostgrest:
+    def __init__(self, rows, max_rows):
+        self.promo = FakeTable(rows, max_rows)
+
+    def table(self, name):
+        assert name == 'promo'
+        return FakeQuery(self.promo)
+
+
+def make_rows(count, brand_id=BRAND_ID, start_date=START_DATE):
+    return [
+        {'id': f"{brand_id}-{i:05d}", 'brand_id': brand_id, 'start_date': start_date,
+         'title': f"상품 {i}", 'content_hash': f"hash-{i}"}
+        for i in range(count)
+    ]
+
+
+def make_client(rows, max_rows):
+    # __init__은 supabase 패키지와 환경변수가 필요하므로 건너뛰고 가짜 클라이언트만 연결
+    client = SupabaseClient.__new__(SupabaseClient)
+    client.client = FakePostgrest(rows, max_rows)
+    return client
+
+
+@pytest.mark.parametrize('count, max_rows, page_size', [
+    (0, 10, 10),
+    (7, 10, 10),
+    (25, 10, 10),
+    (30, 10, 10),     # cap의 정확한 배수 → 마지막 빈 페이지로 끝을 확인
+    (25, 10, 100),    # page_size가 서버 cap보다 큼
+    (30, 10, 100),
+    (1, 1, 1000),
+])
+def test_iter_existing_promotions_reads_every_row(count, max_rows, page_size):
+    rows = make_rows(count)
+    client = make_client(rows, max_rows)
+
+    result = list(client.iter_existing_promotions(BRAND_ID, START_DATE, page_size=page_size))
+
+    assert [row['id'] for row in result] == [row['id'] for row in rows]
+    # 잘린 페이지 수 + 끝을 확인하는 빈 페이지 1번
+    assert client.client.promo.requests == -(-count // max_rows) + 1
+
+
+def test_iter_existing_promotions_filters_brand_and_date():
+    rows = make_rows(12) + make_rows(5, brand_id='brand-2') + make_rows(4, start_date='2026-09-01')
+    client = make_client(rows, max_rows=5)
+
+    result = list(client.iter_existing_promotions(BRAND_ID, START_DATE, columns='id,title', page_size=5))
+
+    assert [row['id'] for row in result] == [row['id'] for row in rows[:12]]
+    assert set(result[0]) == {'id', 'title'}
@@ -0,0 +1,36 @@
+"""
+상품명 정규화 테스트
+- 전각/괄호/특수 공백 변환, 행사 표기 제거, 단위 표기 통일
+- 용량/묶음 개수 추출, 여러 번 실행해도 같은 결과
+"""
+import pytest
+from utils.title_normalizer import normalize_title, normalize_products
+
+
+@pytest.mark.parametrize('raw, title, volume, unit, pack', [
+    ('코카콜라 ５００ＭＬ（1+1）', '코카콜라 500ml', 500.0, 'ml', 1),
+    ('【2+1】 삼다수 2L', '삼다수 2L', 2000.0, 'ml', 1),
+    ('신라면 120G x5', '신라면 120g x5', 120.0, 'g', 5),
+    ('바나나우유​ 240ml 6입', '바나나우유 240ml 6입', 240.0, 'ml', 6),
+    ('새우깡(증정)', '새우깡', None, None, 1),
+])
+def test_normalize_title(raw, title, volume, unit, pack):
+    normalized = normalize_title(raw)
+    assert (normalized.title, normalized.volume, normalized.volume_unit, normalized.pack_count) == \
+        (title, volume, unit, pack)
+
+
+def test_dedup_key_ignores_spacing_and_symbols():
+    assert normalize_title('코카-콜라 500 ML').dedup_key == normalize_title('코카콜라500ml').dedup_key
+
+
+def test_normalize_products_is_idempotent():
+    products = [{'title': '코카콜라 ５００ＭＬ（1+1）'}]
+
+    normalize_products(products)
+    first = dict(products[0])
+    normalize_products(products)
+
+    assert products[0] == first
+    assert first['raw_title'] == '코카콜라 ５００ＭＬ（1+1）'
+    assert first['title'] == '코카콜라 500ml'
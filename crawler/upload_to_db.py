@@ -1,199 +1,276 @@
 """
 DB 업로드 스크립트
 - 크롤링한 데이터를 Supabase에 저장
-- 사용법: python upload_to_db.py [cu|seven|all]
+- 사용법: python upload_to_db.py <명령> [브랜드] [--resume]
+  crawl <브랜드>: 크롤링 + 로컬 백업만 (DB 연결 없음)
+  upload <브랜드|all>: 크롤링 후 DB 저장 (기본 명령)
+  diff <브랜드|all>: DB에 쓰지 않고 이전 스냅샷 대비 변경사항만 미리보기 (= upload --dry-run)
+  export: 이번 달 정적 JSON 샤드 내보내기 (크롤링 없음)
+  compare: 이번 달 브랜드 간 가격 비교 그룹 재계산 (크롤링 없음)
+  search-index: 이번 달 검색 색인 재생성 (크롤링 없음)
+  daemon: 종료할 때까지 DAEMON_SCHEDULE 일정대로 반복 실행 (상태: GET http://127.0.0.1:8787/status)
+  --resume: 중단된 크롤링을 마지막 체크포인트부터 이어서 진행
+            (CU/세븐일레븐은 빠진 페이지와 data/dead_letter/<브랜드>.jsonl에 남은 페이지/상세 요청도 다시 시도)
+- 이전 형식도 그대로 동작: python upload_to_db.py [cu|seven|gs25|emart24|all] [--resume] [--dry-run]
+- 크롤러(selenium, BeautifulSoup 등)와 supabase는 실제로 필요한 명령/브랜드에서만 import
+  (import 시간 측정: python -m utils.import_bench)
 """
 import sys
 import json
 import os
+import functools
 from datetime import datetime
-from crawlers.cu_crawler import CUCrawler
-from crawlers.seveneleven_crawler import SevenElevenCrawler
-from crawlers.gs25_crawler import GS25Crawler
-from crawlers.emart24_crawler import Emart24Crawler
-from utils.supabase_client import SupabaseClient
-from utils.logger import setup_logger
+from crawlers.registry import REGISTRY, BrandSpec, brands, get_spec, load_crawler
+from utils.logger import setup_logger, log_context
+from utils.backup import BackupWriter
+from utils.snapshot_diff import diff_snapshots, load_previous_snapshot, mark_synced
+from utils.local_mirror import LocalMirror
+from utils.supabase_client import get_client
+from utils.price_compare import refresh_compare_groups
+from utils.search_index import refresh_search_index
+from utils.static_export import refresh_static_export
+from utils.promo_summary import update_summaries
+from utils.near_duplicate import dedupe_promotions
+from utils.pipeline import Pipeline
+from utils.streaming_sink import StreamingSink
+import config
 
 logger = setup_logger("upload_to_db")
 
-# JSON 저장 디렉토리
-DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+# 백업/체크포인트 저장 디렉토리
+DATA_DIR = config.DATA_DIR
 os.makedirs(DATA_DIR, exist_ok=True)
 
-def upload_cu():
-    """CU 데이터 크롤링 및 DB 저장"""
+def load_previous(brand_name: str, brand_key: str, start_date: str):
+    """마지막으로 DB에 반영한 스냅샷 (로컬 미러 우선, 없으면 sync 마커가 있는 백업)"""
+    mirror = LocalMirror()
+    try:
+        return mirror.load_snapshot(brand_name, start_date) or load_previous_snapshot(brand_key, start_date)
+    finally:
+        mirror.close()
+
+def save_brand(brand_name: str, brand_key: str, products: list, backup_path: str, dry_run: bool = False,
+               sink: StreamingSink = None, complete: bool = True) -> dict:
+    """
+    크롤링 결과를 DB에 저장 (로컬 미러 또는 이전 실행의 백업과 로컬 diff)
+
+    Args:
+        brand_name: 브랜드명 (예: "CU")
+        brand_key: 백업 파일용 브랜드 키 (예: "cu")
+        products: 크롤링한 프로모션 리스트
+        backup_path: 이번 실행의 백업 경로
+        dry_run: True면 DB에 쓰지 않고 로컬 diff 결과만 출력
+        sink: 크롤링 중 이미 페이지 단위로 쓰고 있던 스트리밍 sink (있으면 마무리만)
+        complete: 크롤링이 끝까지 완료되었는지 (False면 삭제/기준 스냅샷 갱신 생략)
+
+    Returns:
+        save_promotions_with_diff 통계
+    """
+    start_date = products[0].get('start_date') if products else None
+    previous = load_previous(brand_name, brand_key, start_date) if start_date else None
+
+    if dry_run:
+        if previous is None:
+            logger.warning(f"{brand_name}: 이전 스냅샷이 없어 모든 상품이 신규로 표시됩니다")
+        changes = diff_snapshots(previous or {}, products)
+        for label, items in [('신규', changes.added), ('업데이트', changes.updated), ('삭제', changes.deleted)]:
+            preview = ', '.join(p.get('title') or '' for p in list(items.values())[:5])
+            logger.info(f"[dry-run] {label} {len(items)}개: {preview}")
+        return changes.stats()
+
+    logger.info(f"Supabase에 저장 중... (mode: {'stream' if sink else config.SYNC_MODE})")
+    if sink is not None:
+        stats = sink.finish(complete, products)
+    elif not complete:
+        # 크롤링이 중간에 실패했으면 보이지 않은 기존 행사를 지우지 않도록 diff 경로로 저장 (삭제 생략)
+        stats = get_client().save_promotions_with_diff(brand_name, products, previous=previous, allow_delete=False)
+    elif config.SYNC_MODE == 'copy':
+        from utils.pg_backend import PostgresCopyBackend
+        backend = PostgresCopyBackend()
+        try:
+            stats = backend.save_promotions(brand_name, products)
+        finally:
+            backend.close()
+    elif config.SYNC_MODE == 'rpc':
+        stats = get_client().save_promotions_via_rpc(brand_name, products)
+    else:
+        stats = get_client().save_promotions_with_diff(brand_name, products, previous=previous)
+
+    # 다음 실행에서 DB 조회 없이 diff 할 수 있도록 기준 스냅샷 기록
+    # (미완료 크롤링은 DB에 이전 행사가 남아 있으므로 기준 스냅샷/미러/집계를 갱신하지 않음)
+    if products and not complete:
+        logger.warning(f"{brand_name}: 크롤링 미완료 - 기준 스냅샷, 로컬 미러, 집계 갱신 생략 (--resume으로 재시도)")
+    elif products:
+        mirror = LocalMirror()
+        try:
+            # 집계를 기준 스냅샷보다 먼저 갱신 (스냅샷을 먼저 바꾸고 집계가 실패/중단되면 다음 diff에서 이번 변경이 빠짐)
+            # 실패하면 미러에 기록해 두고 다음 실행에서 전체 그룹 재계산
+            try:
+                pending = mirror.summary_pending(brand_name, start_date)
+                changes = diff_snapshots(previous, products) if previous is not None and not pending else None
+                first_seen = mirror.first_seen(brand_name, start_date, products)
+                update_summaries(get_client(), brand_name, start_date, products, changes, first_seen)
+                mirror.set_summary_pending(brand_name, start_date, False)
+            except Exception as e:
+                logger.error(f"✗ 집계 갱신 실패 (다음 실행에서 전체 재계산): {e}")
+                mirror.set_summary_pending(brand_name, start_date, True)
+
+            # 저장 직후 DB의 max(updated_at)를 함께 기록 → 다음 실행에서 다른 경로의 DB 변경이 있었는지 확인
+            brand_id = get_client().get_brand_id(brand_name)
+            _, db_updated_at = get_client().promotions_version(brand_id, start_date)
+            mark_synced(brand_key, backup_path, start_date, stats['total'], db_updated_at)
+            mirror.sync(brand_name, start_date, products, brand_id, db_updated_at)
+        finally:
+            mirror.close()
+    return stats
+
+def crawl_stage(spec: BrandSpec, resume: bool = False, crawler_kwargs: dict = None, stream: bool = False) -> tuple:
+    """
+    브랜드 크롤링 + 압축 NDJSON 백업 (페이지 단위 스트리밍)
+
+    Args:
+        spec: 브랜드 레지스트리 항목
+        resume: True면 마지막 체크포인트부터 이어서 크롤링
+        crawler_kwargs: 크롤러 생성 인자 (데몬 모드의 warm 세션/브라우저 풀)
+        stream: True면 크롤링 중 페이지 단위로 DB에 쓰기 (StreamingSink, 삭제는 저장 단계에서)
+
+    Returns:
+        (spec, crawler, products, backup_report, sink)
+    """
     logger.info("=" * 60)
-    logger.info("CU 데이터 업로드 시작")
+    logger.info(f"{spec.label} 데이터 업로드 시작")
     logger.info("=" * 60)
 
     try:
-        # JSON 파일 경로
-        json_file = os.path.join(DATA_DIR, 'cu_products.json')
-
-        # 1. 크롤링
-        logger.info("CU 크롤링 시작...")
-        crawler = CUCrawler()
-        products = crawler.run()
+        logger.info(f"{spec.label} 크롤링 시작...")
+        crawler = load_crawler(spec.key)(**(crawler_kwargs or {}))
+        backup = BackupWriter(spec.key)
+        sink = None
+        # 근사 중복을 제거하면 백업/동기화 마커/DB가 같은 목록이 되도록 제거 후에 한 번에 백업
+        # (스트리밍 저장은 페이지마다 이미 DB에 쓰므로 제거하지 않고 리포트만)
+        remove_duplicates = config.NEAR_DUPLICATE_REMOVE and not stream
+        if not remove_duplicates:
+            crawler.add_page_listener(backup.write)
+        if stream:
+            start_date = datetime.now().replace(day=1).strftime('%Y-%m-%d')
+            sink = StreamingSink(get_client(), spec.brand_name, load_previous(spec.brand_name, spec.key, start_date))
+            crawler.add_page_listener(sink.write)
+        try:
+            products = crawler.run(resume=resume)
+        except Exception:
+            if sink:
+                sink.close()
+            raise
+        # 표기만 다른 같은 행사 탐지 (MinHash/LSH 근사 중복, 기본값은 리포트만)
+        products = dedupe_promotions(spec.key, products, remove=remove_duplicates)
+        if remove_duplicates:
+            backup.write(products)
+        backup_report = backup.close()
         logger.info(f"크롤링 완료: {len(products)}개 상품")
-
-        # 2. JSON 파일로 백업 저장
-        logger.info(f"JSON 파일로 저장 중: {json_file}")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ JSON 저장 완료")
-
-        # 3. DB 저장 (변경사항 감지)
-        logger.info("Supabase에 저장 중...")
-        client = SupabaseClient()
-        stats = client.save_promotions_with_diff("CU", products)
-
-        logger.info("=" * 60)
-        logger.info(f"✓ CU 업로드 완료")
-        logger.info(f"  신규: {stats['new']}개, 업데이트: {stats['updated']}개, 삭제: {stats['deleted']}개")
-        logger.info("=" * 60)
-
-        # GitHub Actions 파싱용 JSON 출력
-        result_json = json.dumps({'CU': stats})
-        print(f"CRAWLER_RESULTS={result_json}")
-        logger.info(f"CRAWLER_RESULTS={result_json}")
-
-        return stats
+        logger.info(f"✓ 백업 저장 완료: {backup_report['path']} "
+                    f"({backup_report['rows_per_sec']} rows/s, 용량 {backup_report['saved_ratio']:.1%} 절감)")
+        return spec, crawler, products, backup_report, sink
 
     except Exception as e:
-        logger.error(f"✗ CU 업로드 실패: {e}")
+        logger.error(f"✗ {spec.label} 업로드 실패: {e}")
         raise
 
-def upload_seven():
-    """세븐일레븐 데이터 크롤링 및 DB 저장"""
-    logger.info("=" * 60)
-    logger.info("세븐일레븐 데이터 업로드 시작")
-    logger.info("=" * 60)
-
+def save_stage(spec: BrandSpec, crawler, products: list, backup_report: dict, sink: StreamingSink = None,
+               dry_run: bool = False) -> dict:
+    """
+    크롤링 결과 DB 저장 + 체크포인트 정리 + 결과 출력
+
+    Args:
+        spec: 브랜드 레지스트리 항목
+        crawler: 크롤링에 사용한 크롤러 (체크포인트 정리, 완료 여부 확인용)
+        products: 크롤링한 프로모션 리스트
+        backup_report: 이번 실행의 백업 리포트
+        sink: 크롤링 중 쓰고 있던 스트리밍 sink
+        dry_run: True면 DB에 쓰지 않고 변경사항만 출력
+
+    Returns:
+        save_brand 통계
+    """
+    with log_context(brand=spec.brand_name):
+        try:
+            # DB 저장 (변경사항 감지, 이전 백업 스냅샷 우선 사용)
+            complete = crawler.is_complete()
+            stats = save_brand(spec.brand_name, spec.key, products, backup_report['path'], dry_run=dry_run,
+                               sink=sink, complete=complete)
+
+            # DB 저장까지 끝났으므로 체크포인트 삭제 (미완료면 --resume 할 수 있도록 유지)
+            if crawler.checkpoint and complete and not dry_run:
+                crawler.checkpoint.clear()
+
+            logger.info("=" * 60)
+            logger.info(f"✓ {spec.label} 업로드 완료")
+            logger.info(f"  신규: {stats['new']}개, 업데이트: {stats['updated']}개, 삭제: {stats['deleted']}개")
+            logger.info("=" * 60)
+
+            # GitHub Actions 파싱용 JSON 출력
+            result_json = json.dumps({spec.brand_name: stats})
+            print(f"CRAWLER_RESULTS={result_json}")
+            logger.info(f"CRAWLER_RESULTS={result_json}")
+
+            return stats
+
+        except Exception as e:
+            logger.error(f"✗ {spec.label} 업로드 실패: {e}")
+            raise
+
+def streaming_enabled(dry_run: bool) -> bool:
+    """크롤링 중 페이지 단위 DB 쓰기 여부 (diff 모드에서만, dry-run 제외)"""
+    return config.STREAMING_UPLOAD and config.SYNC_MODE == 'diff' and not dry_run
+
+def upload_brand(brand_key: str, resume: bool = False, dry_run: bool = False, crawler_kwargs: dict = None) -> dict:
+    """
+    브랜드 하나 크롤링 및 DB 저장
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+        resume: True면 마지막 체크포인트부터 이어서 크롤링
+        dry_run: True면 DB에 쓰지 않고 변경사항만 출력
+        crawler_kwargs: 크롤러 생성 인자 (데몬 모드)
+
+    Returns:
+        save_brand 통계
+    """
+    crawled = crawl_stage(get_spec(brand_key), resume=resume, crawler_kwargs=crawler_kwargs,
+                          stream=streaming_enabled(dry_run))
+    return save_stage(*crawled, dry_run=dry_run)
+
+def refresh_derived():
+    """이번 달 전체 브랜드 기준 파생 데이터 재생성 (가격 비교 그룹, 검색 색인, 정적 JSON)"""
     try:
-        # JSON 파일 경로
-        json_file = os.path.join(DATA_DIR, 'seven_products.json')
-
-        # 1. 크롤링
-        logger.info("세븐일레븐 크롤링 시작...")
-        crawler = SevenElevenCrawler()
-        products = crawler.run()
-        logger.info(f"크롤링 완료: {len(products)}개 상품")
-
-        # 2. JSON 파일로 백업 저장
-        logger.info(f"JSON 파일로 저장 중: {json_file}")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ JSON 저장 완료")
-
-        # 3. DB 저장 (변경사항 감지)
-        logger.info("Supabase에 저장 중...")
-        client = SupabaseClient()
-        stats = client.save_promotions_with_diff("SevenEleven", products)
-
-        logger.info("=" * 60)
-        logger.info(f"✓ 세븐일레븐 업로드 완료")
-        logger.info(f"  신규: {stats['new']}개, 업데이트: {stats['updated']}개, 삭제: {stats['deleted']}개")
-        logger.info("=" * 60)
-
-        # GitHub Actions 파싱용 JSON 출력
-        result_json = json.dumps({'SevenEleven': stats})
-        print(f"CRAWLER_RESULTS={result_json}")
-        logger.info(f"CRAWLER_RESULTS={result_json}")
-
-        return stats
-
+        refresh_compare_groups(get_client())
     except Exception as e:
-        logger.error(f"✗ 세븐일레븐 업로드 실패: {e}")
-        raise
-
-def upload_gs25():
-    """GS25 데이터 크롤링 및 DB 저장"""
-    logger.info("=" * 60)
-    logger.info("GS25 데이터 업로드 시작")
-    logger.info("=" * 60)
-
+        logger.error(f"✗ 가격 비교 그룹 계산 실패: {e}")
     try:
-        # JSON 파일 경로
-        json_file = os.path.join(DATA_DIR, 'gs25_products.json')
-
-        # 1. 크롤링
-        logger.info("GS25 크롤링 시작...")
-        crawler = GS25Crawler()
-        products = crawler.run()
-        logger.info(f"크롤링 완료: {len(products)}개 상품")
-
-        # 2. JSON 파일로 백업 저장
-        logger.info(f"JSON 파일로 저장 중: {json_file}")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ JSON 저장 완료")
-
-        # 3. DB 저장 (변경사항 감지)
-        logger.info("Supabase에 저장 중...")
-        client = SupabaseClient()
-        stats = client.save_promotions_with_diff("GS25", products)
-
-        logger.info("=" * 60)
-        logger.info(f"✓ GS25 업로드 완료")
-        logger.info(f"  신규: {stats['new']}개, 업데이트: {stats['updated']}개, 삭제: {stats['deleted']}개")
-        logger.info("=" * 60)
-
-        # GitHub Actions 파싱용 JSON 출력
-        result_json = json.dumps({'GS25': stats})
-        print(f"CRAWLER_RESULTS={result_json}")
-        logger.info(f"CRAWLER_RESULTS={result_json}")
-
-        return stats
-
+        refresh_search_index(get_client())
     except Exception as e:
-        logger.error(f"✗ GS25 업로드 실패: {e}")
-        raise
-
-def upload_emart24():
-    """이마트24 데이터 크롤링 및 DB 저장"""
-    logger.info("=" * 60)
-    logger.info("이마트24 데이터 업로드 시작")
-    logger.info("=" * 60)
-
+        logger.error(f"✗ 검색 색인 생성 실패: {e}")
     try:
-        # JSON 파일 경로
-        json_file = os.path.join(DATA_DIR, 'emart24_products.json')
-
-        # 1. 크롤링
-        logger.info("이마트24 크롤링 시작...")
-        crawler = Emart24Crawler()
-        products = crawler.run()
-        logger.info(f"크롤링 완료: {len(products)}개 상품")
-
-        # 2. JSON 파일로 백업 저장
-        logger.info(f"JSON 파일로 저장 중: {json_file}")
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(products, f, ensure_ascii=False, indent=2)
-        logger.info(f"✓ JSON 저장 완료")
-
-        # 3. DB 저장 (변경사항 감지)
-        logger.info("Supabase에 저장 중...")
-        client = SupabaseClient()
-        stats = client.save_promotions_with_diff("Emart24", products)
-
-        logger.info("=" * 60)
-        logger.info(f"✓ 이마트24 업로드 완료")
-        logger.info(f"  신규: {stats['new']}개, 업데이트: {stats['updated']}개, 삭제: {stats['deleted']}개")
-        logger.info("=" * 60)
+        refresh_static_export(get_client())
+    except Exception as e:
+        logger.error(f"✗ 정적 JSON 내보내기 실패: {e}")
 
-        # GitHub Actions 파싱용 JSON 출력
-        result_json = json.dumps({'Emart24': stats})
-        print(f"CRAWLER_RESULTS={result_json}")
-        logger.info(f"CRAWLER_RESULTS={result_json}")
+def run_daemon():
+    """데몬 모드: 브랜드별 cron 일정으로 업로드 반복 (warm 세션/브라우저 풀 재사용)"""
+    from utils.daemon import CrawlDaemon
 
-        return stats
+    daemon = CrawlDaemon()
+    for spec in brands():
+        daemon.add_job(spec.key, functools.partial(upload_brand, spec.key), session=True, browser=spec.browser)
+    daemon.add_job('refresh', refresh_derived)
+    daemon.run()
 
-    except Exception as e:
-        logger.error(f"✗ 이마트24 업로드 실패: {e}")
-        raise
+def upload_all(resume: bool = False, dry_run: bool = False):
+    """
+    모든 편의점 데이터 업로드
 
-def upload_all():
-    """모든 편의점 데이터 업로드"""
+    크롤링과 DB 저장을 파이프라인으로 겹쳐 실행 (한 브랜드를 저장하는 동안 다음 브랜드 크롤링).
+    단계 사이 큐 크기(PIPELINE_QUEUE_SIZE)만큼만 크롤링 결과를 메모리에 쌓아 둠.
+    """
     logger.info("=" * 60)
     logger.info("전체 편의점 데이터 업로드 시작")
     logger.info("=" * 60)
@@ -201,33 +278,23 @@ def upload_all():
     total_stats = {'new': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
     results = {}
 
+    def save(crawled: tuple) -> tuple:
+        spec = crawled[0]
+        return spec, save_stage(*crawled, dry_run=dry_run)
+
     try:
-        # CU
-        cu_stats = upload_cu()
-        results['CU'] = cu_stats
-        for key in total_stats:
-            total_stats[key] += cu_stats.get(key, 0)
-        print()
-
-        # 세븐일레븐
-        seven_stats = upload_seven()
-        results['SevenEleven'] = seven_stats
-        for key in total_stats:
-            total_stats[key] += seven_stats.get(key, 0)
-        print()
-
-        # GS25
-        gs25_stats = upload_gs25()
-        results['GS25'] = gs25_stats
-        for key in total_stats:
-            total_stats[key] += gs25_stats.get(key, 0)
-        print()
-
-        # 이마트24
-        emart24_stats = upload_emart24()
-        results['Emart24'] = emart24_stats
-        for key in total_stats:
-            total_stats[key] += emart24_stats.get(key, 0)
+        pipeline = Pipeline(
+            [('crawl', lambda spec: crawl_stage(spec, resume=resume, stream=streaming_enabled(dry_run))), ('save', save)],
+            queue_size=config.PIPELINE_QUEUE_SIZE,
+        )
+        for spec, stats in pipeline.run(brands()):
+            results[spec.brand_name] = stats
+            for key in total_stats:
+                total_stats[key] += stats.get(key, 0)
+
+        # 브랜드 간 가격 비교 그룹, 검색 색인, 정적 내보내기 (실패해도 업로드 결과에는 영향 없음)
+        if not dry_run:
+            refresh_derived()
 
         logger.info("=" * 60)
         logger.info(f"✓ 전체 업로드 완료")
@@ -248,23 +315,74 @@ def upload_all():
         logger.error(f"✗ 업로드 중 오류 발생: {e}")
         raise
 
-if __name__ == '__main__':
-    if len(sys.argv) > 1:
-        target = sys.argv[1].lower()
-
-        if target == 'cu':
-            upload_cu()
-        elif target == 'seven':
-            upload_seven()
-        elif target == 'gs25':
-            upload_gs25()
-        elif target == 'emart24':
-            upload_emart24()
-        elif target == 'all':
-            upload_all()
+def crawl_brand(brand_key: str, resume: bool = False) -> dict:
+    """
+    크롤링 + 로컬 백업만 실행 (DB 연결 없음)
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+        resume: True면 마지막 체크포인트부터 이어서 크롤링
+
+    Returns:
+        백업 리포트
+    """
+    _, _, _, backup_report, _ = crawl_stage(get_spec(brand_key), resume=resume)
+    return backup_report
+
+def main(argv: list) -> int:
+    """
+    CLI 진입점
+
+    Args:
+        argv: 명령행 인자 (sys.argv[1:])
+
+    Returns:
+        종료 코드
+    """
+    import argparse
+
+    # 이전 형식 호환: "cu --dry-run" → "upload cu --dry-run", 인자 없음 → "upload all"
+    positional = [arg for arg in argv if not arg.startswith('--')]
+    if not positional:
+        argv = ['upload', 'all'] + argv
+    elif positional[0].lower() in REGISTRY or positional[0].lower() == 'all':
+        argv = ['upload'] + argv
+
+    parser = argparse.ArgumentParser(prog='upload_to_db.py', description='편의점 행사 크롤링 / DB 업로드')
+    commands = parser.add_subparsers(dest='command', required=True)
+    crawl = commands.add_parser('crawl', help='크롤링 + 로컬 백업만 (DB 연결 없음)')
+    crawl.add_argument('brand', type=str.lower, choices=list(REGISTRY))
+    crawl.add_argument('--resume', action='store_true')
+    upload = commands.add_parser('upload', help='크롤링 후 DB 저장')
+    upload.add_argument('brand', type=str.lower, choices=list(REGISTRY) + ['all'], nargs='?', default='all')
+    upload.add_argument('--resume', action='store_true')
+    upload.add_argument('--dry-run', action='store_true')
+    diff = commands.add_parser('diff', help='DB에 쓰지 않고 변경사항 미리보기')
+    diff.add_argument('brand', type=str.lower, choices=list(REGISTRY) + ['all'], nargs='?', default='all')
+    diff.add_argument('--resume', action='store_true')
+    commands.add_parser('export', help='이번 달 정적 JSON 샤드 내보내기')
+    commands.add_parser('compare', help='이번 달 가격 비교 그룹 재계산')
+    commands.add_parser('search-index', help='이번 달 검색 색인 재생성')
+    commands.add_parser('daemon', help='일정대로 반복 실행')
+    args = parser.parse_args([argv[0].lower()] + argv[1:])
+
+    if args.command == 'crawl':
+        crawl_brand(args.brand, resume=args.resume)
+    elif args.command in ('upload', 'diff'):
+        dry_run = args.command == 'diff' or args.dry_run
+        if args.brand == 'all':
+            upload_all(resume=args.resume, dry_run=dry_run)
         else:
-            print("Usage: python upload_to_db.py [cu|seven|gs25|emart24|all]")
-            sys.exit(1)
-    else:
-        # 기본: 전체 업로드
-        upload_all()
+            upload_brand(args.brand, resume=args.resume, dry_run=dry_run)
+    elif args.command == 'export':
+        refresh_static_export(get_client())
+    elif args.command == 'compare':
+        refresh_compare_groups(get_client())
+    elif args.command == 'search-index':
+        refresh_search_index(get_client())
+    elif args.command == 'daemon':
+        run_daemon()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
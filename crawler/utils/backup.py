@@ -0,0 +1,202 @@
+"""
+크롤링 결과 백업 유틸리티
+- 크롤링 중 페이지 단위로 압축 NDJSON(gzip/zstd) 스트리밍 저장
+- 실행마다 타임스탬프 파일로 저장하고 오래된 백업은 정리 (rotation)
+- 백업 재로딩용 리더 제공
+"""
+import glob
+import gzip
+import io
+import json
+import os
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Iterator, Optional
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("backup")
+
+EXTENSIONS = {
+    'gzip': '.ndjson.gz',
+    'zstd': '.ndjson.zst',
+}
+
+
+def _zstd():
+    """zstandard 모듈 (선택 의존성)"""
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+
+def backup_pattern(brand_key: str) -> str:
+    """브랜드 백업 파일 glob 패턴 (예: data/cu_products_*.ndjson.*)"""
+    return os.path.join(config.DATA_DIR, f"{brand_key}_products_*.ndjson.*")
+
+
+def sync_marker_path(brand_key: str) -> str:
+    """DB 동기화 완료 마커 경로 (마지막으로 DB에 반영한 백업 기록)"""
+    return os.path.join(config.DATA_DIR, f"{brand_key}_synced.json")
+
+
+def synced_backup_name(brand_key: str) -> Optional[str]:
+    """마지막으로 DB에 반영한 백업 파일명 (없으면 None)"""
+    path = sync_marker_path(brand_key)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('backup')
+
+
+class BackupWriter:
+    """압축 NDJSON 스트리밍 백업 작성기"""
+
+    def __init__(self, brand_key: str, compression: str = None):
+        """
+        Args:
+            brand_key: 파일명용 브랜드 키 (예: "cu", "seven")
+            compression: 'gzip' 또는 'zstd' (기본값: config.BACKUP_COMPRESSION)
+        """
+        compression = compression or config.BACKUP_COMPRESSION
+        if compression == 'zstd' and _zstd() is None:
+            logger.warning("zstandard is not installed, falling back to gzip backups")
+            compression = 'gzip'
+        if compression not in EXTENSIONS:
+            raise ValueError(f"Unsupported backup compression: {compression}")
+
+        self.brand_key = brand_key
+        self.compression = compression
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        self.path = os.path.join(config.DATA_DIR, f"{brand_key}_products_{timestamp}{EXTENSIONS[compression]}")
+        # 완료 전에는 .partial로 기록 → 중간에 죽은 백업이 최신 백업으로 읽히지 않도록
+        self._partial_path = self.path + '.partial'
+
+        self.rows = 0
+        self.raw_bytes = 0
+        self._write_seconds = 0.0
+
+        os.makedirs(config.DATA_DIR, exist_ok=True)
+        self._raw = open(self._partial_path, 'wb')
+        if compression == 'zstd':
+            self._stream = _zstd().ZstdCompressor(level=3).stream_writer(self._raw)
+        else:
+            self._stream = gzip.GzipFile(fileobj=self._raw, mode='wb', compresslevel=6)
+
+    def write(self, products: List[Dict[str, Any]]):
+        """
+        상품 목록을 NDJSON 줄로 추가 (크롤러 페이지 리스너로 사용)
+
+        Args:
+            products: 페이지 단위 상품 리스트
+        """
+        if not products:
+            return
+        started = time.perf_counter()
+        chunk = ''.join(json.dumps(p, ensure_ascii=False) + '\n' for p in products).encode('utf-8')
+        self._stream.write(chunk)
+        self._write_seconds += time.perf_counter() - started
+        self.rows += len(products)
+        self.raw_bytes += len(chunk)
+
+    def close(self) -> Dict[str, Any]:
+        """
+        백업 완료 및 오래된 백업 정리
+
+        Returns:
+            {
+                'path': 'data/cu_products_20251020_020000.ndjson.gz',
+                'rows': 2400,
+                'raw_bytes': 1200000,     # 압축 전 NDJSON 크기
+                'file_bytes': 150000,     # 압축 후 파일 크기
+                'saved_ratio': 0.875,     # 1 - file_bytes / raw_bytes
+                'rows_per_sec': 85000.0,  # 직렬화+압축 처리량
+                'mb_per_sec': 40.0
+            }
+        """
+        self._stream.close()
+        if not self._raw.closed:
+            self._raw.close()
+        os.replace(self._partial_path, self.path)
+        self._rotate()
+
+        file_bytes = os.path.getsize(self.path)
+        seconds = self._write_seconds or 1e-9
+        report = {
+            'path': self.path,
+            'rows': self.rows,
+            'raw_bytes': self.raw_bytes,
+            'file_bytes': file_bytes,
+            'saved_ratio': round(1 - file_bytes / self.raw_bytes, 3) if self.raw_bytes else 0.0,
+            'rows_per_sec': round(self.rows / seconds, 1),
+            'mb_per_sec': round(self.raw_bytes / seconds / 1_000_000, 2),
+        }
+        logger.info(
+            f"Backup written: {self.path} ({self.rows} rows, {self.raw_bytes} -> {file_bytes} bytes, "
+            f"saved {report['saved_ratio']:.1%}, {report['rows_per_sec']} rows/s)"
+        )
+        return report
+
+    def _rotate(self):
+        """최근 config.BACKUP_KEEP개만 남기고 오래된 백업 삭제 (DB 동기화 기준 백업은 유지)"""
+        synced = synced_backup_name(self.brand_key)
+        paths = sorted(p for p in glob.glob(backup_pattern(self.brand_key)) if not p.endswith('.partial'))
+        for old_path in paths[:-config.BACKUP_KEEP]:
+            if os.path.basename(old_path) == synced:
+                continue
+            os.remove(old_path)
+            logger.info(f"Removed old backup: {old_path}")
+
+
+def read_backup(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    백업 파일 스트리밍 로드
+
+    Args:
+        path: BackupWriter로 만든 백업 파일 경로
+
+    Yields:
+        상품 데이터 딕셔너리
+    """
+    if path.endswith('.zst'):
+        zstandard = _zstd()
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read {path}")
+        with open(path, 'rb') as raw:
+            reader = io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(raw))
+            for line in reader:
+                yield json.loads(line)
+    else:
+        with gzip.open(path, 'rb') as f:
+            for line in f:
+                yield json.loads(line)
+
+
+def list_backups(brand_key: str) -> List[str]:
+    """
+    완료된 백업 목록 (오래된 순)
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+
+    Returns:
+        백업 파일 경로 리스트
+    """
+    return sorted(p for p in glob.glob(backup_pattern(brand_key)) if not p.endswith('.partial'))
+
+
+def latest_backup(brand_key: str, exclude: str = None) -> Optional[str]:
+    """
+    가장 최근 백업 경로
+
+    Args:
+        brand_key: 브랜드 키
+        exclude: 제외할 경로 (이번 실행에서 만든 백업 등)
+
+    Returns:
+        백업 경로 (없으면 None)
+    """
+    paths = [p for p in list_backups(brand_key) if p != exclude]
+    return paths[-1] if paths else None
@@ -0,0 +1,153 @@
+"""
+배치 INSERT 유틸리티
+- 제한된 동시성(스레드 풀)으로 배치 INSERT를 병렬 전송
+- payload 크기와 관측된 지연 시간으로 배치 크기 자동 조절
+- 실패한 배치는 같은 id로 재전송 (upsert + ignore_duplicates → 중복 삽입 없음)
+- 통계의 rows는 서버가 돌려준 실제 INSERT row 수 (이미 있던 id는 무시되므로 보낸 row 수와 다를 수 있음)
+"""
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import List, Dict, Any
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("batch_writer")
+
+
+class BatchWriter:
+    """동시 배치 INSERT 작성기"""
+
+    def __init__(self, client, table: str = 'promo', max_workers: int = None,
+                 target_bytes: int = None, target_latency: float = None,
+                 min_batch: int = 20, max_batch: int = 500, initial_batch: int = 100):
+        """
+        Args:
+            client: supabase Client
+            table: 대상 테이블명
+            max_workers: 동시에 전송할 배치 수 (기본값: config.DB_WRITE_CONCURRENCY)
+            target_bytes: 배치당 최대 payload 크기 (기본값: config.DB_BATCH_TARGET_BYTES)
+            target_latency: 배치당 목표 응답 시간(초) (기본값: config.DB_BATCH_TARGET_LATENCY)
+            min_batch: 최소 배치 크기
+            max_batch: 최대 배치 크기
+            initial_batch: 시작 배치 크기
+        """
+        self.client = client
+        self.table = table
+        self.max_workers = max_workers or config.DB_WRITE_CONCURRENCY
+        self.target_bytes = target_bytes or config.DB_BATCH_TARGET_BYTES
+        self.target_latency = target_latency or config.DB_BATCH_TARGET_LATENCY
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.batch_size = initial_batch
+        self._lock = threading.Lock()
+
+    def _adapt(self, latency: float):
+        """관측된 지연 시간으로 다음 배치 크기 조절 (느리면 절반, 빠르면 25% 증가)"""
+        with self._lock:
+            if latency > self.target_latency:
+                self.batch_size = max(self.min_batch, self.batch_size // 2)
+            elif latency < self.target_latency / 2:
+                self.batch_size = min(self.max_batch, int(self.batch_size * 1.25) + 1)
+
+    def _send(self, batch: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        배치 전송 (실패 시 지수 백오프로 재시도)
+
+        Returns:
+            {'rows': 98, 'submitted': 100, 'retries': 0} (rows: 실제로 INSERT된 row 수)
+        """
+        for attempt in range(config.MAX_RETRIES):
+            try:
+                started = time.perf_counter()
+                # 같은 id로 재전송해도 이미 들어간 row는 무시되므로 재시도가 멱등
+                # representation: ON CONFLICT DO NOTHING으로 건너뛴 row는 응답에 없음 → 실제 INSERT 수
+                response = self.client.table(self.table).upsert(
+                    batch, on_conflict='id', ignore_duplicates=True, returning='representation',
+                ).execute()
+                self._adapt(time.perf_counter() - started)
+                return {'rows': len(response.data or []), 'submitted': len(batch), 'retries': attempt}
+            except Exception as e:
+                logger.warning(f"Batch of {len(batch)} rows failed (attempt {attempt + 1}/{config.MAX_RETRIES}): {e}")
+                if attempt == config.MAX_RETRIES - 1:
+                    raise
+                time.sleep(2 ** attempt)
+
+    def _batches(self, rows: List[Dict[str, Any]]):
+        """현재 배치 크기와 payload 크기 한도로 배치 생성"""
+        batch, batch_bytes = [], 0
+        for row in rows:
+            row_bytes = len(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8'))
+            if batch and (len(batch) >= self.batch_size or batch_bytes + row_bytes > self.target_bytes):
+                yield batch
+                batch, batch_bytes = [], 0
+            batch.append(row)
+            batch_bytes += row_bytes
+        if batch:
+            yield batch
+
+    def insert(self, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        row 목록을 동시 배치로 INSERT
+
+        배치 간 순서는 보장하지 않음 (diff 결과의 신규 row끼리는 서로 독립적)
+
+        Args:
+            rows: INSERT할 row 리스트 (id가 없으면 생성해서 채움)
+
+        Returns:
+            {
+                'rows': 2400,          # 실제로 INSERT된 row 수 (이미 있던 id 제외)
+                'submitted': 2400,     # 전송한 row 수
+                'batches': 20,
+                'retries': 1,
+                'seconds': 3.2,
+                'rows_per_sec': 750.0  # INSERT된 row 기준
+            }
+        """
+        stats = {'rows': 0, 'submitted': 0, 'batches': 0, 'retries': 0, 'seconds': 0.0, 'rows_per_sec': 0.0}
+        if not rows:
+            return stats
+
+        for row in rows:
+            row.setdefault('id', str(uuid.uuid4()))
+
+        started = time.perf_counter()
+        errors = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = set()
+            for batch in self._batches(rows):
+                # 메모리/서버 부하 제한: 동시 전송 중인 배치 수를 max_workers로 제한
+                if len(in_flight) >= self.max_workers:
+                    done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                    self._collect(done, stats, errors)
+                in_flight.add(executor.submit(self._send, batch))
+            done, _ = wait(in_flight)
+            self._collect(done, stats, errors)
+
+        stats['seconds'] = round(time.perf_counter() - started, 3)
+        stats['rows_per_sec'] = round(stats['rows'] / stats['seconds'], 1) if stats['seconds'] else 0.0
+
+        if errors:
+            raise errors[0]
+
+        logger.info(
+            f"Inserted {stats['rows']}/{stats['submitted']} rows into {self.table} in {stats['batches']} batches "
+            f"({stats['rows_per_sec']} rows/s, {stats['retries']} retries)"
+        )
+        return stats
+
+    def _collect(self, done, stats: Dict[str, Any], errors: List[Exception]):
+        """완료된 배치 결과 집계"""
+        for future in done:
+            try:
+                result = future.result()
+            except Exception as e:
+                errors.append(e)
+                continue
+            stats['rows'] += result['rows']
+            stats['submitted'] += result['submitted']
+            stats['retries'] += result['retries']
+            stats['batches'] += 1
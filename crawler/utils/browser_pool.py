@@ -0,0 +1,128 @@
+"""
+Selenium 브라우저 풀
+- 데몬 모드에서 Chrome을 실행마다 새로 띄우지 않고 재사용
+- 최대 개수 제한, 반납 시 쿠키 정리 + 상태 확인, 일정 횟수 사용 후 교체 (Chrome 메모리 누수 방지)
+"""
+import queue
+import threading
+from typing import Any, Dict
+from utils.logger import setup_logger
+
+logger = setup_logger("browser_pool")
+
+
+def create_chrome_driver():
+    """크롤러와 같은 옵션의 headless Chrome WebDriver 생성"""
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 백그라운드 실행
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+
+    driver = webdriver.Chrome(options=chrome_options)
+    driver.implicitly_wait(10)
+    return driver
+
+
+class BrowserPool:
+    """재사용 가능한 WebDriver 풀 (스레드 안전)"""
+
+    def __init__(self, size: int, max_uses: int = 50, factory=create_chrome_driver):
+        """
+        Args:
+            size: 동시에 띄울 최대 브라우저 수
+            max_uses: 브라우저 하나를 교체하기 전까지 빌려줄 횟수
+            factory: WebDriver 생성 함수
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self.stats = {'created': 0, 'reused': 0, 'retired': 0}
+
+    def acquire(self) -> Any:
+        """
+        브라우저 대여 (풀이 가득 차 있으면 반납될 때까지 대기)
+
+        Returns:
+            WebDriver
+        """
+        self._slots.acquire()
+        try:
+            driver = self._idle.get_nowait()
+            with self._lock:
+                self.stats['reused'] += 1
+            return driver
+        except queue.Empty:
+            pass
+
+        try:
+            driver = self.factory()
+        except Exception:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+            self._created += 1
+            self.stats['created'] += 1
+        logger.info(f"Browser started ({self._created}/{self.size} alive)")
+        return driver
+
+    def release(self, driver: Any):
+        """
+        브라우저 반납 (쿠키 정리 후 재사용, 응답이 없거나 사용 횟수를 넘으면 종료)
+
+        Args:
+            driver: acquire()로 빌린 WebDriver
+        """
+        try:
+            with self._lock:
+                self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+                retire = self._uses[id(driver)] >= self.max_uses
+            if not retire:
+                try:
+                    driver.delete_all_cookies()
+                    driver.get('about:blank')
+                except Exception as e:
+                    logger.warning(f"Browser unhealthy, replacing: {e}")
+                    retire = True
+
+            if retire:
+                self._quit(driver)
+            else:
+                self._idle.put(driver)
+        finally:
+            self._slots.release()
+
+    def _quit(self, driver: Any):
+        """브라우저 종료"""
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._created -= 1
+            self.stats['retired'] += 1
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.warning(f"Failed to quit browser: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        """풀 상태 (상태 엔드포인트용)"""
+        with self._lock:
+            return {'size': self.size, 'alive': self._created, 'idle': self._idle.qsize(), **self.stats}
+
+    def close(self):
+        """대기 중인 브라우저 모두 종료"""
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        logger.info(f"Browser pool closed: {self.stats}")
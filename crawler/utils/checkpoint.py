@@ -0,0 +1,149 @@
+"""
+크롤링 체크포인트 유틸리티
+- 페이지 단위로 파싱한 상품을 로컬 상태 파일(JSONL 저널)에 기록
+- 작업이 중간에 죽어도 마지막으로 완료한 페이지부터 재개 (--resume)
+- 저널 형식: 한 줄에 하나의 이벤트 (헤더 / 페이지 완료 / 유닛 완료)
+"""
+import json
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Tuple
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("checkpoint")
+
+
+class CrawlCheckpoint:
+    """브랜드별 페이지 단위 체크포인트 저널"""
+
+    def __init__(self, brand_name: str, resume: bool = False):
+        """
+        Args:
+            brand_name: 브랜드명 (예: "CU")
+            resume: True면 기존 저널을 읽어 이어서 진행, False면 새로 시작
+        """
+        self.brand_name = brand_name
+        self.path = os.path.join(config.CHECKPOINT_DIR, f"{brand_name.lower()}.jsonl")
+        # 체크포인트는 같은 달의 크롤링에만 유효 (행사 기간이 월 단위)
+        self.run_month = datetime.now().strftime('%Y-%m')
+        self._units: Dict[str, Dict[str, Any]] = {}
+
+        os.makedirs(config.CHECKPOINT_DIR, exist_ok=True)
+
+        if resume and self._load():
+            resumed_pages = sum(len(u['pages']) for u in self._units.values())
+            logger.info(f"{brand_name}: resuming from checkpoint ({len(self._units)} units, {resumed_pages} pages)")
+        else:
+            self._units = {}
+            self._write_header()
+
+    def _write_header(self):
+        """새 저널 시작 (기존 파일 덮어쓰기)"""
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'brand': self.brand_name, 'run_month': self.run_month}) + '\n')
+
+    def _load(self) -> bool:
+        """
+        기존 저널 로드
+
+        Returns:
+            재개 가능한 체크포인트가 있으면 True
+        """
+        if not os.path.exists(self.path):
+            logger.info(f"{self.brand_name}: no checkpoint found, starting fresh")
+            return False
+
+        with open(self.path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+
+        if not lines:
+            return False
+
+        try:
+            header = json.loads(lines[0])
+        except json.JSONDecodeError:
+            return False
+
+        if header.get('run_month') != self.run_month:
+            logger.info(f"{self.brand_name}: checkpoint is from {header.get('run_month')}, starting fresh")
+            return False
+
+        for line in lines[1:]:
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                # 기록 도중 죽은 마지막 줄은 무시 (해당 페이지는 다시 크롤링)
+                continue
+
+            unit = self._units.setdefault(event['unit'], {'pages': {}, 'done': False})
+            if event.get('done'):
+                unit['done'] = True
+            else:
+                unit['pages'][event['page']] = event['products']
+
+        return True
+
+    def _append(self, event: Dict[str, Any]):
+        """저널에 이벤트 한 줄 추가 (즉시 디스크에 반영)"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(event, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+    def resume_unit(self, unit: str) -> Tuple[int, List[Dict[str, Any]], bool]:
+        """
+        유닛(탭/조건 등)의 재개 지점 조회
+
+        Args:
+            unit: 유닛 키 (예: "condition:23", "benefit:1:category:2")
+
+        Returns:
+            (다음에 크롤링할 페이지, 이미 수집한 상품, 유닛 완료 여부)
+        """
+        state = self._units.get(unit)
+        if not state:
+            return 1, [], False
+
+        pages = sorted(state['pages'])
+        products = [p for page in pages for p in state['pages'][page]]
+        next_page = pages[-1] + 1 if pages else 1
+        return next_page, products, state['done']
+
+    def unit_pages(self, unit: str) -> Tuple[Dict[int, List[Dict[str, Any]]], bool]:
+        """
+        유닛에서 완료한 페이지별 상품 조회 (페이지 순서와 상관없이 완료되는 작업 큐 크롤러용)
+
+        Args:
+            unit: 유닛 키
+
+        Returns:
+            ({페이지 번호: 상품 리스트}, 유닛 완료 여부)
+        """
+        state = self._units.get(unit)
+        if not state:
+            return {}, False
+        return dict(state['pages']), state['done']
+
+    def save_page(self, unit: str, page: int, products: List[Dict[str, Any]]):
+        """
+        페이지 완료 기록
+
+        Args:
+            unit: 유닛 키
+            page: 완료한 페이지 번호
+            products: 해당 페이지에서 파싱한 상품
+        """
+        self._units.setdefault(unit, {'pages': {}, 'done': False})['pages'][page] = products
+        self._append({'unit': unit, 'page': page, 'products': products})
+
+    def complete_unit(self, unit: str):
+        """유닛의 마지막 페이지까지 완료했음을 기록"""
+        self._units.setdefault(unit, {'pages': {}, 'done': False})['done'] = True
+        self._append({'unit': unit, 'done': True})
+
+    def clear(self):
+        """DB 저장까지 끝난 뒤 체크포인트 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+            logger.info(f"{self.brand_name}: checkpoint cleared")
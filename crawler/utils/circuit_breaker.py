@@ -0,0 +1,138 @@
+"""
+서킷 브레이커 유틸리티
+- 호스트 + 엔드포인트 종류(list/detail)별 연속 실패 추적
+- 임계치 초과 시 OPEN → 요청 즉시 차단 (fail fast)
+- 복구 대기 후 HALF_OPEN → 단일 probe 요청으로 복구 여부 확인
+"""
+import threading
+import time
+from typing import Dict, Tuple
+from urllib.parse import urlparse
+
+import config
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """서킷이 열려 있어 요청을 보내지 않고 차단했을 때 발생"""
+
+    def __init__(self, key: Tuple[str, str], retry_after: float):
+        self.key = key
+        self.retry_after = retry_after
+        super().__init__(f"Circuit open for {key[0]} ({key[1]}), retry after {retry_after:.0f}s")
+
+
+class CircuitBreaker:
+    """단일 (host, endpoint) 조합의 서킷 상태"""
+
+    def __init__(self, failure_threshold: int, recovery_timeout: float):
+        """
+        Args:
+            failure_threshold: OPEN으로 전환되는 연속 실패 횟수
+            recovery_timeout: OPEN 후 HALF_OPEN probe까지 대기 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """
+        요청 허용 여부 확인
+
+        Returns:
+            True면 요청 진행, False면 차단
+        """
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    return False
+                # 복구 대기 시간 경과 → probe 1건만 허용
+                self.state = HALF_OPEN
+                self._probe_in_flight = False
+
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def retry_after(self) -> float:
+        """OPEN 상태에서 다음 probe까지 남은 시간(초)"""
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self.opened_at))
+
+    def record_success(self):
+        """요청 성공 기록 (HALF_OPEN이면 CLOSED로 복구)"""
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """
+        결과를 기록하지 못하고 끝난 요청 정리 (requests 외 예외, KeyboardInterrupt 등)
+
+        HALF_OPEN probe였다면 상태는 그대로 두고 다음 요청이 다시 probe 할 수 있게 함
+        """
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        """요청 실패 기록 (임계치 도달 또는 probe 실패 시 OPEN)"""
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+
+class CircuitBreakerRegistry:
+    """(host, endpoint) 별 서킷 브레이커 모음"""
+
+    def __init__(self, failure_threshold: int = None, recovery_timeout: float = None):
+        self.failure_threshold = failure_threshold or config.CIRCUIT_FAILURE_THRESHOLD
+        self.recovery_timeout = recovery_timeout or config.CIRCUIT_RECOVERY_TIMEOUT
+        self._breakers: Dict[Tuple[str, str], CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def key_for(self, url: str, endpoint: str) -> Tuple[str, str]:
+        """URL과 엔드포인트 종류로 서킷 키 생성"""
+        return (urlparse(url).netloc, endpoint)
+
+    def get(self, url: str, endpoint: str) -> CircuitBreaker:
+        """
+        서킷 브레이커 조회 (없으면 생성)
+
+        Args:
+            url: 요청 URL
+            endpoint: 'list' 또는 'detail'
+
+        Returns:
+            CircuitBreaker 객체
+        """
+        key = self.key_for(url, endpoint)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.recovery_timeout)
+                self._breakers[key] = breaker
+            return breaker
+
+    def is_open(self, url: str, endpoint: str) -> bool:
+        """요청을 보내지 않고 OPEN 여부만 확인 (상세 수집 생략 판단용)"""
+        breaker = self.get(url, endpoint)
+        return breaker.state == OPEN and breaker.retry_after() > 0
+
+    def states(self) -> Dict[str, str]:
+        """로그/리포트용 서킷 상태 요약"""
+        with self._lock:
+            return {f"{host}:{endpoint}": b.state for (host, endpoint), b in self._breakers.items()}
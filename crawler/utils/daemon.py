@@ -0,0 +1,356 @@
+"""
+크롤러 데몬 모드
+- 한 프로세스를 계속 띄워 두고 브랜드별 cron 일정에 맞춰 업로드 실행 (python upload_to_db.py daemon)
+- 브랜드별 HTTP 세션과 Selenium 브라우저 풀을 실행 간 재사용 (Python/Chrome 기동, TLS 핸드셰이크 비용 제거)
+- 동시 실행 수 제한, 같은 작업은 이전 실행이 끝나기 전에 다시 시작하지 않음
+- 로컬 상태 엔드포인트: GET /health, GET /status, POST /run/<작업>
+"""
+import json
+import signal
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional
+import config
+from utils.logger import setup_logger, log_context, RUN_ID
+
+logger = setup_logger("daemon")
+
+# 메인 루프가 이 시간 이상 멈춰 있으면 /health가 503 반환
+STALL_SECONDS = 120
+
+
+class CronSchedule:
+    """5필드 cron 표현식 (분 시 일 월 요일, 로컬 시간 기준)"""
+
+    _RANGES = [(0, 59), (0, 23), (1, 31), (1, 12), (0, 7)]
+
+    def __init__(self, expression: str):
+        """
+        Args:
+            expression: cron 표현식 (예: "0 */6 * * *", "30 2 * * 1-5")
+                        *, */n, a-b, a-b/n, 쉼표 목록 지원. 요일은 0, 7 = 일요일
+        """
+        self.expression = expression
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Invalid cron expression (need 5 fields): {expression!r}")
+        parsed = [self._parse_field(f, lo, hi) for f, (lo, hi) in zip(fields, self._RANGES)]
+        self.minutes, self.hours, self.days, self.months, weekdays = parsed
+        self.weekdays = {d % 7 for d in weekdays}
+        # cron 규칙: 일/요일이 둘 다 제한되어 있으면 둘 중 하나만 맞아도 실행
+        self._day_restricted = fields[2] != '*'
+        self._weekday_restricted = fields[4] != '*'
+
+    @staticmethod
+    def _parse_field(field: str, lo: int, hi: int) -> List[int]:
+        values = set()
+        for part in field.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+            if part == '*':
+                start, end = lo, hi
+            elif '-' in part:
+                start, end = (int(x) for x in part.split('-', 1))
+            else:
+                start = int(part)
+                end = hi if step > 1 else start
+            if start < lo or end > hi or start > end or step < 1:
+                raise ValueError(f"Invalid cron field: {field!r}")
+            values.update(range(start, end + 1, step))
+        return sorted(values)
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        day_ok = day.day in self.days
+        weekday_ok = (day.weekday() + 1) % 7 in self.weekdays  # Python 월=0 → cron 일=0
+        if self._day_restricted and self._weekday_restricted:
+            return day_ok or weekday_ok
+        return day_ok and weekday_ok
+
+    def next_after(self, after: datetime) -> datetime:
+        """
+        다음 실행 시각
+
+        Args:
+            after: 기준 시각 (이 시각 이후의 첫 분)
+
+        Returns:
+            다음 실행 시각 (초/마이크로초는 0)
+        """
+        start = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        midnight = start.replace(hour=0, minute=0)
+        for offset in range(366 * 5):
+            day = midnight + timedelta(days=offset)
+            if not self._day_matches(day):
+                continue
+            for hour in self.hours:
+                for minute in self.minutes:
+                    candidate = day.replace(hour=hour, minute=minute)
+                    if candidate >= start:
+                        return candidate
+        raise ValueError(f"Cron expression never matches: {self.expression!r}")
+
+
+def parse_schedules(spec: str) -> Dict[str, CronSchedule]:
+    """
+    작업별 일정 파싱
+
+    Args:
+        spec: "cu,seven=0 */6 * * *;gs25=0 2 * * 1;refresh=0 4 * * *" 형식
+
+    Returns:
+        작업 이름 → CronSchedule
+    """
+    schedules = {}
+    for entry in filter(None, (e.strip() for e in spec.split(';'))):
+        names, expression = entry.split('=', 1)
+        schedule = CronSchedule(expression.strip())
+        for name in filter(None, (n.strip().lower() for n in names.split(','))):
+            schedules[name] = schedule
+    return schedules
+
+
+class _Job:
+    """등록된 작업과 실행 상태"""
+
+    def __init__(self, name: str, func: Callable[..., Any], schedule: CronSchedule, session: bool, browser: bool):
+        self.name = name
+        self.func = func
+        self.schedule = schedule
+        self.session = session
+        self.browser = browser
+        self.next_run = schedule.next_after(datetime.now())
+        self.state = 'idle'  # idle / queued / running
+        self.runs = 0
+        self.failures = 0
+        self.skipped = 0
+        self.last_started: Optional[datetime] = None
+        self.last_finished: Optional[datetime] = None
+        self.last_status: Optional[str] = None
+        self.last_error: Optional[str] = None
+        self.last_result: Any = None
+
+    def status(self) -> Dict[str, Any]:
+        started, finished = self.last_started, self.last_finished
+        return {
+            'schedule': self.schedule.expression,
+            'next_run': self.next_run.isoformat(timespec='seconds'),
+            'state': self.state,
+            'runs': self.runs,
+            'failures': self.failures,
+            'skipped': self.skipped,
+            'last_started': started.isoformat(timespec='seconds') if started else None,
+            'last_finished': finished.isoformat(timespec='seconds') if finished else None,
+            'last_duration': round((finished - started).total_seconds(), 1) if started and finished and finished >= started else None,
+            'last_status': self.last_status,
+            'last_error': self.last_error,
+            'last_result': self.last_result,
+        }
+
+
+class CrawlDaemon:
+    """cron 일정 기반 크롤링/업로드 데몬"""
+
+    def __init__(self, schedule_spec: str = None, concurrency: int = None, health_port: int = None):
+        """
+        Args:
+            schedule_spec: 작업별 일정 (기본값: config.DAEMON_SCHEDULE)
+            concurrency: 동시에 실행할 최대 작업 수 (기본값: config.DAEMON_CONCURRENCY)
+            health_port: 상태 엔드포인트 포트, 0이면 비활성화 (기본값: config.DAEMON_HEALTH_PORT)
+        """
+        self.schedules = parse_schedules(schedule_spec or config.DAEMON_SCHEDULE)
+        self.concurrency = concurrency or config.DAEMON_CONCURRENCY
+        self.health_port = config.DAEMON_HEALTH_PORT if health_port is None else health_port
+        self.jobs: Dict[str, _Job] = {}
+        self.started_at = datetime.now()
+        self._last_tick = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._sessions: Dict[str, Any] = {}
+        self._browser_pool = None
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def add_job(self, name: str, func: Callable[..., Any], session: bool = False, browser: bool = False):
+        """
+        작업 등록 (일정이 없는 작업은 건너뜀)
+
+        Args:
+            name: 작업 이름 (일정 키, 예: "cu")
+            func: 실행 함수 (session/browser가 켜져 있으면 crawler_kwargs 인자로 warm 자원 전달)
+            session: 브랜드별 HTTP 세션 재사용
+            browser: Selenium 브라우저 풀 사용
+        """
+        schedule = self.schedules.get(name)
+        if schedule is None:
+            logger.info(f"{name}: no schedule configured, not registered")
+            return
+        self.jobs[name] = _Job(name, func, schedule, session, browser)
+
+    def _crawler_kwargs(self, job: _Job) -> Dict[str, Any]:
+        """작업에 넘길 warm 자원 (처음 쓸 때 생성, 이후 재사용)"""
+        kwargs = {}
+        with self._lock:
+            if job.session:
+                if job.name not in self._sessions:
+                    from utils.http_transport import create_session
+                    self._sessions[job.name] = create_session(config.USER_AGENT)
+                kwargs['session'] = self._sessions[job.name]
+            if job.browser:
+                if self._browser_pool is None:
+                    from utils.browser_pool import BrowserPool
+                    self._browser_pool = BrowserPool(config.DAEMON_BROWSER_POOL_SIZE, config.DAEMON_BROWSER_MAX_USES)
+                kwargs['browser_pool'] = self._browser_pool
+        return kwargs
+
+    def _run_job(self, job: _Job):
+        """작업 실행 (예외는 상태에 기록하고 데몬은 계속 동작)"""
+        with self._lock:
+            job.state = 'running'
+            job.last_started = datetime.now()
+        logger.info(f"▶ {job.name} started")
+        try:
+            kwargs = self._crawler_kwargs(job)
+            # 작업 실행마다 별도 run ID (JSON 로그에서 한 번의 실행을 묶어 보기 위함)
+            with log_context(run=f"{RUN_ID}-{job.name}-{job.runs + 1}", job=job.name):
+                result = job.func(crawler_kwargs=kwargs) if kwargs else job.func()
+            with self._lock:
+                job.last_status = 'ok'
+                job.last_error = None
+                job.last_result = result if isinstance(result, (dict, list, str, int, float, type(None))) else str(result)
+        except Exception as e:
+            logger.error(f"✗ {job.name} failed: {e}\n{traceback.format_exc()}")
+            with self._lock:
+                job.failures += 1
+                job.last_status = 'error'
+                job.last_error = str(e)
+        finally:
+            with self._lock:
+                job.runs += 1
+                job.state = 'idle'
+                job.last_finished = datetime.now()
+            logger.info(f"■ {job.name} finished ({job.last_status}, {(job.last_finished - job.last_started).total_seconds():.1f}s)")
+
+    def trigger(self, name: str) -> bool:
+        """작업을 다음 틱에 바로 실행하도록 예약"""
+        with self._lock:
+            job = self.jobs.get(name)
+            if job is None:
+                return False
+            job.next_run = datetime.now()
+        self._wake.set()
+        return True
+
+    def healthy(self) -> bool:
+        """메인 루프가 최근에 돌았는지"""
+        return not self._stop.is_set() and time.monotonic() - self._last_tick < STALL_SECONDS
+
+    def status(self) -> Dict[str, Any]:
+        """데몬 상태 (상태 엔드포인트용)"""
+        with self._lock:
+            jobs = {name: job.status() for name, job in self.jobs.items()}
+        pool = self._browser_pool.status() if self._browser_pool else None
+        return {
+            'healthy': self.healthy(),
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'uptime_seconds': int((datetime.now() - self.started_at).total_seconds()),
+            'concurrency': self.concurrency,
+            'running': sum(1 for j in jobs.values() if j['state'] == 'running'),
+            'jobs': jobs,
+            'warm_sessions': sorted(self._sessions),
+            'browser_pool': pool,
+        }
+
+    def _start_health_server(self):
+        """로컬 상태 HTTP 서버 시작 (별도 스레드)"""
+        if not self.health_port:
+            return
+        daemon = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _send(self, code: int, body: Dict[str, Any]):
+                payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+                self.send_response(code)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                if self.path == '/health':
+                    healthy = daemon.healthy()
+                    self._send(200 if healthy else 503, {'status': 'ok' if healthy else 'stalled'})
+                elif self.path == '/status':
+                    self._send(200, daemon.status())
+                else:
+                    self._send(404, {'error': 'not found'})
+
+            def do_POST(self):
+                name = self.path[len('/run/'):] if self.path.startswith('/run/') else None
+                if name and daemon.trigger(name):
+                    self._send(202, {'triggered': name})
+                else:
+                    self._send(404, {'error': f"unknown job: {name}"})
+
+            def log_message(self, format, *args):
+                logger.debug(f"health {self.address_string()} {format % args}")
+
+        self._server = ThreadingHTTPServer((config.DAEMON_HEALTH_HOST, self.health_port), Handler)
+        threading.Thread(target=self._server.serve_forever, name='daemon-health', daemon=True).start()
+        logger.info(f"Health endpoint: http://{config.DAEMON_HEALTH_HOST}:{self._server.server_port}/status")
+
+    def stop(self, *_):
+        """종료 요청 (실행 중인 작업은 끝날 때까지 기다림)"""
+        logger.info("Stopping daemon...")
+        self._stop.set()
+        self._wake.set()
+
+    def run(self):
+        """메인 루프 (SIGINT/SIGTERM으로 종료)"""
+        for name in self.schedules:
+            if name not in self.jobs:
+                logger.warning(f"Schedule for unknown job ignored: {name}")
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+
+        self._start_health_server()
+        for name, job in self.jobs.items():
+            logger.info(f"{name}: '{job.schedule.expression}' → next run {job.next_run:%Y-%m-%d %H:%M}")
+
+        executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='daemon-job')
+        try:
+            while not self._stop.is_set():
+                self._last_tick = time.monotonic()
+                now = datetime.now()
+                with self._lock:
+                    due = [job for job in self.jobs.values() if job.next_run <= now]
+                    for job in due:
+                        if job.state != 'idle':
+                            # 이전 실행이 아직 끝나지 않았으면 이번 회차는 건너뜀
+                            job.skipped += 1
+                            logger.warning(f"{job.name}: previous run still {job.state}, skipping this slot")
+                        else:
+                            job.state = 'queued'
+                            executor.submit(self._run_job, job)
+                        job.next_run = job.schedule.next_after(now)
+                    next_due = min((job.next_run for job in self.jobs.values()), default=now + timedelta(minutes=1))
+
+                self._wake.wait(min(max((next_due - datetime.now()).total_seconds(), 1), 30))
+                self._wake.clear()
+        finally:
+            executor.shutdown(wait=True)
+            if self._server:
+                self._server.shutdown()
+            if self._browser_pool:
+                self._browser_pool.close()
+            for session in self._sessions.values():
+                session.close()
+            logger.info("Daemon stopped")
@@ -0,0 +1,208 @@
+"""
+HTTP 전송 계층 유틸리티
+- 커넥션 풀 크기 명시 (상세 페이지 동시 요청 대비)
+- TCP keep-alive + 압축 응답(Accept-Encoding) 사용
+- 선택: 지원하는 HTTPS 호스트에 HTTP/2 사용 (httpx + h2 설치 시)
+- 커넥션 재사용 통계 제공 (핸드셰이크가 재사용되는지 확인용)
+"""
+import socket
+import threading
+from typing import Dict, Any
+import requests
+from requests.adapters import HTTPAdapter, BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import select_proxy
+from urllib3.connection import HTTPConnection
+from urllib3.util.request import ACCEPT_ENCODING
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("http_transport")
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """풀 크기/keep-alive를 설정하고 요청 수를 집계하는 HTTP/1.1 어댑터"""
+
+    def __init__(self, pool_connections: int, pool_maxsize: int, **kwargs):
+        self._requests = 0
+        self._lock = threading.Lock()
+        super().__init__(pool_connections=pool_connections, pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        # 유휴 커넥션이 중간 장비에서 끊기지 않도록 TCP keep-alive 활성화
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        with self._lock:
+            self._requests += 1
+        return super().send(request, **kwargs)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        요청 수 / 새로 연 커넥션 수 집계
+
+        Returns:
+            {'requests': 120, 'connections': 4}
+        """
+        pools = self.poolmanager.pools
+        connections = 0
+        with pools.lock:
+            for pool in list(pools._container.values()):
+                connections += pool.num_connections
+        return {'requests': self._requests, 'connections': connections}
+
+
+class HTTP2Adapter(BaseAdapter):
+    """
+    httpx(HTTP/2) 클라이언트를 requests 어댑터로 감싼 어댑터
+
+    httpx 클라이언트는 TLS 검증/클라이언트 인증서/프록시가 생성 시 고정되고 응답 스트리밍을 지원하지 않으므로
+    verify/cert/proxies/stream이 기본값이 아닌 요청은 HTTP/1.1 어댑터(fallback)로 보냄 (설정이 조용히 무시되지 않도록)
+    """
+
+    def __init__(self, pool_maxsize: int, fallback: BaseAdapter):
+        """
+        Args:
+            pool_maxsize: 최대 커넥션 수
+            fallback: httpx로 처리할 수 없는 요청을 보낼 HTTP/1.1 어댑터
+        """
+        super().__init__()
+        import httpx
+
+        self._httpx = httpx
+        self.fallback = fallback
+        self.client = httpx.Client(
+            http2=True,
+            limits=httpx.Limits(max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize),
+        )
+        self._requests = 0
+        self._http_versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        if stream or verify is not True or cert or select_proxy(request.url, proxies or {}):
+            logger.debug("HTTP/1.1 fallback for %s (stream=%s, verify=%s, cert=%s)", request.url, stream, verify, cert)
+            return self.fallback.send(request, stream=stream, timeout=timeout, verify=verify, cert=cert,
+                                      proxies=proxies)
+
+        httpx = self._httpx
+        try:
+            r = self.client.request(
+                request.method,
+                request.url,
+                headers=dict(request.headers),
+                content=request.body,
+                timeout=timeout,
+            )
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(e, request=request)
+        except httpx.TransportError as e:
+            raise requests.ConnectionError(e, request=request)
+
+        with self._lock:
+            self._requests += 1
+            self._http_versions[r.http_version] = self._http_versions.get(r.http_version, 0) + 1
+
+        # httpx 응답을 requests.Response로 변환 (본문은 이미 압축 해제됨)
+        response = requests.Response()
+        response.status_code = r.status_code
+        response.headers = CaseInsensitiveDict(r.headers)
+        response._content = r.content
+        response.encoding = r.encoding
+        response.reason = r.reason_phrase
+        response.url = str(r.url)
+        response.request = request
+        return response
+
+    def close(self):
+        self.client.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        요청 수 / 현재 풀에 있는 커넥션 수 / HTTP 버전별 요청 수 집계
+
+        Returns:
+            {'requests': 120, 'connections': 1, 'http_versions': {'HTTP/2': 120}}
+        """
+        pool = getattr(self.client._transport, '_pool', None)
+        connections = len(pool.connections) if pool is not None else 0
+        return {'requests': self._requests, 'connections': connections, 'http_versions': dict(self._http_versions)}
+
+
+def _http2_available() -> bool:
+    """httpx + h2 설치 여부 확인"""
+    try:
+        import httpx  # noqa: F401
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+def create_session(user_agent: str) -> requests.Session:
+    """
+    튜닝된 커넥션 풀을 사용하는 requests.Session 생성
+
+    Args:
+        user_agent: User-Agent 헤더 값
+
+    Returns:
+        어댑터가 마운트된 Session 객체
+    """
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': user_agent,
+        'Accept-Encoding': ACCEPT_ENCODING,
+        'Connection': 'keep-alive',
+    })
+
+    http_adapter = PooledHTTPAdapter(config.HTTP_POOL_CONNECTIONS, config.HTTP_POOL_MAXSIZE)
+    session.mount('http://', http_adapter)
+    session.mount('https://', http_adapter)
+
+    # HTTP/2는 TLS(ALPN) 협상이 필요하므로 https에만 적용 (미지원 호스트는 HTTP/1.1로 자동 협상)
+    if config.HTTP2_ENABLED:
+        if _http2_available():
+            session.mount('https://', HTTP2Adapter(config.HTTP_POOL_MAXSIZE, fallback=http_adapter))
+        else:
+            logger.warning("HTTP2_ENABLED is set but httpx/h2 is not installed, falling back to HTTP/1.1")
+
+    return session
+
+
+def transport_stats(session: requests.Session) -> Dict[str, Any]:
+    """
+    세션의 커넥션 재사용 통계
+
+    Args:
+        session: create_session()으로 만든 세션
+
+    Returns:
+        {
+            'requests': 120,       # 보낸 요청 수
+            'connections': 4,      # 새로 연 커넥션 수 (핸드셰이크 횟수)
+            'reuse_ratio': 0.97,   # 1 - connections / requests
+            'http_versions': {...} # HTTP/2 사용 시
+        }
+    """
+    total = {'requests': 0, 'connections': 0}
+    http_versions: Dict[str, int] = {}
+
+    # http/https가 같은 어댑터를 공유할 수 있으므로 중복 집계 방지
+    for adapter in {id(a): a for a in session.adapters.values()}.values():
+        if not hasattr(adapter, 'stats'):
+            continue
+        stats = adapter.stats()
+        total['requests'] += stats['requests']
+        total['connections'] += stats['connections']
+        for version, count in stats.get('http_versions', {}).items():
+            http_versions[version] = http_versions.get(version, 0) + count
+
+    requests_count = total['requests']
+    total['reuse_ratio'] = round(1 - total['connections'] / requests_count, 3) if requests_count else 0.0
+    if http_versions:
+        total['http_versions'] = http_versions
+    return total
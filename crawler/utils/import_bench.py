@@ -0,0 +1,77 @@
+"""
+CLI 시작 시간 측정
+- 새 인터프리터에서 명령별로 필요한 모듈만 import 하는 데 걸리는 시간 (중앙값)
+- -X importtime 기준으로 가장 무거운 모듈 출력
+- 사용법: python -m utils.import_bench [반복 횟수]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+CRAWLER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (이름, 실행할 코드): 각 CLI 명령이 시작하면서 import 하는 범위
+SCENARIOS = [
+    ('baseline (python -c pass)', 'pass'),
+    ('import upload_to_db', 'import upload_to_db'),
+    ('cu / seven (requests + bs4)', "import upload_to_db; from crawlers.registry import load_crawler; load_crawler('cu')"),
+    ('gs25 / emart24 (+ selenium)', "import upload_to_db; from crawlers.registry import load_crawler; load_crawler('gs25')"),
+    ('upload (+ supabase)', 'import upload_to_db; import supabase'),
+]
+
+
+def _run(code: str, extra: List[str] = None) -> Tuple[float, str]:
+    """새 인터프리터에서 코드 실행 (걸린 시간, stderr)"""
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable] + (extra or []) + ['-c', code],
+        cwd=CRAWLER_DIR, capture_output=True, text=True, check=True,
+    )
+    return time.perf_counter() - started, result.stderr
+
+
+def top_imports(code: str, limit: int = 10) -> List[Tuple[int, str]]:
+    """
+    누적 import 시간이 긴 모듈 (코드에서 import한 모듈이 직접 import한 모듈 기준)
+
+    Args:
+        code: 실행할 코드
+        limit: 출력할 모듈 수
+
+    Returns:
+        [(누적 마이크로초, 모듈명), ...]
+    """
+    _, stderr = _run(code, ['-X', 'importtime'])
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or '|' not in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        # 들여쓰기 2칸 = 한 단계 아래 모듈 (예: upload_to_db → utils.backup)
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        if cumulative.strip().isdigit() and depth == 1:
+            rows.append((int(cumulative), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def _benchmark(repeat: int):
+    """시나리오별 시작 시간 측정"""
+    print(f"\n=== CLI startup ({repeat} runs each, median) ===")
+    for name, code in SCENARIOS:
+        try:
+            times = [_run(code)[0] for _ in range(repeat)]
+        except subprocess.CalledProcessError as e:
+            print(f"{name:32s} failed: {e.stderr.strip().splitlines()[-1]}")
+            continue
+        print(f"{name:32s} {statistics.median(times) * 1000:7.0f} ms")
+
+    print("\n=== Heaviest imports for 'import upload_to_db' ===")
+    for cumulative, module in top_imports('import upload_to_db'):
+        print(f"{cumulative / 1000:7.1f} ms  {module}")
+
+
+if __name__ == '__main__':
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,317 @@
+"""
+로컬 promo 미러 (SQLite)
+- DB 저장이 끝난 크롤링 결과를 promo/brand 테이블 형태로 로컬에 보관
+- 매 업로드 후 변경된 row만 반영 (증분 업데이트) + 변경 이력 기록
+- diff 기준 스냅샷과 오프라인 분석(바코드 누락, 기간별 변경 등)을 네트워크 없이 조회
+- 집계(promo_summary) 갱신에 실패한 브랜드/월 기록 (다음 실행에서 변경분이 아닌 전체 재계산)
+"""
+import os
+import sqlite3
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import config
+from utils.logger import setup_logger
+from utils.promotion import PROMO_FIELDS, HASH_FIELD, make_promotion_key, get_content_hash
+from utils.snapshot_diff import Snapshot, diff_snapshots
+
+logger = setup_logger("local_mirror")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS brand (
+    name TEXT PRIMARY KEY,
+    id TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS promo (
+    brand TEXT NOT NULL REFERENCES brand(name),
+    title TEXT NOT NULL,
+    raw_title TEXT,
+    barcode TEXT,
+    category TEXT,
+    deal_type TEXT,
+    normal_price INTEGER,
+    sale_price INTEGER,
+    start_date TEXT NOT NULL,
+    end_date TEXT,
+    image_url TEXT,
+    source_url TEXT,
+    description TEXT,
+    content_hash TEXT,
+    first_seen_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (brand, start_date, title)
+);
+
+CREATE INDEX IF NOT EXISTS promo_deal_type_idx ON promo (brand, deal_type);
+CREATE INDEX IF NOT EXISTS promo_category_idx ON promo (brand, category);
+CREATE INDEX IF NOT EXISTS promo_date_idx ON promo (start_date, end_date);
+
+-- 브랜드/월별 마지막 동기화 (이 기록이 있는 달만 diff 기준 스냅샷으로 사용)
+CREATE TABLE IF NOT EXISTS sync_state (
+    brand TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    rows INTEGER NOT NULL,
+    db_updated_at TEXT,      -- 동기화 직후 DB의 max(updated_at) (다른 경로의 DB 변경 감지용)
+    synced_at TEXT NOT NULL,
+    PRIMARY KEY (brand, start_date)
+);
+
+-- 변경 이력 ("지난주 이후 바뀐 상품" 조회용)
+CREATE TABLE IF NOT EXISTS change_log (
+    brand TEXT NOT NULL,
+    title TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    change TEXT NOT NULL,    -- new / updated / deleted
+    changed_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS change_log_changed_at_idx ON change_log (changed_at, brand);
+
+-- 집계 갱신에 실패한 브랜드/월 (기준 스냅샷은 이미 갱신됐으므로 다음 diff로는 빠진 그룹을 알 수 없음)
+CREATE TABLE IF NOT EXISTS summary_pending (
+    brand TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    failed_at TEXT NOT NULL,
+    PRIMARY KEY (brand, start_date)
+);
+"""
+
+_COLUMNS = PROMO_FIELDS + [HASH_FIELD]
+
+
+class LocalMirror:
+    """promo/brand 테이블의 로컬 SQLite 미러"""
+
+    def __init__(self, path: str = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: config.MIRROR_PATH)
+        """
+        self.path = path or config.MIRROR_PATH
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._migrate_brand()
+        self._migrate_sync_state()
+
+    def _migrate_brand(self):
+        """이전 미러 파일 보정: brand.id가 NULL 허용이면 NOT NULL로 재생성 (ID 없는 행은 다음 sync에서 다시 기록)"""
+        columns = {row['name']: row for row in self.conn.execute("PRAGMA table_info(brand)")}
+        if columns['id']['notnull']:
+            return
+        with self.conn:
+            self.conn.execute("CREATE TABLE brand_migrated (name TEXT PRIMARY KEY, id TEXT NOT NULL)")
+            self.conn.execute("INSERT INTO brand_migrated SELECT name, id FROM brand WHERE id IS NOT NULL")
+            self.conn.execute("DROP TABLE brand")
+            self.conn.execute("ALTER TABLE brand_migrated RENAME TO brand")
+        logger.info("Local mirror brand table migrated (id NOT NULL)")
+
+    def _migrate_sync_state(self):
+        """이전 미러 파일 보정: sync_state.db_updated_at 추가 (값이 없는 달은 다음 실행에서 DB 조회)"""
+        columns = {row['name'] for row in self.conn.execute("PRAGMA table_info(sync_state)")}
+        if 'db_updated_at' not in columns:
+            with self.conn:
+                self.conn.execute("ALTER TABLE sync_state ADD COLUMN db_updated_at TEXT")
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def set_brand(self, brand_name: str, brand_id: str):
+        """브랜드 등록 (Supabase brand 테이블의 ID)"""
+        self.conn.execute(
+            "INSERT INTO brand (name, id) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET id = excluded.id",
+            (brand_name, brand_id),
+        )
+
+    def load_snapshot(self, brand_name: str, start_date: str) -> Optional[Snapshot]:
+        """
+        마지막으로 동기화한 브랜드/월 프로모션 로드 (diff 기준 스냅샷)
+
+        Args:
+            brand_name: 브랜드명 (예: "CU")
+            start_date: 행사 시작일
+
+        Returns:
+            Snapshot (동기화 기록이 없으면 None)
+        """
+        state = self.conn.execute(
+            "SELECT rows, db_updated_at FROM sync_state WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+        ).fetchone()
+        if state is None:
+            return None
+
+        snapshot = Snapshot(db_updated_at=state['db_updated_at'])
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM promo WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+        )
+        for row in cursor:
+            promo = dict(row)
+            snapshot[make_promotion_key(promo)] = promo
+        if len(snapshot) != state['rows']:
+            logger.warning(f"{brand_name}: mirror has {len(snapshot)} rows but sync state says {state['rows']}")
+            return None
+
+        logger.info(f"{brand_name}: loaded previous snapshot from local mirror ({len(snapshot)} rows)")
+        return snapshot
+
+    def sync(self, brand_name: str, start_date: str, promotions: List[Dict[str, Any]],
+             brand_id: str, db_updated_at: str = None) -> Dict[str, int]:
+        """
+        DB에 저장한 크롤링 결과를 미러에 반영 (변경된 row만 쓰기)
+
+        Args:
+            brand_name: 브랜드명
+            start_date: 행사 시작일
+            promotions: DB에 저장한 프로모션 리스트
+            brand_id: 브랜드 UUID (SupabaseClient.get_brand_id)
+            db_updated_at: 저장 직후 DB의 max(updated_at) (SupabaseClient.promotions_version)
+
+        Returns:
+            {'new': 10, 'updated': 5, 'deleted': 3, 'unchanged': 82, 'total': 97}
+        """
+        previous = {}
+        cursor = self.conn.execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM promo WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+        )
+        for row in cursor:
+            promo = dict(row)
+            previous[make_promotion_key(promo)] = promo
+        changes = diff_snapshots(previous, [p for p in promotions if p.get('start_date') == start_date])
+
+        now = datetime.now().isoformat(timespec='seconds')
+        placeholders = ', '.join('?' for _ in _COLUMNS)
+        assignments = ', '.join(f"{c} = excluded.{c}" for c in _COLUMNS if c not in ('title', 'start_date'))
+
+        with self.conn:
+            self.set_brand(brand_name, brand_id)
+            self.conn.executemany(
+                "DELETE FROM promo WHERE brand = ? AND start_date = ? AND title = ?",
+                [(brand_name, start_date, p.get('title')) for p in changes.deleted.values()],
+            )
+            self.conn.executemany(
+                f"INSERT INTO promo (brand, {', '.join(_COLUMNS)}, first_seen_at, updated_at) "
+                f"VALUES (?, {placeholders}, ?, ?) "
+                f"ON CONFLICT(brand, start_date, title) DO UPDATE SET {assignments}, updated_at = excluded.updated_at",
+                [
+                    [brand_name] + [p.get(c) for c in PROMO_FIELDS] + [get_content_hash(p), now, now]
+                    for p in list(changes.added.values()) + list(changes.updated.values())
+                ],
+            )
+            self.conn.executemany(
+                "INSERT INTO change_log (brand, title, start_date, change, changed_at) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (brand_name, p.get('title'), start_date, change, now)
+                    for change, items in [('new', changes.added), ('updated', changes.updated),
+                                          ('deleted', changes.deleted)]
+                    for p in items.values()
+                ],
+            )
+            self.conn.execute(
+                "INSERT INTO sync_state (brand, start_date, rows, db_updated_at, synced_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(brand, start_date) DO UPDATE SET rows = excluded.rows, "
+                "db_updated_at = excluded.db_updated_at, synced_at = excluded.synced_at",
+                (brand_name, start_date, changes.stats()['total'], db_updated_at, now),
+            )
+
+        stats = changes.stats()
+        logger.info(
+            f"Local mirror updated for {brand_name} - New: {stats['new']}, Updated: {stats['updated']}, "
+            f"Deleted: {stats['deleted']}"
+        )
+        return stats
+
+    def first_seen(self, brand_name: str, start_date: str,
+                   promotions: List[Dict[str, Any]] = None) -> Dict[str, str]:
+        """
+        제목 → 처음 수집 시각 (브랜드/월)
+
+        Args:
+            brand_name: 브랜드명
+            start_date: 행사 시작일
+            promotions: sync 전에 조회할 때 이번 크롤링 결과 (미러에 없는 제목은 현재 시각)
+
+        Returns:
+            제목 → ISO 시각
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        seen = {p.get('title'): now for p in promotions or []}
+        cursor = self.conn.execute(
+            "SELECT title, first_seen_at FROM promo WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+        )
+        seen.update((row['title'], row['first_seen_at']) for row in cursor)
+        return seen
+
+    def summary_pending(self, brand_name: str, start_date: str) -> bool:
+        """이전 실행에서 집계 갱신에 실패했는지 (True면 전체 그룹 재계산 필요)"""
+        row = self.conn.execute(
+            "SELECT 1 FROM summary_pending WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+        ).fetchone()
+        return row is not None
+
+    def set_summary_pending(self, brand_name: str, start_date: str, pending: bool):
+        """집계 갱신 실패 기록 (성공하면 pending=False로 지움)"""
+        with self.conn:
+            if pending:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO summary_pending (brand, start_date, failed_at) VALUES (?, ?, ?)",
+                    (brand_name, start_date, datetime.now().isoformat(timespec='seconds')),
+                )
+            else:
+                self.conn.execute(
+                    "DELETE FROM summary_pending WHERE brand = ? AND start_date = ?", (brand_name, start_date)
+                )
+
+    def query(self, sql: str, params: tuple = ()) -> List[Dict[str, Any]]:
+        """임의 SQL 조회 (오프라인 분석용)"""
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def changes_since(self, since: str, brand_name: str = None) -> List[Dict[str, Any]]:
+        """
+        특정 시각 이후 변경 이력
+
+        Args:
+            since: ISO 날짜/시각 (예: "2025-10-13")
+            brand_name: 브랜드명 (없으면 전체)
+
+        Returns:
+            [{'brand': 'CU', 'title': '...', 'start_date': '...', 'change': 'new', 'changed_at': '...'}, ...]
+        """
+        sql = "SELECT * FROM change_log WHERE changed_at >= ?"
+        params = [since]
+        if brand_name:
+            sql += " AND brand = ?"
+            params.append(brand_name)
+        return self.query(sql + " ORDER BY changed_at, brand, title", tuple(params))
+
+    def missing_barcodes(self, brand_name: str) -> List[Dict[str, Any]]:
+        """바코드가 없는 상품 (가장 최근 달 기준)"""
+        return self.query(
+            "SELECT title, category, deal_type, start_date FROM promo "
+            "WHERE brand = ? AND (barcode IS NULL OR barcode = '') "
+            "AND start_date = (SELECT MAX(start_date) FROM promo WHERE brand = ?) ORDER BY title",
+            (brand_name, brand_name),
+        )
+
+
+if __name__ == '__main__':
+    # 오프라인 분석
+    # python -m utils.local_mirror changes 2025-10-13 [CU]
+    # python -m utils.local_mirror missing-barcodes CU
+    # python -m utils.local_mirror sql "SELECT deal_type, COUNT(*) FROM promo GROUP BY deal_type"
+    import json
+    import sys
+
+    mirror = LocalMirror()
+    command = sys.argv[1] if len(sys.argv) > 1 else 'sql'
+    if command == 'changes':
+        rows = mirror.changes_since(sys.argv[2], sys.argv[3] if len(sys.argv) > 3 else None)
+    elif command == 'missing-barcodes':
+        rows = mirror.missing_barcodes(sys.argv[2])
+    else:
+        rows = mirror.query(sys.argv[2] if len(sys.argv) > 2 else "SELECT brand, start_date, rows, synced_at FROM sync_state")
+
+    for row in rows:
+        print(json.dumps(row, ensure_ascii=False))
@@ -3,15 +3,188 @@
 - 크롤링 진행 상황 기록
 - 에러 로그 저장
 - 성공/실패 통계 출력
+- 파일/콘솔 쓰기는 QueueHandler → QueueListener 스레드 하나에서 처리 (크롤링 스레드는 큐에 넣기만 함)
+- 파일은 크기 기준 로테이션, LOG_JSON=true면 run/brand/page 등 컨텍스트가 붙은 JSON lines 추가 기록
 """
+import atexit
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Any, Dict, Optional
+import config
+
+# 프로세스 단위 실행 ID (데몬은 작업마다 log_context(run=...)로 덮어씀)
+RUN_ID = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+_FORMAT = '[%(asctime)s] %(name)s - %(levelname)s: %(message)s'
+_DATEFMT = '%Y-%m-%d %H:%M:%S'
+
+_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_listener: Optional[logging.handlers.QueueListener] = None
+_listener_lock = threading.Lock()
+_context = threading.local()
+
+
+def get_log_context() -> Dict[str, Any]:
+    """현재 스레드의 로그 컨텍스트 (run 포함)"""
+    return {'run': RUN_ID, **getattr(_context, 'fields', {})}
+
+
+def update_log_context(**fields):
+    """
+    현재 스레드의 로그 컨텍스트 갱신 (None이면 해당 필드 제거)
+
+    Args:
+        **fields: 예) brand="CU", unit="condition:23", page=3
+    """
+    current = dict(getattr(_context, 'fields', {}))
+    for key, value in fields.items():
+        if value is None:
+            current.pop(key, None)
+        else:
+            current[key] = value
+    _context.fields = current
+
+
+@contextmanager
+def log_context(**fields):
+    """
+    블록 안에서 남기는 로그에 컨텍스트 필드 추가 (끝나면 이전 값으로 복원)
+
+    스레드마다 따로 관리되므로 새 스레드에서는 필요한 필드를 다시 설정해야 함
+
+    Args:
+        **fields: 예) brand="CU"
+    """
+    previous = getattr(_context, 'fields', {})
+    update_log_context(**fields)
+    try:
+        yield
+    finally:
+        _context.fields = previous
+
+
+class _ContextQueueHandler(logging.handlers.QueueHandler):
+    """로그를 남긴 스레드에서 컨텍스트를 붙이고 메시지를 확정한 뒤 큐에 넣는 핸들러"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 기본 prepare는 포맷된 한 줄로 msg를 덮어써서 JSON에서 메시지/예외를 구분할 수 없음
+        record = logging.makeLogRecord(record.__dict__)
+        record.message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = record.message
+        record.args = None
+        record.exc_info = None
+        record.context = get_log_context()
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체 (ts, level, logger, msg + 컨텍스트 필드, exc)"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+            **getattr(record, 'context', {}),
+        }
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _RoutingHandler(logging.Handler):
+    """
+    리스너 스레드에서 로거 이름별 파일로 분배 (upload_to_db.py는 고정 파일명, 나머지는 날짜별)
+
+    날짜별 파일은 기록 시각의 날짜를 따라감 (데몬처럼 자정을 넘겨 실행되면 새 날짜 파일로 전환)
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.formatter = logging.Formatter(_FORMAT, datefmt=_DATEFMT)
+        self.console = logging.StreamHandler()
+        self.console.setLevel(logging.INFO)
+        self.console.setFormatter(self.formatter)
+        self.upload_file = self._rotating("logs/upload_to_db.log", self.formatter)
+        self.daily_date: Optional[str] = None
+        self.daily_file: Optional[logging.Handler] = None
+        self.json_file = self._rotating("logs/crawler.jsonl", JsonFormatter()) if config.LOG_JSON else None
+
+    @staticmethod
+    def _rotating(path: str, formatter: logging.Formatter) -> logging.Handler:
+        # delay=True: 실제로 로그가 기록될 때 파일 생성
+        handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=config.LOG_MAX_BYTES, backupCount=config.LOG_BACKUP_COUNT,
+            encoding='utf-8', delay=True,
+        )
+        handler.setLevel(logging.DEBUG)
+        handler.setFormatter(formatter)
+        return handler
+
+    def _daily(self, record: logging.LogRecord) -> logging.Handler:
+        """기록 시각 날짜의 파일 핸들러 (날짜가 바뀌면 이전 파일을 닫고 새로 만듦)"""
+        date = datetime.fromtimestamp(record.created).strftime('%Y%m%d')
+        if date != self.daily_date:
+            if self.daily_file is not None:
+                self.daily_file.close()
+            self.daily_file = self._rotating(f"logs/{date}.log", self.formatter)
+            self.daily_date = date
+        return self.daily_file
+
+    def emit(self, record: logging.LogRecord):
+        targets = [self.console, self.upload_file if record.name == "upload_to_db" else self._daily(record)]
+        if self.json_file is not None:
+            targets.append(self.json_file)
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def close(self):
+        for handler in (self.console, self.upload_file, self.daily_file, self.json_file):
+            if handler is not None:
+                handler.close()
+        super().close()
+
+
+def _start_listener():
+    """처음 setup_logger 호출 시 리스너 스레드 시작 (종료 시 큐를 비우고 파일 닫기)"""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            return
+        # logs 폴더가 없으면 생성
+        os.makedirs("logs", exist_ok=True)
+        router = _RoutingHandler()
+        _listener = logging.handlers.QueueListener(_queue, router)
+        _listener.start()
+        atexit.register(_stop_listener, router)
+
+
+def _stop_listener(router: logging.Handler):
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    router.close()
+
 
 def setup_logger(name: str) -> logging.Logger:
     """
     로거 설정 및 반환
 
+    반복 구간(페이지/요청 단위)에서는 logger.debug("... %s", value)처럼 인자를 넘겨야
+    레벨이 꺼져 있을 때 문자열 포맷 비용이 들지 않음
+
     Args:
         name: 로거 이름 (예: "emart24_crawler")
 
@@ -19,36 +192,13 @@ def setup_logger(name: str) -> logging.Logger:
         설정된 Logger 객체
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
+    logger.setLevel(config.LOG_LEVEL)
 
     # 이미 핸들러가 있으면 중복 추가 방지
     if logger.handlers:
         return logger
 
-    # logs 폴더가 없으면 생성
-    os.makedirs("logs", exist_ok=True)
-
-    # 콘솔 출력 핸들러
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-
-    # 파일 출력 핸들러 (upload_to_db.py는 고정 파일명, 나머지는 날짜별)
-    if name == "upload_to_db":
-        log_filename = "logs/upload_to_db.log"
-    else:
-        log_filename = f"logs/{datetime.now().strftime('%Y%m%d')}.log"
-    file_handler = logging.FileHandler(log_filename, encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
-
-    # 로그 포맷 설정
-    formatter = logging.Formatter(
-        '[%(asctime)s] %(name)s - %(levelname)s: %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
-
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    _start_listener()
+    logger.addHandler(_ContextQueueHandler(_queue))
 
     return logger
@@ -0,0 +1,269 @@
+"""
+근사 중복 상품 탐지 (MinHash + LSH)
+- 정규화한 상품명(dedup_key)의 문자 3-gram shingle로 MinHash 서명 계산
+- LSH 밴드 버킷으로 후보 쌍만 비교 → 전체 쌍 비교(O(n²)) 없이 한 달 전체 크롤링 처리
+- 유사도가 기준 이상인 쌍을 클러스터로 묶고 신뢰도(평균 추정 유사도) 부여
+- 용량/숫자가 다른 상품(500ml vs 355ml, 참치1 vs 참치2)은 중복으로 보지 않음
+- 기본값은 검토용 리포트만 저장, NEAR_DUPLICATE_REMOVE=true일 때만 백업/DB 저장 전에 제거
+"""
+import hashlib
+import json
+import os
+import random
+import re
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
+import config
+from utils.logger import setup_logger
+from utils.title_normalizer import normalize_title
+
+logger = setup_logger("near_duplicate")
+
+NUM_PERM = 64
+BANDS = 16          # 밴드 16개 × 4행 → 유사도 약 0.5부터 후보가 되기 시작
+ROWS = NUM_PERM // BANDS
+SHINGLE_SIZE = 3
+
+# 순열 대신 64비트 XOR 마스크로 해시 함수 계열 구성 (곱셈/모듈러 연산 없이 C 레벨 map으로 계산)
+_rng = random.Random(20251019)  # 실행마다 같은 서명이 나오도록 고정 시드
+_MASKS = [_rng.getrandbits(64) for _ in range(NUM_PERM)]
+_DIGITS = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _key(promo: Dict[str, Any]) -> str:
+    """정규화 키 (크롤러가 계산해 둔 값이 없으면 계산)"""
+    return promo.get('dedup_key') or normalize_title(promo.get('raw_title') or promo.get('title') or '').dedup_key
+
+
+def _shingles(key: str) -> set:
+    """문자 n-gram 집합 (짧은 키는 키 전체)"""
+    if len(key) <= SHINGLE_SIZE:
+        return {key}
+    return {key[i:i + SHINGLE_SIZE] for i in range(len(key) - SHINGLE_SIZE + 1)}
+
+
+@lru_cache(maxsize=100_000)
+def minhash(key: str) -> Tuple[int, ...]:
+    """
+    MinHash 서명 계산
+
+    Args:
+        key: 정규화 키
+
+    Returns:
+        NUM_PERM 길이의 서명
+    """
+    hashes = [
+        int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=8).digest(), 'little')
+        for s in _shingles(key)
+    ]
+    return tuple(min(map(mask.__xor__, hashes)) for mask in _MASKS)
+
+
+def similarity(sig_a: Tuple[int, ...], sig_b: Tuple[int, ...]) -> float:
+    """서명 일치 비율 (Jaccard 유사도 추정값)"""
+    return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / NUM_PERM
+
+
+def find_clusters(promotions: List[Dict[str, Any]], threshold: float = None) -> List[Dict[str, Any]]:
+    """
+    근사 중복 클러스터 탐지
+
+    Args:
+        promotions: 프로모션 리스트 (여러 탭/브랜드를 섞어도 됨)
+        threshold: 중복으로 볼 최소 추정 유사도 (기본값: config.NEAR_DUPLICATE_THRESHOLD)
+
+    Returns:
+        [
+            {
+                'members': [3, 17, 42],     # promotions 인덱스
+                'confidence': 0.92,         # 클러스터 내 연결된 쌍의 평균 추정 유사도
+                'titles': ['...', '...', '...']
+            },
+            ...
+        ]
+    """
+    threshold = threshold or config.NEAR_DUPLICATE_THRESHOLD
+    keys = [_key(p) for p in promotions]
+    signatures = [minhash(k) for k in keys]
+    numbers = [tuple(_DIGITS.findall(k)) for k in keys]
+
+    # 같은 밴드 값을 가진 항목끼리만 후보
+    candidates = set()
+    for band in range(BANDS):
+        buckets: Dict[Tuple[int, ...], List[int]] = {}
+        for i, sig in enumerate(signatures):
+            buckets.setdefault(sig[band * ROWS:(band + 1) * ROWS], []).append(i)
+        for members in buckets.values():
+            for x in range(len(members)):
+                for y in range(x + 1, len(members)):
+                    candidates.add((members[x], members[y]))
+
+    parent = list(range(len(promotions)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    edges = []
+    for i, j in candidates:
+        if keys[i] == keys[j]:
+            score = 1.0
+        elif numbers[i] != numbers[j]:
+            continue
+        else:
+            score = similarity(signatures[i], signatures[j])
+            if score < threshold:
+                continue
+        edges.append((i, j, score))
+        parent[find(i)] = find(j)
+
+    clusters: Dict[int, Dict[str, Any]] = {}
+    for i, j, score in edges:
+        cluster = clusters.setdefault(find(i), {'members': set(), 'scores': []})
+        cluster['members'].update((i, j))
+        cluster['scores'].append(score)
+
+    result = []
+    for cluster in clusters.values():
+        members = sorted(cluster['members'])
+        result.append({
+            'members': members,
+            'confidence': round(sum(cluster['scores']) / len(cluster['scores']), 3),
+            'titles': [promotions[i].get('title') for i in members],
+        })
+    logger.debug(f"{len(promotions)} promotions, {len(candidates)} candidate pairs, {len(result)} clusters")
+    return result
+
+
+def duplicate_plan(promotions: List[Dict[str, Any]], threshold: float = None) -> List[Dict[str, Any]]:
+    """
+    클러스터별 중복 판단 (제거하지 않고 어떤 항목이 어떤 항목의 중복인지만 계산)
+
+    클러스터 안에서 행사 유형/가격/시작일이 같은 항목은 표기만 다른 같은 상품으로 보고 첫 항목만 유지.
+    행사가 다른 항목은 서로 다른 프로모션이므로 그대로 유지.
+
+    Args:
+        promotions: 한 브랜드의 프로모션 리스트
+        threshold: 중복으로 볼 최소 추정 유사도
+
+    Returns:
+        find_clusters 결과에 'duplicates': {중복 인덱스: 유지할 인덱스} 추가
+    """
+    plan = []
+    for cluster in find_clusters(promotions, threshold):
+        kept, duplicates = {}, {}
+        for i in cluster['members']:
+            promo = promotions[i]
+            deal = (promo.get('deal_type'), promo.get('sale_price'), promo.get('start_date'))
+            if deal in kept:
+                duplicates[i] = kept[deal]
+            else:
+                kept[deal] = i
+        plan.append({**cluster, 'duplicates': duplicates})
+    return plan
+
+
+def write_report(brand_key: str, promotions: List[Dict[str, Any]], plan: List[Dict[str, Any]],
+                 removed: bool) -> str:
+    """
+    검토용 클러스터 리포트 저장 (config.NEAR_DUPLICATE_REPORT_DIR/<브랜드>.json, 실행마다 덮어씀)
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+        promotions: duplicate_plan에 넘긴 프로모션 리스트
+        plan: duplicate_plan 결과
+        removed: 이번 실행에서 실제로 제거했는지 (NEAR_DUPLICATE_REMOVE)
+
+    Returns:
+        리포트 경로
+    """
+    os.makedirs(config.NEAR_DUPLICATE_REPORT_DIR, exist_ok=True)
+    path = os.path.join(config.NEAR_DUPLICATE_REPORT_DIR, f"{brand_key}.json")
+    report = {
+        'generated_at': datetime.now().isoformat(timespec='seconds'),
+        'removed': removed,
+        'clusters': [
+            {
+                'confidence': cluster['confidence'],
+                'titles': cluster['titles'],
+                'duplicates': [
+                    {'title': promotions[i].get('title'), 'kept_title': promotions[k].get('title')}
+                    for i, k in sorted(cluster['duplicates'].items())
+                ],
+            }
+            for cluster in sorted(plan, key=lambda c: -c['confidence'])
+        ],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
+
+
+def dedupe_promotions(brand_key: str, promotions: List[Dict[str, Any]], remove: bool = None,
+                      threshold: float = None) -> List[Dict[str, Any]]:
+    """
+    근사 중복 탐지 후 리포트 저장, remove면 중복 제거 (백업/DB 저장 전 단계에서 사용)
+
+    Args:
+        brand_key: 브랜드 키 (리포트 파일명)
+        promotions: 한 브랜드의 프로모션 리스트
+        remove: True면 중복 제거 (기본값: config.NEAR_DUPLICATE_REMOVE), False면 리포트만
+        threshold: 중복으로 볼 최소 추정 유사도
+
+    Returns:
+        remove면 중복이 제거된 프로모션 리스트 (원래 순서 유지), 아니면 입력 그대로
+    """
+    remove = config.NEAR_DUPLICATE_REMOVE if remove is None else remove
+    plan = duplicate_plan(promotions, threshold)
+    dropped = {i for cluster in plan for i in cluster['duplicates']}
+    path = write_report(brand_key, promotions, plan, removed=remove and bool(dropped))
+    if not dropped:
+        return promotions
+    if not remove:
+        logger.info(f"Found {len(dropped)} near-duplicate promotions in {len(plan)} clusters (report only: {path})")
+        return promotions
+
+    for cluster in plan:
+        for i, k in cluster['duplicates'].items():
+            logger.info(
+                f"Near-duplicate ({cluster['confidence']:.2f}): '{promotions[i].get('title')}' "
+                f"→ '{promotions[k].get('title')}'"
+            )
+    logger.info(f"Removed {len(dropped)} near-duplicate promotions (report: {path})")
+    return [p for i, p in enumerate(promotions) if i not in dropped]
+
+
+def _benchmark(count: int):
+    """탐지 시간 측정 (합성 상품명, 10%는 표기만 다른 변형)"""
+    import time
+
+    rng = random.Random(0)
+    syllables = '가나다라마바사아자차카타파하고노도로모보소오조초코토포호'
+    titles = []
+    for i in range(count):
+        if titles and rng.random() < 0.1:
+            # 기존 상품명에 공백 제거 + 한 글자 추가한 표기 변형
+            base = rng.choice(titles)
+            titles.append(base.replace(' ', '') + rng.choice(syllables))
+        else:
+            name = ''.join(rng.choice(syllables) for _ in range(rng.randint(4, 9)))
+            titles.append(f"{name} {rng.choice(['500ml', '210g', '1.5L', ''])}{i}")
+    promotions = [{'title': t, 'deal_type': 'ONE_PLUS_ONE', 'sale_price': 1000} for t in titles]
+
+    minhash.cache_clear()
+    started = time.perf_counter()
+    clusters = find_clusters(promotions)
+    seconds = time.perf_counter() - started
+    print(f"\n=== {count} promotions ===")
+    print(f"{len(clusters)} clusters in {seconds:.2f}s ({count / seconds:,.0f} promotions/s)")
+
+
+if __name__ == '__main__':
+    # 벤치마크: python -m utils.near_duplicate [count]
+    import sys
+
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
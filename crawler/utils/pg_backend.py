@@ -0,0 +1,244 @@
+"""
+Postgres 직접 연결 저장 백엔드 (COPY)
+- DATABASE_URL로 Postgres에 직접 연결 (prisma/schema.prisma와 같은 DB)
+- 크롤링 결과를 임시 staging 테이블에 COPY로 적재
+- staging → promo 병합은 set 기반 SQL (DELETE / UPDATE / INSERT) 한 트랜잭션
+- 월 교체, 백필처럼 수천 건이 바뀌는 경우용 (SYNC_MODE=copy)
+- psycopg(v3) 필요: pip install "psycopg[binary]"
+"""
+import time
+from typing import List, Dict, Any
+import config
+from utils.logger import setup_logger
+from utils.promotion import PROMO_FIELDS, HASH_FIELD, get_content_hash
+
+logger = setup_logger("pg_backend")
+
+STAGING_COLUMNS = PROMO_FIELDS + [HASH_FIELD, 'ord']
+
+CREATE_STAGING_SQL = """
+CREATE TEMP TABLE promo_staging (
+    title text,
+    raw_title text,
+    barcode text,
+    category text,
+    deal_type text,
+    normal_price integer,
+    sale_price integer,
+    start_date date,
+    end_date date,
+    image_url text,
+    source_url text,
+    description text,
+    content_hash text,
+    ord bigint
+) ON COMMIT DROP
+"""
+
+# 같은 제목이 여러 번 오면 마지막 값 사용 (크롤러 diff와 동일)
+DEDUP_SQL = """
+CREATE TEMP TABLE promo_incoming ON COMMIT DROP AS
+SELECT DISTINCT ON (title) *
+FROM promo_staging
+WHERE start_date = %(start_date)s
+ORDER BY title, ord DESC
+"""
+
+DELETE_SQL = """
+DELETE FROM promo p
+WHERE p.brand_id = %(brand_id)s
+  AND p.start_date = %(start_date)s
+  AND NOT EXISTS (SELECT 1 FROM promo_incoming i WHERE i.title = p.title)
+"""
+
+UPDATE_SQL = """
+UPDATE promo p
+SET raw_title = i.raw_title,
+    barcode = i.barcode,
+    category = i.category,
+    deal_type = i.deal_type::deal_type,
+    normal_price = i.normal_price,
+    sale_price = i.sale_price,
+    end_date = i.end_date,
+    image_url = i.image_url,
+    source_url = i.source_url,
+    description = i.description,
+    content_hash = i.content_hash,
+    updated_at = now()
+FROM promo_incoming i
+WHERE p.brand_id = %(brand_id)s
+  AND p.start_date = %(start_date)s
+  AND p.title = i.title
+  AND p.content_hash IS DISTINCT FROM i.content_hash
+"""
+
+INSERT_SQL = """
+INSERT INTO promo (brand_id, title, raw_title, barcode, category, deal_type, normal_price, sale_price,
+                   start_date, end_date, image_url, source_url, description, content_hash)
+SELECT %(brand_id)s, i.title, i.raw_title, i.barcode, i.category, i.deal_type::deal_type, i.normal_price,
+       i.sale_price, i.start_date, i.end_date, i.image_url, i.source_url, i.description, i.content_hash
+FROM promo_incoming i
+WHERE NOT EXISTS (
+    SELECT 1 FROM promo p
+    WHERE p.brand_id = %(brand_id)s AND p.start_date = %(start_date)s AND p.title = i.title
+)
+"""
+
+
+class PostgresCopyBackend:
+    """COPY + set 기반 병합으로 프로모션을 저장하는 백엔드"""
+
+    def __init__(self, database_url: str = None):
+        """
+        Args:
+            database_url: Postgres 연결 문자열 (기본값: config.DATABASE_URL)
+        """
+        database_url = database_url or config.DATABASE_URL
+        if not database_url:
+            raise ValueError("DATABASE_URL must be set in environment variables")
+
+        try:
+            import psycopg
+        except ImportError:
+            raise ImportError('psycopg is required for SYNC_MODE=copy: pip install "psycopg[binary]"')
+
+        self.conn = psycopg.connect(database_url)
+        logger.info("Postgres connection initialized")
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def get_brand_id(self, brand_name: str) -> str:
+        """
+        브랜드명으로 브랜드 ID 조회
+
+        Args:
+            brand_name: 브랜드명 (예: "CU", "SevenEleven")
+
+        Returns:
+            브랜드 UUID
+        """
+        with self.conn.cursor() as cur:
+            row = cur.execute("SELECT id FROM brand WHERE name = %s", (brand_name,)).fetchone()
+        self.conn.commit()
+        if not row:
+            raise ValueError(f"Brand '{brand_name}' not found in database")
+        return str(row[0])
+
+    def save_promotions(self, brand_name: str, promotions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        COPY로 staging 적재 후 promo에 병합
+
+        Args:
+            brand_name: 브랜드명
+            promotions: 크롤링한 프로모션 리스트
+
+        Returns:
+            save_promotions_with_diff와 같은 형식의 통계
+        """
+        if not promotions:
+            logger.warning(f"No promotions to save for {brand_name}")
+            return {'new': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 0}
+
+        brand_id = self.get_brand_id(brand_name)
+        start_date = promotions[0].get('start_date')
+        params = {'brand_id': brand_id, 'start_date': start_date}
+        started = time.perf_counter()
+
+        try:
+            with self.conn.transaction(), self.conn.cursor() as cur:
+                # 같은 브랜드/월 병합이 동시에 실행되지 않도록 직렬화 (merge_promotions RPC와 같은 키)
+                cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s::text || %s::text))", (brand_id, start_date))
+
+                cur.execute(CREATE_STAGING_SQL)
+                with cur.copy(f"COPY promo_staging ({', '.join(STAGING_COLUMNS)}) FROM STDIN") as copy:
+                    for ord_, promo in enumerate(promotions):
+                        copy.write_row([promo.get(f) for f in PROMO_FIELDS] + [get_content_hash(promo), ord_])
+
+                cur.execute(DEDUP_SQL, params)
+                total = cur.rowcount
+                cur.execute(DELETE_SQL, params)
+                deleted = cur.rowcount
+                cur.execute(UPDATE_SQL, params)
+                updated = cur.rowcount
+                cur.execute(INSERT_SQL, params)
+                inserted = cur.rowcount
+
+        except Exception as e:
+            logger.error(f"Failed to save promotions via COPY for {brand_name}: {e}")
+            raise
+
+        stats = {
+            'new': inserted,
+            'updated': updated,
+            'deleted': deleted,
+            'unchanged': total - inserted - updated,
+            'total': total,
+        }
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"Save complete (copy) - New: {stats['new']}, Updated: {stats['updated']}, "
+            f"Deleted: {stats['deleted']}, Unchanged: {stats['unchanged']} ({elapsed:.2f}s)"
+        )
+        return stats
+
+
+def _benchmark(rows: int):
+    """
+    COPY 백엔드 vs REST diff 경로 벤치마크 (로컬 DB 전용: supabase start)
+
+    DATABASE_URL과 NEXT_PUBLIC_SUPABASE_URL이 같은 로컬 DB를 가리켜야 함.
+    CU 브랜드의 2099-01-01 월에 합성 데이터를 넣고 끝나면 삭제.
+    """
+    from utils.promotion import content_hash
+    from utils.supabase_client import get_client
+
+    def synthetic(price: int) -> List[Dict[str, Any]]:
+        promos = []
+        for i in range(rows):
+            promo = {
+                'title': f"벤치마크 상품 {i}",
+                'raw_title': f"벤치마크 상품 {i}",
+                'deal_type': 'ONE_PLUS_ONE',
+                # 절반만 가격 변경 → UPDATE 경로도 측정
+                'normal_price': price if i % 2 else 1000,
+                'sale_price': price if i % 2 else 1000,
+                'start_date': '2099-01-01',
+                'end_date': '2099-01-31',
+            }
+            promo[HASH_FIELD] = content_hash(promo)
+            promos.append(promo)
+        return promos
+
+    backend = PostgresCopyBackend()
+    brand_id = backend.get_brand_id("CU")
+
+    def cleanup():
+        with backend.conn.cursor() as cur:
+            cur.execute("DELETE FROM promo WHERE brand_id = %s AND start_date = '2099-01-01'", (brand_id,))
+        backend.conn.commit()
+
+    results = {}
+    rest = get_client()
+    for name, save in [('copy', backend.save_promotions), ('rest', rest.save_promotions_with_diff)]:
+        cleanup()
+        timings = []
+        for price in (1000, 1200):  # 1회차: 전체 INSERT, 2회차: 절반 UPDATE
+            started = time.perf_counter()
+            save("CU", synthetic(price))
+            timings.append(round(time.perf_counter() - started, 3))
+        results[name] = {'load_seconds': timings[0], 'update_seconds': timings[1]}
+    cleanup()
+    backend.close()
+
+    print(f"\n=== {rows} rows ===")
+    for name, result in results.items():
+        print(f"{name:5}: load {result['load_seconds']}s, update {result['update_seconds']}s")
+
+
+if __name__ == '__main__':
+    # 벤치마크: python -m utils.pg_backend [rows]
+    import sys
+
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
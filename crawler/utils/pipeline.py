@@ -0,0 +1,102 @@
+"""
+단계 겹침 파이프라인
+- 단계마다 스레드 하나, 단계 사이는 크기 제한 큐 (앞 단계가 너무 앞서가지 않도록 backpressure)
+- 예: 크롤링 → DB 저장. 한 브랜드를 저장하는 동안 다음 브랜드 크롤링
+- 한 단계에서 오류가 나면 그 단계와 앞 단계는 새 작업을 멈추고, 뒤 단계는 이미 넘겨받은 작업을 끝낸 뒤 오류를 다시 발생
+"""
+import queue
+import threading
+import time
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+from utils.logger import setup_logger
+
+logger = setup_logger("pipeline")
+
+_DONE = object()
+
+
+class Pipeline:
+    """순서가 보장되는 다단계 파이프라인"""
+
+    def __init__(self, stages: List[Tuple[str, Callable[[Any], Any]]], queue_size: int = 1):
+        """
+        Args:
+            stages: [(단계 이름, 처리 함수), ...] 앞 단계 결과가 다음 단계 입력
+            queue_size: 단계 사이 큐 크기 (다음 단계를 기다리는 최대 작업 수)
+        """
+        self.stages = stages
+        self.queue_size = queue_size
+        self.busy = {name: 0.0 for name, _ in stages}  # 단계별 처리 시간 (초)
+        self._failed_at: Optional[int] = None
+        self._error: Optional[BaseException] = None
+        self._lock = threading.Lock()
+
+    def _fail(self, index: int, error: BaseException):
+        with self._lock:
+            if self._failed_at is None or index < self._failed_at:
+                self._failed_at = index
+            if self._error is None:
+                self._error = error
+
+    def _worker(self, index: int, func: Callable[[Any], Any], source: Iterable[Any],
+                outbox: Optional[queue.Queue], results: List[Any]):
+        name = self.stages[index][0]
+        try:
+            for item in source:
+                # 이 단계나 뒤 단계가 실패했으면 남은 입력은 버림 (앞 단계가 put에서 막히지 않도록 계속 소비)
+                if self._failed_at is not None and index <= self._failed_at:
+                    continue
+                started = time.perf_counter()
+                try:
+                    output = func(item)
+                except Exception as e:
+                    logger.error(f"Pipeline stage '{name}' failed: {e}")
+                    self._fail(index, e)
+                    continue
+                finally:
+                    self.busy[name] += time.perf_counter() - started
+                if outbox is None:
+                    results.append(output)
+                else:
+                    outbox.put(output)
+        finally:
+            if outbox is not None:
+                outbox.put(_DONE)
+
+    def run(self, items: Iterable[Any]) -> List[Any]:
+        """
+        파이프라인 실행
+
+        Args:
+            items: 첫 단계 입력
+
+        Returns:
+            마지막 단계 결과 (입력 순서)
+
+        Raises:
+            처음 발생한 단계 오류 (이미 다음 단계로 넘어간 작업은 끝까지 처리한 뒤)
+        """
+        started = time.perf_counter()
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages[1:]]
+        results: List[Any] = []
+        threads = []
+        for index, (name, func) in enumerate(self.stages):
+            source = iter(items) if index == 0 else iter(queues[index - 1].get, _DONE)
+            outbox = queues[index] if index < len(queues) else None
+            thread = threading.Thread(
+                target=self._worker, args=(index, func, source, outbox, results),
+                name=f"pipeline-{name}", daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+        elapsed = time.perf_counter() - started
+        busy = ', '.join(f"{name} {seconds:.1f}s" for name, seconds in self.busy.items())
+        overlap = max(sum(self.busy.values()) - elapsed, 0)
+        logger.info(f"Pipeline finished in {elapsed:.1f}s ({busy}; {overlap:.1f}s overlapped)")
+
+        if self._error is not None:
+            raise self._error
+        return results
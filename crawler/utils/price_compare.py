@@ -0,0 +1,230 @@
+"""
+브랜드 간 가격 비교 그룹 사전 계산
+- 이번 달 4개 브랜드 프로모션을 바코드 기준으로 묶고, 바코드가 없으면 정규화한 제목으로 연결
+- 바코드는 체크 디지트가 맞는 EAN-8/13/14만 사용하고, 한 브랜드에서 서로 다른 상품에 쓰인 바코드는 연결에 쓰지 않음
+  (세븐일레븐 barcode는 이미지 경로의 제조사 디렉토리라 같은 제조사 상품이 모두 같은 값)
+- 그룹별로 브랜드마다 실질 개당 가격이 가장 낮은 프로모션을 골라 promo_compare_group에 저장
+- /api/promotions/compare는 런타임 조인 없이 그룹 조회 + id 조회만 수행
+"""
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import config
+from utils.logger import setup_logger
+from utils.title_normalizer import normalize_title
+
+logger = setup_logger("price_compare")
+
+TABLE = 'promo_compare_group'
+
+# 행사 유형별 실제로 받는 개수 대비 지불 개수 (1+1: 2개 받고 1개 가격)
+DEAL_UNIT_RATIO = {
+    'ONE_PLUS_ONE': 1 / 2,
+    'TWO_PLUS_ONE': 2 / 3,
+}
+
+
+def title_key(title: str) -> str:
+    """
+    바코드가 없을 때 사용할 제목 매칭 키 (title_normalizer의 중복 판단 키)
+
+    Args:
+        title: 상품명
+
+    Returns:
+        정규화된 키 (예: "코카콜라 500ML" → "코카콜라500ml")
+    """
+    return normalize_title(title).dedup_key if title else ''
+
+
+def effective_unit_price(promo: Dict[str, Any]) -> Optional[float]:
+    """
+    행사를 반영한 실질 개당 가격
+
+    Args:
+        promo: 프로모션 데이터 (sale_price, deal_type)
+
+    Returns:
+        개당 가격 (가격 정보가 없으면 None)
+    """
+    price = promo.get('sale_price')
+    if price is None:
+        return None
+    return round(price * DEAL_UNIT_RATIO.get(promo.get('deal_type'), 1), 2)
+
+
+def valid_barcode(barcode: str) -> bool:
+    """
+    GS1 체크 디지트가 맞는 EAN-8/EAN-13/EAN-14 바코드인지
+
+    Args:
+        barcode: 바코드 문자열
+
+    Returns:
+        유효하면 True (예: "8801094017200" → True, "8801043" → False)
+    """
+    if not barcode or not barcode.isdigit() or len(barcode) not in (8, 13, 14):
+        return False
+    digits = [int(d) for d in barcode]
+    # 체크 디지트 바로 앞 자리부터 가중치 3, 1, 3, 1 ...
+    total = sum(d * (3 if i % 2 == 0 else 1) for i, d in enumerate(reversed(digits[:-1])))
+    return (10 - total % 10) % 10 == digits[-1]
+
+
+def _shared_barcodes(promotions_by_brand: Dict[str, List[Dict[str, Any]]]) -> set:
+    """같은 브랜드 안에서 서로 다른 제목 키에 쓰인 바코드 (상품 식별자가 아니므로 연결에서 제외)"""
+    shared = set()
+    for promotions in promotions_by_brand.values():
+        titles: Dict[str, set] = {}
+        for promo in promotions:
+            barcode = (promo.get('barcode') or '').strip()
+            if barcode:
+                titles.setdefault(barcode, set()).add(title_key(promo.get('title')))
+        shared.update(barcode for barcode, keys in titles.items() if len(keys) > 1)
+    return shared
+
+
+class _UnionFind:
+    """바코드/제목 키 노드 연결용 union-find"""
+
+    def __init__(self):
+        self.parent: Dict[str, str] = {}
+
+    def find(self, node: str) -> str:
+        parent = self.parent.setdefault(node, node)
+        while parent != self.parent[parent]:
+            self.parent[parent] = self.parent[self.parent[parent]]
+            parent = self.parent[parent]
+        self.parent[node] = parent
+        return parent
+
+    def union(self, a: str, b: str):
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def build_compare_groups(promotions_by_brand: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    브랜드 간 비교 그룹 생성
+
+    같은 바코드 또는 같은 제목 키를 공유하는 프로모션은 같은 상품으로 보고 하나의 그룹으로 연결.
+    바코드는 valid_barcode를 통과하고 브랜드 안에서 한 상품에만 쓰인 경우만 사용.
+    2개 이상 브랜드에 있는 그룹만 반환.
+
+    Args:
+        promotions_by_brand: 브랜드명 → 프로모션 리스트 (id, title, barcode, deal_type, sale_price, start_date)
+
+    Returns:
+        [
+            {
+                'group_key': 'barcode:8801094017200',
+                'match_type': 'barcode',          # barcode 또는 title
+                'title': '코카콜라 500ml',          # 최저가 프로모션 제목
+                'barcode': '8801094017200',
+                'brand_count': 3,
+                'min_unit_price': 1050.0,
+                'cheapest_brand': 'GS25',
+                'promo_ids': [...],               # 브랜드별 최저가 프로모션 (개당 가격 오름차순)
+                'start_date': '2025-10-01'
+            },
+            ...
+        ]
+    """
+    uf = _UnionFind()
+    shared = _shared_barcodes(promotions_by_brand)
+    entries = []
+    for brand_name, promotions in promotions_by_brand.items():
+        for promo in promotions:
+            unit_price = effective_unit_price(promo)
+            key = title_key(promo.get('title'))
+            barcode = (promo.get('barcode') or '').strip()
+            if not valid_barcode(barcode) or barcode in shared:
+                barcode = ''
+            if unit_price is None or not (key or barcode):
+                continue
+            nodes = [f"t:{key}"] if key else []
+            if barcode:
+                nodes.append(f"b:{barcode}")
+            for node in nodes[1:]:
+                uf.union(nodes[0], node)
+            entries.append((nodes[0], brand_name, unit_price, barcode, promo))
+
+    # 그룹 → 브랜드 → 최저가 항목
+    groups: Dict[str, Dict[str, tuple]] = {}
+    barcodes: Dict[str, set] = {}
+    for node, brand_name, unit_price, barcode, promo in entries:
+        root = uf.find(node)
+        best = groups.setdefault(root, {}).get(brand_name)
+        if best is None or unit_price < best[0]:
+            groups[root][brand_name] = (unit_price, promo)
+        if barcode:
+            barcodes.setdefault(root, set()).add(barcode)
+
+    result = []
+    for root, by_brand in groups.items():
+        if len(by_brand) < 2:
+            continue
+        members = sorted(by_brand.items(), key=lambda item: item[1][0])
+        cheapest_brand, (min_unit_price, cheapest) = members[0]
+        group_barcodes = sorted(barcodes.get(root, ()))
+        result.append({
+            'group_key': f"barcode:{group_barcodes[0]}" if group_barcodes else f"title:{root[2:]}",
+            'match_type': 'barcode' if group_barcodes else 'title',
+            'title': cheapest.get('title'),
+            'barcode': group_barcodes[0] if group_barcodes else None,
+            'brand_count': len(members),
+            'min_unit_price': min_unit_price,
+            'cheapest_brand': cheapest_brand,
+            'promo_ids': [promo['id'] for _, (_, promo) in members],
+            'start_date': cheapest.get('start_date'),
+        })
+    return result
+
+
+def refresh_compare_groups(client, start_date: str = None) -> Dict[str, Any]:
+    """
+    이번 달 비교 그룹 재계산 후 저장 (upsert + 사라진 그룹 삭제)
+
+    Args:
+        client: SupabaseClient
+        start_date: 행사 시작일 (기본값: 이번 달 1일)
+
+    Returns:
+        {'groups': 420, 'barcode_groups': 300, 'title_groups': 120, 'removed': 5}
+    """
+    start_date = start_date or datetime.now().replace(day=1).strftime('%Y-%m-%d')
+
+    promotions_by_brand = client.get_month_promotions(start_date, 'id,title,barcode,deal_type,sale_price,start_date')
+    groups = build_compare_groups(promotions_by_brand)
+    updated_at = datetime.now().astimezone().isoformat()
+    for group in groups:
+        group['start_date'] = start_date
+        group['updated_at'] = updated_at
+
+    for i in range(0, len(groups), 500):
+        client.client.table(TABLE).upsert(groups[i:i + 500], on_conflict='start_date,group_key').execute()
+
+    # 이번 계산에 없는 그룹 삭제
+    keys = {g['group_key'] for g in groups}
+    stale, last_key = [], ''
+    while True:
+        page = (client.client.table(TABLE).select('group_key').eq('start_date', start_date).gt('group_key', last_key)
+                .order('group_key').limit(config.DB_PAGE_SIZE).execute().data or [])
+        if not page:
+            break
+        stale.extend(row['group_key'] for row in page if row['group_key'] not in keys)
+        last_key = page[-1]['group_key']
+    for i in range(0, len(stale), 50):
+        client.client.table(TABLE).delete().eq('start_date', start_date).in_('group_key', stale[i:i + 50]).execute()
+
+    stats = {
+        'groups': len(groups),
+        'barcode_groups': sum(1 for g in groups if g['match_type'] == 'barcode'),
+        'title_groups': sum(1 for g in groups if g['match_type'] == 'title'),
+        'removed': len(stale),
+    }
+    logger.info(
+        f"Compare groups for {start_date}: {stats['groups']} "
+        f"(barcode {stats['barcode_groups']}, title {stats['title_groups']}), removed {stats['removed']}"
+    )
+    return stats
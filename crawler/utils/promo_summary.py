@@ -0,0 +1,132 @@
+"""
+프로모션 집계 (promo_summary)
+- (브랜드, 카테고리, 행사 유형, 월) 별 개수, 실질 개당 가격 최소/중앙/최대, 최신 상품
+- 이번 실행에서 변경(신규/업데이트/삭제)이 있는 그룹만 다시 계산해서 upsert
+- 홈 화면 필터(카테고리/브랜드/행사 뱃지)의 개수, 가격 범위를 promo 전체 스캔 없이 조회
+"""
+import statistics
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, Optional, Set
+from utils.logger import setup_logger
+from utils.price_compare import effective_unit_price
+from utils.snapshot_diff import ChangeSet
+
+logger = setup_logger("promo_summary")
+
+TABLE = 'promo_summary'
+NEWEST_LIMIT = 5
+
+GroupKey = Tuple[str, str]  # (category, deal_type)
+
+
+def group_key(promo: Dict[str, Any]) -> GroupKey:
+    """집계 그룹 키 (카테고리가 없으면 빈 문자열)"""
+    return (promo.get('category') or '', promo.get('deal_type') or '')
+
+
+def touched_groups(changes: ChangeSet) -> Set[GroupKey]:
+    """
+    변경이 있는 집계 그룹
+
+    업데이트는 카테고리/행사 유형이 바뀌었을 수 있으므로 이전/새 그룹 모두 포함.
+    """
+    groups = {group_key(p) for p in changes.added.values()}
+    groups.update(group_key(p) for p in changes.updated.values())
+    groups.update(group_key(p) for p in changes.previous.values())
+    groups.update(group_key(p) for p in changes.deleted.values())
+    return groups
+
+
+def compute_summaries(promotions: List[Dict[str, Any]], groups: Optional[Set[GroupKey]] = None,
+                      first_seen: Optional[Dict[str, str]] = None) -> Dict[GroupKey, Dict[str, Any]]:
+    """
+    크롤링 결과를 한 번 순회하며 그룹별 집계
+
+    Args:
+        promotions: 한 브랜드의 한 달 프로모션 전체
+        groups: 계산할 그룹 (None이면 전체)
+        first_seen: 제목 → 처음 수집 시각 (최신 상품 정렬용, 없으면 제목 순)
+
+    Returns:
+        그룹 키 → {'item_count', 'min_price', 'median_price', 'max_price', 'newest'}
+    """
+    first_seen = first_seen or {}
+    prices: Dict[GroupKey, List[float]] = {}
+    members: Dict[GroupKey, List[Dict[str, Any]]] = {}
+    for promo in promotions:
+        key = group_key(promo)
+        if groups is not None and key not in groups:
+            continue
+        members.setdefault(key, []).append(promo)
+        price = effective_unit_price(promo)
+        if price is not None:
+            prices.setdefault(key, []).append(price)
+
+    summaries = {}
+    for key, items in members.items():
+        values = prices.get(key, [])
+        newest = sorted(items, key=lambda p: (first_seen.get(p.get('title'), ''), p.get('title') or ''), reverse=True)
+        summaries[key] = {
+            'item_count': len(items),
+            'min_price': min(values) if values else None,
+            'median_price': statistics.median(values) if values else None,
+            'max_price': max(values) if values else None,
+            'newest': [
+                {'title': p.get('title'), 'sale_price': p.get('sale_price'), 'image_url': p.get('image_url')}
+                for p in newest[:NEWEST_LIMIT]
+            ],
+        }
+    return summaries
+
+
+def update_summaries(client, brand_name: str, start_date: str, promotions: List[Dict[str, Any]],
+                     changes: Optional[ChangeSet], first_seen: Optional[Dict[str, str]] = None) -> Dict[str, int]:
+    """
+    변경된 그룹만 다시 계산해서 promo_summary에 반영
+
+    Args:
+        client: SupabaseClient
+        brand_name: 브랜드명
+        start_date: 행사 시작일 (월)
+        promotions: 이번에 저장한 프로모션 전체
+        changes: 이전 스냅샷 대비 변경 세트 (None이면 전체 그룹 계산)
+        first_seen: 제목 → 처음 수집 시각
+
+    Returns:
+        {'upserted': 6, 'deleted': 1}
+    """
+    groups = touched_groups(changes) if changes is not None else None
+    if groups is not None and not groups:
+        logger.info(f"{brand_name}: no summary groups changed")
+        return {'upserted': 0, 'deleted': 0}
+
+    brand_id = client.get_brand_id(brand_name)
+    summaries = compute_summaries(promotions, groups, first_seen)
+    updated_at = datetime.now().astimezone().isoformat()
+    rows = [
+        {
+            'brand_id': brand_id,
+            'month': start_date,
+            'category': category,
+            'deal_type': deal_type,
+            **summary,
+            'updated_at': updated_at,
+        }
+        for (category, deal_type), summary in summaries.items()
+    ]
+    if rows:
+        client.client.table(TABLE).upsert(rows, on_conflict='brand_id,month,category,deal_type').execute()
+
+    # 상품이 모두 빠진 그룹 삭제 (전체 계산이면 DB에 남아 있는 그룹과 비교)
+    if groups is None:
+        existing = client.client.table(TABLE).select('category,deal_type') \
+            .eq('brand_id', brand_id).eq('month', start_date).execute().data or []
+        groups = {(row['category'], row['deal_type']) for row in existing}
+    emptied = groups - set(summaries)
+    for category, deal_type in emptied:
+        client.client.table(TABLE).delete().eq('brand_id', brand_id).eq('month', start_date) \
+            .eq('category', category).eq('deal_type', deal_type).execute()
+
+    stats = {'upserted': len(rows), 'deleted': len(emptied)}
+    logger.info(f"{brand_name}: promo_summary upserted {stats['upserted']} groups, deleted {stats['deleted']}")
+    return stats
@@ -0,0 +1,87 @@
+"""
+프로모션 데이터 공통 유틸리티
+- 프로모션 고유 키 생성
+- 콘텐츠 해시 (변경 감지용 fingerprint)
+- DB(promo 테이블) 저장용 row 변환
+"""
+import hashlib
+import json
+from typing import Dict, Any
+
+# promo 테이블에 저장하는 크롤링 필드 (brand_id 제외)
+PROMO_FIELDS = [
+    'title',
+    'raw_title',
+    'barcode',
+    'category',
+    'deal_type',
+    'normal_price',
+    'sale_price',
+    'start_date',
+    'end_date',
+    'image_url',
+    'source_url',
+    'description',
+]
+
+# 콘텐츠 해시 컬럼 (PROMO_FIELDS 전체의 fingerprint)
+HASH_FIELD = 'content_hash'
+
+
+def make_promotion_key(promo: Dict[str, Any], brand_id: str = None) -> str:
+    """
+    프로모션 고유 키 생성 (중복 확인용)
+
+    Args:
+        promo: 프로모션 데이터
+        brand_id: 브랜드 ID (선택)
+
+    Returns:
+        고유 키 (brand_id + title + start_date)
+    """
+    title = promo.get('title', '')
+    start_date = promo.get('start_date', '')
+
+    # 같은 브랜드 내에서 같은 제목의 프로모션은 시작일 기준으로 하나만 존재
+    if brand_id:
+        return f"{brand_id}_{title}_{start_date}"
+    else:
+        return f"{title}_{start_date}"
+
+
+def content_hash(promo: Dict[str, Any]) -> str:
+    """
+    프로모션 콘텐츠 해시 계산 (필드 순서 고정, 어떤 필드가 바뀌어도 값이 달라짐)
+
+    Args:
+        promo: 프로모션 데이터
+
+    Returns:
+        32자리 hex 문자열
+    """
+    values = [promo.get(field) for field in PROMO_FIELDS]
+    payload = json.dumps(values, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def get_content_hash(promo: Dict[str, Any]) -> str:
+    """크롤링 시 계산해 둔 해시 (없으면 계산)"""
+    return promo.get(HASH_FIELD) or content_hash(promo)
+
+
+def to_promo_row(promo: Dict[str, Any], brand_id: str) -> Dict[str, Any]:
+    """
+    크롤링 데이터를 promo 테이블 row로 변환
+
+    Args:
+        promo: 크롤링한 프로모션 데이터
+        brand_id: 브랜드 UUID
+
+    Returns:
+        brand_id/content_hash가 추가되고 저장 필드만 남긴 딕셔너리
+    """
+    row = {'brand_id': brand_id}
+    for field in PROMO_FIELDS:
+        row[field] = promo.get(field)
+    row[HASH_FIELD] = get_content_hash(promo)
+    return row
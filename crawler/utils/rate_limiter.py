@@ -0,0 +1,29 @@
+"""
+요청 간격 제한 유틸리티
+- 크롤러 하나의 모든 워커 스레드가 공유하는 최소 요청 간격 (CRAWL_DELAY)
+- 워커를 늘려도 사이트에 보내는 요청 속도는 단일 스레드와 같음 (응답 대기 시간만 겹침)
+"""
+import threading
+import time
+
+
+class RateLimiter:
+    """요청 시작 간격을 최소 interval초로 제한 (스레드 안전)"""
+
+    def __init__(self, interval: float):
+        """
+        Args:
+            interval: 요청 시작 사이 최소 간격(초)
+        """
+        self.interval = interval
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """다음 요청 차례까지 대기 (락은 차례 예약에만 사용, 대기는 락 밖에서)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
@@ -0,0 +1,260 @@
+"""
+한국어 n-gram 검색 색인
+- 정규화 제목/설명/카테고리를 한글 음절 bigram + 자모 분해 prefix 토큰으로 색인
+- 자모 prefix 덕분에 입력 중인 글자("신ㄹ", "실")도 매칭
+- 토큰 첫 글자 코드 % 샤드 수로 나눈 JSON 샤드 + manifest로 저장 (프론트/엣지 함수에서 필요한 샤드만 로드)
+- 빌드 시간, 색인 크기를 매 실행 기록
+
+검색 방법 (프론트 구현 기준):
+1. query_tokens(query)로 토큰 생성
+2. 각 토큰의 샤드(shard_for) 로드 → postings(간격 인코딩된 문서 번호) 복원
+3. 모든 토큰 postings 교집합 → docs.json의 문서
+"""
+import glob
+import json
+import os
+import re
+import time
+from datetime import datetime
+from typing import List, Dict, Any, Iterable
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("search_index")
+
+FORMAT_VERSION = 1
+PREFIX_MARK = '^'       # 자모 prefix 토큰 표시 (bigram 토큰과 구분)
+MAX_PREFIX_JAMO = 6     # prefix 토큰 최대 자모 길이
+
+# 한글 호환 자모 (입력기에서 조합 중인 글자와 같은 코드)
+_CHO = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+_JONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+         'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+_WORD = re.compile(r'[0-9a-z가-힣ㄱ-ㅣ]+')
+
+
+def decompose(text: str) -> str:
+    """
+    한글 음절을 자모로 분해 (그 외 문자는 그대로)
+
+    Args:
+        text: 문자열 (예: "신라면")
+
+    Returns:
+        자모 문자열 (예: "ㅅㅣㄴㄹㅏㅁㅕㄴ")
+    """
+    out = []
+    for ch in text:
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            out.append(_CHO[code // 588])
+            out.append(_JUNG[(code % 588) // 28])
+            out.append(_JONG[code % 28])
+        else:
+            out.append(ch)
+    return ''.join(out)
+
+
+def _words(text: str) -> List[str]:
+    return _WORD.findall((text or '').lower())
+
+
+def document_tokens(texts: Iterable[str]) -> set:
+    """
+    문서 색인 토큰 (음절 bigram + 각 음절 위치에서 시작하는 자모 prefix)
+
+    Args:
+        texts: 색인할 필드 값들 (제목, 설명, 카테고리)
+
+    Returns:
+        토큰 집합
+    """
+    tokens = set()
+    for text in texts:
+        for word in _words(text):
+            if len(word) == 1:
+                tokens.add(word)
+            for i in range(len(word) - 1):
+                tokens.add(word[i:i + 2])
+            for i in range(len(word)):
+                jamo = decompose(word[i:i + 3])[:MAX_PREFIX_JAMO]
+                for j in range(1, len(jamo) + 1):
+                    tokens.add(PREFIX_MARK + jamo[:j])
+    return tokens
+
+
+def query_tokens(query: str) -> List[str]:
+    """
+    검색어 토큰 (완성된 2글자 이상 단어는 bigram, 그 외에는 자모 prefix)
+
+    Args:
+        query: 검색어 (입력 중인 자모 포함 가능)
+
+    Returns:
+        모두 포함해야 하는 토큰 리스트
+    """
+    tokens = []
+    for word in _words(query):
+        complete = all('가' <= ch <= '힣' or ch.isalnum() and ch.isascii() for ch in word)
+        if complete and len(word) >= 2:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(PREFIX_MARK + decompose(word[-3:] if len(word) > 3 else word)[:MAX_PREFIX_JAMO])
+            if len(word) > 3:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 3))
+    return tokens
+
+
+def shard_for(token: str, shard_count: int = None) -> int:
+    """토큰이 속한 샤드 번호 (첫 글자 코드 기준, JS: token.charCodeAt(0) % n)"""
+    shard_count = shard_count or config.SEARCH_INDEX_SHARDS
+    key = token[1:] if token.startswith(PREFIX_MARK) else token
+    return ord(key[0]) % shard_count
+
+
+def _write_json(path: str, data: Any) -> int:
+    """JSON을 임시 파일에 쓴 뒤 교체, 기록한 바이트 수 반환"""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    with open(path + '.tmp', 'wb') as f:
+        f.write(payload)
+    os.replace(path + '.tmp', path)
+    return len(payload)
+
+
+def build_search_index(promotions_by_brand: Dict[str, List[Dict[str, Any]]], output_dir: str = None) -> Dict[str, Any]:
+    """
+    검색 색인 빌드 및 저장
+
+    Args:
+        promotions_by_brand: 브랜드명 → 프로모션 리스트 (id, title, description, category, deal_type, sale_price, image_url)
+        output_dir: 저장 디렉토리 (기본값: config.SEARCH_INDEX_DIR)
+
+    Returns:
+        {'docs': 9800, 'tokens': 52000, 'postings': 610000, 'bytes': 2400000, 'seconds': 1.8}
+    """
+    output_dir = output_dir or config.SEARCH_INDEX_DIR
+    shard_count = config.SEARCH_INDEX_SHARDS
+    started = time.perf_counter()
+
+    promotions = sorted(
+        ((brand_name, p) for brand_name, items in promotions_by_brand.items() for p in items),
+        key=lambda item: (item[0], item[1].get('title') or '', item[1].get('id') or ''),
+    )
+
+    docs = []
+    postings: Dict[str, List[int]] = {}
+    for doc_id, (brand_name, promo) in enumerate(promotions):
+        docs.append([
+            promo.get('id'), brand_name, promo.get('title'), promo.get('deal_type'),
+            promo.get('sale_price'), promo.get('image_url'),
+        ])
+        for token in document_tokens([promo.get('title'), promo.get('description'), promo.get('category')]):
+            postings.setdefault(token, []).append(doc_id)
+
+    # 토큰 → 간격 인코딩된 문서 번호 (문서 번호가 오름차순이므로 작은 정수 위주 → JSON 크기 감소)
+    shards: List[Dict[str, List[int]]] = [{} for _ in range(shard_count)]
+    total_postings = 0
+    for token in sorted(postings):
+        doc_ids = postings[token]
+        total_postings += len(doc_ids)
+        shards[shard_for(token, shard_count)][token] = [doc_ids[0]] + [b - a for a, b in zip(doc_ids, doc_ids[1:])]
+
+    os.makedirs(output_dir, exist_ok=True)
+    total_bytes = _write_json(os.path.join(output_dir, 'docs.json'), {
+        'fields': ['id', 'brand', 'title', 'deal_type', 'sale_price', 'image_url'],
+        'docs': docs,
+    })
+    shard_info = []
+    for i, shard in enumerate(shards):
+        size = _write_json(os.path.join(output_dir, f"shard_{i:02d}.json"), shard)
+        total_bytes += size
+        shard_info.append({'file': f"shard_{i:02d}.json", 'tokens': len(shard), 'bytes': size})
+    # 샤드 수가 줄었을 때 남은 이전 샤드 정리
+    for path in glob.glob(os.path.join(output_dir, 'shard_*.json')):
+        if int(os.path.basename(path)[6:8]) >= shard_count:
+            os.remove(path)
+
+    stats = {
+        'docs': len(docs),
+        'tokens': len(postings),
+        'postings': total_postings,
+        'bytes': total_bytes,
+        'seconds': round(time.perf_counter() - started, 3),
+    }
+    _write_json(os.path.join(output_dir, 'manifest.json'), {
+        'version': FORMAT_VERSION,
+        'built_at': datetime.now().isoformat(timespec='seconds'),
+        'shard_count': shard_count,
+        'prefix_mark': PREFIX_MARK,
+        'max_prefix_jamo': MAX_PREFIX_JAMO,
+        'shards': shard_info,
+        'stats': stats,
+    })
+
+    logger.info(
+        f"Search index built: {stats['docs']} docs, {stats['tokens']} tokens, {stats['postings']} postings, "
+        f"{stats['bytes'] / 1_000_000:.2f} MB in {stats['seconds']}s → {output_dir}"
+    )
+    return stats
+
+
+def refresh_search_index(client, start_date: str = None) -> Dict[str, Any]:
+    """
+    이번 달 프로모션으로 검색 색인 재생성
+
+    Args:
+        client: SupabaseClient
+        start_date: 행사 시작일 (기본값: 이번 달 1일)
+
+    Returns:
+        build_search_index 통계
+    """
+    start_date = start_date or datetime.now().replace(day=1).strftime('%Y-%m-%d')
+    promotions_by_brand = client.get_month_promotions(
+        start_date, 'id,title,description,category,deal_type,sale_price,image_url'
+    )
+    return build_search_index(promotions_by_brand)
+
+
+def search(query: str, index_dir: str = None) -> List[List[Any]]:
+    """
+    색인 검색 (프론트 검색 로직 확인용 레퍼런스 구현)
+
+    Args:
+        query: 검색어
+        index_dir: 색인 디렉토리 (기본값: config.SEARCH_INDEX_DIR)
+
+    Returns:
+        매칭된 문서 리스트 ([id, brand, title, deal_type, sale_price, image_url])
+    """
+    index_dir = index_dir or config.SEARCH_INDEX_DIR
+    with open(os.path.join(index_dir, 'manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+
+    result = None
+    shards = {}
+    for token in query_tokens(query):
+        shard_no = shard_for(token, manifest['shard_count'])
+        if shard_no not in shards:
+            with open(os.path.join(index_dir, manifest['shards'][shard_no]['file']), encoding='utf-8') as f:
+                shards[shard_no] = json.load(f)
+        gaps = shards[shard_no].get(token, [])
+        doc_ids, current = set(), 0
+        for gap in gaps:
+            current += gap
+            doc_ids.add(current)
+        result = doc_ids if result is None else result & doc_ids
+
+    with open(os.path.join(index_dir, 'docs.json'), encoding='utf-8') as f:
+        docs = json.load(f)['docs']
+    return [docs[i] for i in sorted(result or ())]
+
+
+if __name__ == '__main__':
+    # 검색 확인: python -m utils.search_index "신라"
+    import sys
+
+    for doc in search(sys.argv[1] if len(sys.argv) > 1 else ''):
+        print(json.dumps(doc, ensure_ascii=False))
@@ -0,0 +1,89 @@
+"""
+실행 단위 메모이제이션 + single-flight
+- 같은 키(상품 ID)는 한 번의 크롤링 실행 동안 한 번만 가져옴 (여러 탭/조건에 같은 상품이 나오는 경우)
+- 같은 키를 동시에 요청하면 먼저 온 스레드만 가져오고 나머지는 그 결과를 기다려 공유
+- 실패는 저장하지 않음 (대기 중이던 호출에는 같은 예외 전달, 다음 요청은 다시 시도)
+"""
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class _Flight:
+    """진행 중인 요청 하나 (완료되면 결과 또는 예외 보관)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class SingleFlightMemo:
+    """키별 결과 캐시 + 진행 중 요청 공유"""
+
+    def __init__(self):
+        self._results: Dict[Hashable, Any] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'shared': 0, 'misses': 0, 'errors': 0}
+
+    def get(self, key: Hashable, fetch: Callable[[Hashable], Any]) -> Any:
+        """
+        캐시된 결과 반환, 없으면 fetch(key) 실행 (동시 요청은 한 번만 실행)
+
+        Args:
+            key: 캐시 키 (예: gdIdx, pCd)
+            fetch: 키를 받아 결과를 반환하는 함수
+
+        Returns:
+            fetch 결과
+
+        Raises:
+            fetch에서 발생한 예외 (같은 요청을 기다리던 호출에도 동일하게 전달)
+        """
+        with self._lock:
+            if key in self._results:
+                self.stats['hits'] += 1
+                return self._results[key]
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.stats['misses'] += 1
+            else:
+                self.stats['shared'] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = fetch(key)
+        except BaseException as e:
+            flight.error = e
+            with self._lock:
+                self.stats['errors'] += 1
+            raise
+        else:
+            with self._lock:
+                self._results[key] = flight.result
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+        return flight.result
+
+    def hit_rate(self) -> float:
+        """캐시 또는 진행 중 요청으로 해결한 비율 (0~1)"""
+        total = self.stats['hits'] + self.stats['shared'] + self.stats['misses']
+        return (self.stats['hits'] + self.stats['shared']) / total if total else 0.0
+
+    def summary(self) -> str:
+        """로그용 요약"""
+        total = self.stats['hits'] + self.stats['shared'] + self.stats['misses']
+        return (
+            f"{total} lookups, {self.stats['misses']} fetched, {self.stats['hits']} cached, "
+            f"{self.stats['shared']} shared in-flight, {self.stats['errors']} failed "
+            f"(hit rate {self.hit_rate():.0%})"
+        )
@@ -0,0 +1,150 @@
+"""
+스냅샷 diff 유틸리티
+- 이전 실행의 백업(data/)과 새 크롤링 결과를 로컬에서 비교
+- 신규/업데이트/삭제 변경 세트를 DB 조회 없이 계산
+- DB 저장이 끝난 백업만 기준 스냅샷으로 사용 (sync 마커)
+- 기록 당시 DB의 마지막 수정 시각(updated_at)을 함께 보관 → 다른 경로의 DB 변경 감지
+"""
+import json
+import os
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import config
+from utils.backup import read_backup, sync_marker_path
+from utils.promotion import make_promotion_key, get_content_hash, HASH_FIELD
+from utils.logger import setup_logger
+
+logger = setup_logger("snapshot_diff")
+
+
+class Snapshot(dict):
+    """
+    기준 스냅샷 (키 → 프로모션)
+
+    db_updated_at: 스냅샷 기록 직후 DB의 max(updated_at) (없으면 DB와 일치 여부를 확인할 수 없으므로 DB 조회)
+    """
+
+    def __init__(self, rows: Dict[str, Dict[str, Any]] = None, db_updated_at: Optional[str] = None):
+        super().__init__(rows or {})
+        self.db_updated_at = db_updated_at
+
+
+class ChangeSet:
+    """프로모션 변경 세트 (키 → 프로모션)"""
+
+    def __init__(self):
+        self.added: Dict[str, Dict[str, Any]] = {}
+        self.updated: Dict[str, Dict[str, Any]] = {}    # 키 → 새 프로모션
+        self.deleted: Dict[str, Dict[str, Any]] = {}    # 키 → 이전 프로모션
+        self.unchanged: Dict[str, Dict[str, Any]] = {}
+        self.previous: Dict[str, Dict[str, Any]] = {}   # 업데이트 대상의 이전 프로모션 (id 조회용)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        save_promotions_with_diff와 같은 형식의 통계
+
+        Returns:
+            {'new': 10, 'updated': 5, 'deleted': 3, 'unchanged': 82, 'total': 97}
+        """
+        return {
+            'new': len(self.added),
+            'updated': len(self.updated),
+            'deleted': len(self.deleted),
+            'unchanged': len(self.unchanged),
+            'total': len(self.added) + len(self.updated) + len(self.unchanged),
+        }
+
+
+def diff_snapshots(previous: Dict[str, Dict[str, Any]], promotions: List[Dict[str, Any]]) -> ChangeSet:
+    """
+    이전 스냅샷과 새 크롤링 결과 비교
+
+    Args:
+        previous: 키 → 이전 프로모션 (백업 또는 DB row, content_hash 포함)
+        promotions: 새로 크롤링한 프로모션 리스트
+
+    변경 여부는 content_hash만 비교 (해시가 없는 이전 row는 변경으로 간주)
+
+    Returns:
+        ChangeSet
+    """
+    changes = ChangeSet()
+    new_map = {make_promotion_key(p): p for p in promotions}
+
+    for key, promo in new_map.items():
+        old = previous.get(key)
+        if old is None:
+            changes.added[key] = promo
+        elif old.get(HASH_FIELD) != get_content_hash(promo):
+            changes.updated[key] = promo
+            changes.previous[key] = old
+        else:
+            changes.unchanged[key] = promo
+
+    for key, old in previous.items():
+        if key not in new_map:
+            changes.deleted[key] = old
+
+    return changes
+
+
+def mark_synced(brand_key: str, backup_path: str, start_date: str, rows: int, db_updated_at: str = None):
+    """
+    백업이 DB에 반영되었음을 기록 (다음 실행의 기준 스냅샷)
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+        backup_path: DB에 반영한 크롤링 결과의 백업 경로
+        start_date: 행사 시작일
+        rows: DB에 저장된 프로모션 개수 (키 기준)
+        db_updated_at: 저장 직후 DB의 max(updated_at) (SupabaseClient.promotions_version)
+    """
+    marker = {
+        'backup': os.path.basename(backup_path),
+        'start_date': start_date,
+        'rows': rows,
+        'db_updated_at': db_updated_at,
+        'synced_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    with open(sync_marker_path(brand_key), 'w', encoding='utf-8') as f:
+        json.dump(marker, f, ensure_ascii=False)
+
+
+def load_previous_snapshot(brand_key: str, start_date: str) -> Optional[Snapshot]:
+    """
+    마지막으로 DB에 반영한 백업 로드
+
+    Args:
+        brand_key: 브랜드 키 (예: "cu")
+        start_date: 이번 크롤링의 행사 시작일 (같은 달 스냅샷만 사용)
+
+    Returns:
+        Snapshot (사용 가능한 스냅샷이 없으면 None)
+    """
+    path = sync_marker_path(brand_key)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        marker = json.load(f)
+
+    if marker.get('start_date') != start_date:
+        logger.info(f"{brand_key}: previous snapshot is for {marker.get('start_date')}, not {start_date}")
+        return None
+
+    backup_path = os.path.join(config.DATA_DIR, marker['backup'])
+    if not os.path.exists(backup_path):
+        logger.info(f"{brand_key}: previous backup {marker['backup']} no longer exists")
+        return None
+
+    snapshot = Snapshot(db_updated_at=marker.get('db_updated_at'))
+    for p in read_backup(backup_path):
+        # 해시 컬럼 도입 전 백업도 같은 방식으로 비교할 수 있도록 보정
+        p[HASH_FIELD] = get_content_hash(p)
+        snapshot[make_promotion_key(p)] = p
+    if len(snapshot) != marker.get('rows'):
+        logger.warning(f"{brand_key}: snapshot has {len(snapshot)} keys but marker says {marker.get('rows')}")
+        return None
+
+    logger.info(f"{brand_key}: loaded previous snapshot {marker['backup']} ({len(snapshot)} rows)")
+    return snapshot
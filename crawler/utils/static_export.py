@@ -0,0 +1,179 @@
+"""
+정적 JSON 내보내기 (CDN 배포용)
+- 이번 달 프로모션을 브랜드 × 행사 유형 × 카테고리 샤드로 나눠 결정적(deterministic) JSON으로 저장
+- 파일명에 콘텐츠 해시 포함 → 긴 캐시 수명(immutable)으로 서빙, manifest.json만 짧게 캐시
+- .gz / .br(brotli 설치 시) 사전 압축본 함께 생성
+- 이전 manifest와 해시가 같은 샤드는 다시 쓰지 않음
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+import config
+from utils.logger import setup_logger
+
+logger = setup_logger("static_export")
+
+FORMAT_VERSION = 1
+EXPORT_COLUMNS = 'id,title,raw_title,barcode,category,deal_type,normal_price,sale_price,start_date,end_date,image_url'
+_UNSAFE = re.compile(r'[\\/:*?"<>|\s]+')
+
+
+def _brotli():
+    """brotli 모듈 (선택 의존성)"""
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+
+def _dumps(data: Any) -> bytes:
+    """결정적 JSON 직렬화 (키 정렬, 공백 없음)"""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+
+def _write(path: str, payload: bytes):
+    """임시 파일에 쓴 뒤 교체"""
+    with open(path + '.tmp', 'wb') as f:
+        f.write(payload)
+    os.replace(path + '.tmp', path)
+
+
+def shard_name(brand_name: str, deal_type: str, category: Optional[str]) -> str:
+    """샤드 이름 (예: "CU/ONE_PLUS_ONE/음료")"""
+    category = _UNSAFE.sub('_', category or '기타').strip('_') or '기타'
+    return f"{brand_name}/{deal_type}/{category}"
+
+
+def build_shards(promotions_by_brand: Dict[str, List[Dict[str, Any]]]) -> Dict[str, Dict[str, Any]]:
+    """
+    브랜드 × 행사 유형 × 카테고리 샤드 구성
+
+    Args:
+        promotions_by_brand: 브랜드명 → 프로모션 리스트
+
+    Returns:
+        샤드 이름 → {'brand', 'deal_type', 'category', 'items'} (items는 제목/id 순 정렬)
+    """
+    shards: Dict[str, Dict[str, Any]] = {}
+    for brand_name, promotions in promotions_by_brand.items():
+        for promo in promotions:
+            name = shard_name(brand_name, promo.get('deal_type'), promo.get('category'))
+            shard = shards.setdefault(name, {
+                'brand': brand_name,
+                'deal_type': promo.get('deal_type'),
+                'category': promo.get('category'),
+                'items': [],
+            })
+            shard['items'].append(promo)
+    for shard in shards.values():
+        shard['items'].sort(key=lambda p: (p.get('title') or '', p.get('id') or ''))
+    return shards
+
+
+def export_static(promotions_by_brand: Dict[str, List[Dict[str, Any]]], start_date: str,
+                  output_dir: str = None) -> Dict[str, Any]:
+    """
+    샤드 JSON + 사전 압축본 + manifest 저장
+
+    Args:
+        promotions_by_brand: 브랜드명 → 프로모션 리스트
+        start_date: 행사 시작일 (월)
+        output_dir: 출력 디렉토리 (기본값: config.EXPORT_DIR)
+
+    Returns:
+        {'shards': 48, 'written': 5, 'skipped': 43, 'removed': 1, 'bytes': 2100000}
+    """
+    output_dir = output_dir or config.EXPORT_DIR
+    manifest_path = os.path.join(output_dir, 'manifest.json')
+    previous = {}
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            previous = json.load(f).get('shards', {})
+
+    brotli = _brotli()
+    if brotli is None:
+        logger.warning("brotli is not installed, skipping .br variants")
+
+    shards = build_shards(promotions_by_brand)
+    entries = {}
+    written = skipped = total_bytes = 0
+    for name in sorted(shards):
+        shard = shards[name]
+        payload = _dumps({'version': FORMAT_VERSION, 'month': start_date, **shard})
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        path = f"shards/{name}.{digest[:12]}.json"
+        entries[name] = {
+            'path': path,
+            'hash': digest,
+            'bytes': len(payload),
+            'count': len(shard['items']),
+            'brand': shard['brand'],
+            'deal_type': shard['deal_type'],
+            'category': shard['category'],
+        }
+        total_bytes += len(payload)
+
+        full_path = os.path.join(output_dir, path)
+        if previous.get(name, {}).get('hash') == digest and os.path.exists(full_path):
+            skipped += 1
+            continue
+
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        _write(full_path, payload)
+        # mtime=0 → 같은 내용이면 .gz도 바이트 단위로 같음
+        _write(full_path + '.gz', gzip.compress(payload, compresslevel=9, mtime=0))
+        if brotli is not None:
+            _write(full_path + '.br', brotli.compress(payload, quality=11))
+        written += 1
+
+    # manifest에 없는 이전 샤드 파일 정리
+    removed = 0
+    current_paths = {os.path.join(output_dir, e['path']) for e in entries.values()}
+    for old in previous.values():
+        old_path = os.path.join(output_dir, old['path'])
+        if old_path in current_paths:
+            continue
+        for suffix in ('', '.gz', '.br'):
+            if os.path.exists(old_path + suffix):
+                os.remove(old_path + suffix)
+        removed += 1
+
+    manifest = {
+        'version': FORMAT_VERSION,
+        'month': start_date,
+        'shards': entries,
+    }
+    manifest_payload = _dumps(manifest)
+    os.makedirs(output_dir, exist_ok=True)
+    _write(manifest_path, manifest_payload)
+    _write(manifest_path + '.gz', gzip.compress(manifest_payload, compresslevel=9, mtime=0))
+    if brotli is not None:
+        _write(manifest_path + '.br', brotli.compress(manifest_payload, quality=11))
+
+    stats = {'shards': len(entries), 'written': written, 'skipped': skipped, 'removed': removed, 'bytes': total_bytes}
+    logger.info(
+        f"Static export for {start_date}: {stats['shards']} shards ({stats['written']} written, "
+        f"{stats['skipped']} unchanged, {stats['removed']} removed), {stats['bytes'] / 1_000_000:.2f} MB → {output_dir}"
+    )
+    return stats
+
+
+def refresh_static_export(client, start_date: str = None) -> Dict[str, Any]:
+    """
+    이번 달 프로모션을 DB에서 읽어 정적 JSON 내보내기
+
+    Args:
+        client: SupabaseClient
+        start_date: 행사 시작일 (기본값: 이번 달 1일)
+
+    Returns:
+        export_static 통계
+    """
+    start_date = start_date or datetime.now().replace(day=1).strftime('%Y-%m-%d')
+    promotions_by_brand = client.get_month_promotions(start_date, EXPORT_COLUMNS)
+    return export_static(promotions_by_brand, start_date)
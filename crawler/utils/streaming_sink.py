@@ -0,0 +1,181 @@
+"""
+크롤링 → DB 스트리밍 저장
+- 크롤러 페이지 리스너로 붙여서 상품을 받는 즉시 버퍼링, 크기(행 수) 또는 시간 기준으로 배치 INSERT/UPDATE
+- 쓰기는 별도 스레드에서 처리 (크롤링 네트워크 대기와 DB 쓰기 네트워크 대기를 겹침), 큐 크기로 backpressure
+- diff의 삭제 단계는 크롤링이 끝까지 완료된 것이 확인된 뒤 finish()에서만 실행 (실패한 크롤링은 절대 삭제하지 않음)
+"""
+import queue
+import threading
+import time
+import uuid
+from typing import List, Dict, Any, Optional
+import config
+from utils.logger import setup_logger, update_log_context
+from utils.batch_writer import BatchWriter
+from utils.promotion import make_promotion_key, get_content_hash, to_promo_row, HASH_FIELD
+from utils.snapshot_diff import diff_snapshots
+
+logger = setup_logger("streaming_sink")
+
+_DONE = object()
+
+
+class StreamingSink:
+    """브랜드 하나의 크롤링 결과를 페이지 단위로 DB에 반영하는 sink"""
+
+    def __init__(self, client, brand_name: str, previous: Optional[Dict[str, Dict[str, Any]]] = None,
+                 batch_rows: int = None, flush_seconds: float = None, queue_size: int = None):
+        """
+        Args:
+            client: SupabaseClient
+            brand_name: 브랜드명 (예: "CU")
+            previous: 이전 실행의 로컬 스냅샷 (DB 개수/max(updated_at)와 일치하면 DB 조회 없이 diff 기준으로 사용)
+            batch_rows: 이 행 수만큼 모이면 바로 쓰기 (기본값: config.STREAM_BATCH_ROWS)
+            flush_seconds: 마지막 쓰기 후 이 시간이 지나면 모인 만큼 쓰기 (기본값: config.STREAM_FLUSH_SECONDS)
+            queue_size: 쓰기 대기 배치 최대 수, 넘으면 크롤러가 기다림 (기본값: config.STREAM_QUEUE_SIZE)
+        """
+        self.client = client
+        self.brand_name = brand_name
+        self.previous = previous
+        self.batch_rows = batch_rows or config.STREAM_BATCH_ROWS
+        self.flush_seconds = flush_seconds or config.STREAM_FLUSH_SECONDS
+        self.brand_id: Optional[str] = None
+        self.start_date: Optional[str] = None
+        self.existing: Dict[str, Dict[str, Any]] = {}   # 키 → 크롤링 전 DB 상태
+        self.written: Dict[str, Dict[str, Any]] = {}    # 키 → 이번 실행에서 쓴 row (id, content_hash)
+        self.stats = {'inserted': 0, 'updated': 0, 'batches': 0, 'first_write_seconds': None}
+
+        self._buffer: List[Dict[str, Any]] = []
+        self._buffer_lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size or config.STREAM_QUEUE_SIZE)
+        self._error: Optional[Exception] = None
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._writer, name=f"sink-{brand_name}", daemon=True)
+        self._thread.start()
+
+    def write(self, products: List[Dict[str, Any]]):
+        """
+        페이지 리스너: 상품을 버퍼에 넣고 배치 크기가 차면 쓰기 스레드로 넘김
+
+        쓰기가 실패한 뒤에는 아무것도 하지 않음 (크롤링/백업은 계속, 오류는 finish()에서 발생)
+
+        Args:
+            products: 페이지에서 파싱한 상품 리스트
+        """
+        if self._error is not None or not products:
+            return
+        with self._buffer_lock:
+            self._buffer.extend(products)
+            batch = self._take_buffer() if len(self._buffer) >= self.batch_rows else None
+        if batch:
+            self._queue.put(batch)
+
+    def _take_buffer(self) -> List[Dict[str, Any]]:
+        batch, self._buffer = self._buffer, []
+        return batch
+
+    def _writer(self):
+        """쓰기 스레드: 배치가 오거나 flush 시간이 지나면 DB 반영"""
+        update_log_context(brand=self.brand_name)
+        while True:
+            try:
+                batch = self._queue.get(timeout=self.flush_seconds)
+            except queue.Empty:
+                # 시간 기준 flush (페이지가 느리게 들어와도 모인 만큼은 바로 보이도록)
+                with self._buffer_lock:
+                    batch = self._take_buffer()
+            if batch is _DONE:
+                return
+            if not batch or self._error is not None:
+                continue
+            try:
+                self._apply(batch)
+            except Exception as e:
+                logger.error(f"{self.brand_name}: streaming write failed, remaining pages are buffered for finish: {e}")
+                self._error = e
+
+    def _load_existing(self, start_date: str):
+        """첫 배치에서 diff 기준 데이터 로드"""
+        self.start_date = start_date
+        self.brand_id = self.client.get_brand_id(self.brand_name)
+        self.existing = self.client.load_existing_map(self.brand_id, start_date, self.previous)
+
+    def _apply(self, products: List[Dict[str, Any]]):
+        """
+        배치를 DB에 반영 (신규는 INSERT, 해시가 바뀐 기존/이번 실행 row는 UPDATE, 삭제는 하지 않음)
+
+        Args:
+            products: 상품 리스트 (같은 키가 여러 번 나오면 마지막 값 기준)
+        """
+        if self.brand_id is None:
+            self._load_existing(products[0].get('start_date'))
+
+        inserts = []
+        updates = []
+        for key, promo in {make_promotion_key(p): p for p in products}.items():
+            content_hash = get_content_hash(promo)
+            current = self.written.get(key) or self.existing.get(key)
+            if current is None:
+                row = to_promo_row(promo, self.brand_id)
+                row['id'] = str(uuid.uuid4())
+                inserts.append(row)
+                self.written[key] = {'id': row['id'], 'title': promo.get('title'), HASH_FIELD: content_hash}
+            elif current.get(HASH_FIELD) != content_hash:
+                updates.append((current, promo))
+                self.written[key] = {'id': current.get('id'), 'title': promo.get('title'), HASH_FIELD: content_hash}
+
+        inserted = BatchWriter(self.client.client).insert(inserts)['rows'] if inserts else 0
+        for current, promo in updates:
+            self.client.update_promotion(self.brand_id, self.start_date, current, promo)
+
+        self.stats['inserted'] += inserted
+        self.stats['updated'] += len(updates)
+        self.stats['batches'] += 1
+        if (inserts or updates) and self.stats['first_write_seconds'] is None:
+            self.stats['first_write_seconds'] = round(time.perf_counter() - self._started, 1)
+            logger.info(f"{self.brand_name}: first rows visible {self.stats['first_write_seconds']}s after crawl start")
+
+    def close(self):
+        """쓰기 스레드 종료 (남은 버퍼는 finish()에서 처리)"""
+        if self._thread.is_alive():
+            self._queue.put(_DONE)
+            self._thread.join()
+
+    def finish(self, complete: bool, promotions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        스트리밍 종료: 최종 결과로 한 번 더 맞춘 뒤 크롤링이 완료된 경우에만 삭제 반영
+
+        Args:
+            complete: 크롤링이 끝까지 완료되었는지 (False면 삭제 생략)
+            promotions: 최종 프로모션 리스트 (근사 중복 제거 후)
+
+        Returns:
+            save_promotions_with_diff와 같은 형식의 통계 (크롤링 전 DB 상태 기준)
+        """
+        self.close()
+        if self._error is not None:
+            raise self._error
+        if not promotions:
+            logger.warning(f"No promotions to save for {self.brand_name}")
+            return {'new': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 0}
+
+        # 스트리밍 중 쓴 내용과 최종 리스트가 다른 부분(같은 키 중복, 근사 중복 제거 등) 정리
+        self._apply(promotions)
+        changes = diff_snapshots(self.existing, promotions)
+
+        final_keys = {make_promotion_key(p) for p in promotions}
+        stale = [row for key, row in {**self.existing, **self.written}.items() if key not in final_keys]
+        if not complete:
+            changes.deleted = {}
+            if stale:
+                logger.warning(f"{self.brand_name}: crawl incomplete, keeping {len(stale)} promotions not seen this run")
+        elif stale:
+            self.client.delete_promotions(self.brand_id, self.start_date, stale)
+
+        stats = changes.stats()
+        logger.info(
+            f"Streaming save complete for {self.brand_name} - New: {stats['new']}, Updated: {stats['updated']}, "
+            f"Deleted: {stats['deleted']}, Unchanged: {stats['unchanged']} "
+            f"({self.stats['batches']} batches, first write after {self.stats['first_write_seconds']}s)"
+        )
+        return stats
@@ -3,14 +3,43 @@ Supabase 연동 유틸리티
 - DB 연결 및 데이터 저장
 - 브랜드 ID 매핑
 - 이번 달 데이터 삭제 후 새 데이터 저장
+- 프로세스 공용 클라이언트 (get_client)
 """
-from supabase import create_client, Client
-from typing import List, Dict, Any
+import threading
+from datetime import datetime, timezone
+from typing import List, Dict, Any, Optional, Iterator, Tuple, TYPE_CHECKING
 import config
 from utils.logger import setup_logger
+from utils.promotion import make_promotion_key, to_promo_row
+from utils.snapshot_diff import ChangeSet, Snapshot, diff_snapshots
+from utils.batch_writer import BatchWriter
+
+if TYPE_CHECKING:
+    from supabase import Client
 
 logger = setup_logger("supabase_client")
 
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_client() -> 'SupabaseClient':
+    """
+    프로세스 공용 SupabaseClient (처음 호출 시 한 번만 생성, 브랜드/스레드 간 재사용)
+
+    Returns:
+        SupabaseClient
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_lock:
+            if _shared_client is None:
+                client = SupabaseClient()
+                client.load_brand_ids()
+                _shared_client = client
+    return _shared_client
+
+
 class SupabaseClient:
     """Supabase DB 연동 클래스"""
 
@@ -19,12 +48,30 @@ class SupabaseClient:
         if not config.SUPABASE_URL or not config.SUPABASE_KEY:
             raise ValueError("SUPABASE_URL and SUPABASE_KEY must be set in environment variables")
 
-        self.client: Client = create_client(config.SUPABASE_URL, config.SUPABASE_KEY)
+        # supabase 패키지는 무거우므로 실제로 연결할 때만 로드 (dry-run/크롤링만 할 때는 import 안 함)
+        from supabase import create_client
+        self.client: 'Client' = create_client(config.SUPABASE_URL, config.SUPABASE_KEY)
+        # 브랜드명 → ID 캐시 (brand 테이블 전체를 한 번에 로드, 조회 실패 시에만 다시 로드)
+        self._brand_ids: Optional[Dict[str, str]] = None
+        self._brand_lock = threading.Lock()
         logger.info("Supabase client initialized")
 
+    def load_brand_ids(self) -> Dict[str, str]:
+        """
+        brand 테이블 전체를 한 번의 쿼리로 로드해 캐시 갱신
+
+        Returns:
+            브랜드명 → 브랜드 UUID
+        """
+        response = self.client.table('brand').select('id,name').execute()
+        brand_ids = {row['name']: row['id'] for row in response.data or []}
+        self._brand_ids = brand_ids
+        logger.info(f"Loaded {len(brand_ids)} brands")
+        return brand_ids
+
     def get_brand_id(self, brand_name: str) -> str:
         """
-        브랜드명으로 브랜드 ID 조회
+        브랜드명으로 브랜드 ID 조회 (캐시 우선, 캐시에 없으면 brand 테이블 다시 로드)
 
         Args:
             brand_name: 브랜드명 (예: "CU", "SevenEleven")
@@ -32,13 +79,21 @@ class SupabaseClient:
         Returns:
             브랜드 UUID
         """
-        try:
-            response = self.client.table('brand').select('id').eq('name', brand_name).execute()
+        brand_ids = self._brand_ids
+        if brand_ids is not None and brand_name in brand_ids:
+            return brand_ids[brand_name]
 
-            if response.data and len(response.data) > 0:
-                brand_id = response.data[0]['id']
-                logger.info(f"Brand '{brand_name}' found: {brand_id}")
-                return brand_id
+        try:
+            with self._brand_lock:
+                # 다른 스레드가 이미 다시 로드했으면 그 결과 사용
+                if self._brand_ids is brand_ids or self._brand_ids is None:
+                    brand_ids = self.load_brand_ids()
+                else:
+                    brand_ids = self._brand_ids
+
+            if brand_name in brand_ids:
+                logger.info(f"Brand '{brand_name}' found: {brand_ids[brand_name]}")
+                return brand_ids[brand_name]
             else:
                 raise ValueError(f"Brand '{brand_name}' not found in database")
         except Exception as e:
@@ -72,40 +127,123 @@ class SupabaseClient:
         Returns:
             고유 키 (brand_id + title + start_date)
         """
-        title = promo.get('title', '')
-        start_date = promo.get('start_date', '')
+        return make_promotion_key(promo, brand_id)
 
-        # 같은 브랜드 내에서 같은 제목의 프로모션은 시작일 기준으로 하나만 존재
-        if brand_id:
-            return f"{brand_id}_{title}_{start_date}"
-        else:
-            return f"{title}_{start_date}"
+    def iter_existing_promotions(self, brand_id: str, start_date: str,
+                                 columns: str = 'id,title,start_date,content_hash',
+                                 page_size: int = None) -> Iterator[Dict[str, Any]]:
+        """
+        기존 프로모션을 id 기준 keyset 페이지네이션으로 스트리밍 조회
+
+        PostgREST는 max-rows 설정을 넘는 응답을 조용히 잘라내므로 한 번에 조회하지 않고
+        id > 마지막 id 조건으로 고정 크기 페이지를 이어서 읽는다.
+        서버 cap이 page_size보다 작아도 빈 페이지가 나올 때까지 읽으므로 누락되지 않음.
+
+        Args:
+            brand_id: 브랜드 UUID
+            start_date: 시작일
+            columns: 조회할 컬럼 (id 포함 필수)
+            page_size: 페이지 크기 (기본값: config.DB_PAGE_SIZE)
+
+        Yields:
+            기존 프로모션 row
+        """
+        page_size = page_size or config.DB_PAGE_SIZE
+        last_id = None
+        pages = 0
+
+        while True:
+            query = self.client.table('promo').select(columns) \
+                .eq('brand_id', brand_id).eq('start_date', start_date)
+            if last_id is not None:
+                query = query.gt('id', last_id)
+            response = query.order('id').limit(page_size).execute()
 
-    def get_existing_promotions(self, brand_id: str, start_date: str) -> List[Dict[str, Any]]:
+            rows = response.data or []
+            if not rows:
+                break
+
+            pages += 1
+            yield from rows
+            last_id = rows[-1]['id']
+
+        logger.debug(f"Read existing promotions in {pages} pages")
+
+    def get_month_promotions(self, start_date: str, columns: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        모든 브랜드의 한 달 프로모션 조회 (가격 비교/검색 색인 등 후처리 단계용)
+
+        Args:
+            start_date: 시작일
+            columns: 조회할 컬럼 (id 포함 필수)
+
+        Returns:
+            브랜드명 → 프로모션 리스트
         """
-        기존 프로모션 조회
+        promotions_by_brand = {}
+        for brand_name, brand_id in self.load_brand_ids().items():
+            promotions_by_brand[brand_name] = list(self.iter_existing_promotions(brand_id, start_date, columns=columns))
+            logger.info(f"{brand_name}: {len(promotions_by_brand[brand_name])} promotions for {start_date}")
+        return promotions_by_brand
+
+    def promotions_version(self, brand_id: str, start_date: str) -> Tuple[int, Optional[str]]:
+        """
+        프로모션 개수 + 마지막 수정 시각 (row 없이 요청 1번, 로컬 스냅샷 검증용)
 
         Args:
             brand_id: 브랜드 UUID
             start_date: 시작일
 
         Returns:
-            기존 프로모션 리스트
+            (프로모션 개수, max(updated_at) - 없으면 None)
         """
-        try:
-            response = self.client.table('promo').select('*').eq('brand_id', brand_id).eq('start_date', start_date).execute()
-            return response.data if response.data else []
-        except Exception as e:
-            logger.error(f"Failed to get existing promotions: {e}")
-            return []
+        response = self.client.table('promo').select('updated_at', count='exact') \
+            .eq('brand_id', brand_id).eq('start_date', start_date) \
+            .order('updated_at', desc=True).limit(1).execute()
+        rows = response.data or []
+        return response.count or 0, rows[0]['updated_at'] if rows else None
+
+    def load_existing_map(self, brand_id: str, start_date: str,
+                          previous: Optional[Snapshot] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        diff 기준 데이터 (키 → 기존 프로모션)
+
+        로컬 스냅샷이 DB 상태와 일치하면 사용, 아니면 DB 조회
+        (개수만으로는 다른 경로의 추가+삭제/수정을 알 수 없으므로 기록 당시 max(updated_at)까지 비교)
 
-    def save_promotions_with_diff(self, brand_name: str, promotions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        Args:
+            brand_id: 브랜드 UUID
+            start_date: 시작일
+            previous: 이전 실행의 로컬 스냅샷 (선택)
+
+        Returns:
+            키 → 기존 프로모션
+        """
+        if previous is not None:
+            rows, updated_at = self.promotions_version(brand_id, start_date)
+            recorded = getattr(previous, 'db_updated_at', None)
+            if rows == len(previous) and recorded is not None and updated_at == recorded:
+                logger.info(f"Using local snapshot for diff ({len(previous)} rows, skipped DB read)")
+                return previous
+            logger.info(
+                f"Local snapshot does not match DB (rows {len(previous)}/{rows}, "
+                f"updated_at {recorded}/{updated_at}), falling back to DB diff"
+            )
+        # 페이지 단위로 받아 바로 diff 맵에 적재 (조회 실패 시 저장 중단 → 중복 삽입 방지)
+        return {make_promotion_key(p): p for p in self.iter_existing_promotions(brand_id, start_date)}
+
+    def save_promotions_with_diff(self, brand_name: str, promotions: List[Dict[str, Any]],
+                                  previous: Optional[Snapshot] = None,
+                                  allow_delete: bool = True) -> Dict[str, Any]:
         """
         변경사항 감지 후 프로모션 저장
 
         Args:
             brand_name: 브랜드명
             promotions: 크롤링한 프로모션 리스트
+            previous: 이전 실행의 로컬 스냅샷 (키 → 프로모션, 선택)
+                      DB 개수/max(updated_at)와 일치하면 DB 전체 조회 없이 이 스냅샷으로 diff 계산
+            allow_delete: False면 이번에 보이지 않은 기존 프로모션을 삭제하지 않음 (크롤링이 중간에 실패한 경우)
 
         Returns:
             {
@@ -125,103 +263,123 @@ class SupabaseClient:
             brand_id = self.get_brand_id(brand_name)
             start_date = promotions[0].get('start_date')
 
-            # 기존 데이터 조회
-            existing_promos = self.get_existing_promotions(brand_id, start_date)
+            existing_map = self.load_existing_map(brand_id, start_date, previous)
+            changes = diff_snapshots(existing_map, promotions)
+            if not allow_delete and changes.deleted:
+                logger.warning(f"Crawl incomplete, keeping {len(changes.deleted)} promotions that were not seen this run")
+                changes.deleted = {}
+            return self.apply_changes(brand_id, start_date, changes)
 
-            # 고유 키로 매핑
-            existing_map = {self.make_promotion_key(p, brand_id): p for p in existing_promos}
-            new_map = {self.make_promotion_key(p, brand_id): p for p in promotions}
+        except Exception as e:
+            logger.error(f"Failed to save promotions with diff for {brand_name}: {e}")
+            raise
 
-            # 비교
-            existing_keys = set(existing_map.keys())
-            new_keys = set(new_map.keys())
+    def save_promotions_via_rpc(self, brand_name: str, promotions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        전체 크롤링 결과를 merge_promotions RPC로 한 번에 병합 (서버에서 INSERT/UPDATE/DELETE)
 
-            added_keys = new_keys - existing_keys      # 신규
-            deleted_keys = existing_keys - new_keys    # 삭제
-            common_keys = new_keys & existing_keys     # 공통
+        한 번의 네트워크 왕복으로 끝나고, 하나의 트랜잭션이므로 읽는 쪽은 병합 전/후 상태만 보게 됨
+        (supabase/migrations의 merge_promotions 함수 필요)
 
-            # 통계
-            stats = {
-                'new': len(added_keys),
-                'deleted': len(deleted_keys),
-                'updated': 0,
-                'unchanged': 0,
-                'total': 0
-            }
+        Args:
+            brand_name: 브랜드명
+            promotions: 크롤링한 프로모션 리스트
 
-            # 1. 삭제된 프로모션 제거
-            if deleted_keys:
-                deleted_ids = [existing_map[key]['id'] for key in deleted_keys]
-                for promo_id in deleted_ids:
-                    self.client.table('promo').delete().eq('id', promo_id).execute()
-                logger.info(f"Deleted {len(deleted_ids)} promotions")
-
-            # 2. 신규 프로모션 추가
-            new_promos = []
-            for key in added_keys:
-                promo = new_map[key]
-                promo_data = {
-                    'brand_id': brand_id,
-                    'title': promo.get('title'),
-                    'raw_title': promo.get('raw_title'),
-                    'barcode': promo.get('barcode'),
-                    'category': promo.get('category'),
-                    'deal_type': promo.get('deal_type'),
-                    'normal_price': promo.get('normal_price'),
-                    'sale_price': promo.get('sale_price'),
-                    'start_date': promo.get('start_date'),
-                    'end_date': promo.get('end_date'),
-                    'image_url': promo.get('image_url'),
-                    'source_url': promo.get('source_url'),
-                    'description': promo.get('description'),
-                }
-                new_promos.append(promo_data)
-
-            if new_promos:
-                batch_size = 100
-                for i in range(0, len(new_promos), batch_size):
-                    batch = new_promos[i:i + batch_size]
-                    self.client.table('promo').insert(batch).execute()
-                logger.info(f"Inserted {len(new_promos)} new promotions")
-
-            # 3. 기존 프로모션 업데이트 확인 (가격/이미지 변경)
-            updated_count = 0
-            for key in common_keys:
-                existing = existing_map[key]
-                new = new_map[key]
-
-                # 변경 사항 확인
-                changed = False
-                update_data = {}
-
-                if existing.get('sale_price') != new.get('sale_price'):
-                    update_data['sale_price'] = new.get('sale_price')
-                    changed = True
-
-                if existing.get('normal_price') != new.get('normal_price'):
-                    update_data['normal_price'] = new.get('normal_price')
-                    changed = True
-
-                if existing.get('image_url') != new.get('image_url'):
-                    update_data['image_url'] = new.get('image_url')
-                    changed = True
-
-                if changed:
-                    self.client.table('promo').update(update_data).eq('id', existing['id']).execute()
-                    updated_count += 1
-
-            stats['updated'] = updated_count
-            stats['unchanged'] = len(common_keys) - updated_count
-            stats['total'] = len(new_keys)
-
-            logger.info(f"Save complete - New: {stats['new']}, Updated: {stats['updated']}, Deleted: {stats['deleted']}, Unchanged: {stats['unchanged']}")
+        Returns:
+            save_promotions_with_diff와 같은 형식의 통계
+        """
+        if not promotions:
+            logger.warning(f"No promotions to save for {brand_name}")
+            return {'new': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0, 'total': 0}
 
+        try:
+            brand_id = self.get_brand_id(brand_name)
+            start_date = promotions[0].get('start_date')
+            rows = [to_promo_row(p, brand_id) for p in promotions]
+
+            response = self.client.rpc('merge_promotions', {
+                'p_brand_id': brand_id,
+                'p_start_date': start_date,
+                'p_rows': rows,
+            }).execute()
+            stats = response.data
+
+            logger.info(f"Merge complete (rpc) - New: {stats['new']}, Updated: {stats['updated']}, Deleted: {stats['deleted']}, Unchanged: {stats['unchanged']}")
             return stats
 
         except Exception as e:
-            logger.error(f"Failed to save promotions with diff for {brand_name}: {e}")
+            logger.error(f"Failed to merge promotions via rpc for {brand_name}: {e}")
             raise
 
+    def apply_changes(self, brand_id: str, start_date: str, changes: ChangeSet) -> Dict[str, Any]:
+        """
+        변경 세트를 DB에 반영
+
+        Args:
+            brand_id: 브랜드 UUID
+            start_date: 시작일
+            changes: diff_snapshots() 결과
+
+        Returns:
+            save_promotions_with_diff와 같은 형식의 통계
+        """
+        # 1. 삭제된 프로모션 제거
+        if changes.deleted:
+            self.delete_promotions(brand_id, start_date, list(changes.deleted.values()))
+
+        # 2. 신규 프로모션 추가
+        # 삭제 대상과 키가 겹치지 않으므로 삭제 완료 후 배치끼리는 순서 없이 동시 전송
+        new_promos = [to_promo_row(p, brand_id) for p in changes.added.values()]
+        if new_promos:
+            inserted = BatchWriter(self.client).insert(new_promos)['rows']
+            logger.info(f"Inserted {inserted}/{len(new_promos)} new promotions")
+
+        # 3. 기존 프로모션 업데이트 (content_hash가 다르면 전체 필드 갱신)
+        for key, new in changes.updated.items():
+            self.update_promotion(brand_id, start_date, changes.previous[key], new)
+
+        stats = changes.stats()
+        logger.info(f"Save complete - New: {stats['new']}, Updated: {stats['updated']}, Deleted: {stats['deleted']}, Unchanged: {stats['unchanged']}")
+
+        return stats
+
+    def delete_promotions(self, brand_id: str, start_date: str, rows: List[Dict[str, Any]]):
+        """
+        프로모션 삭제 (DB row면 id, 로컬 스냅샷이면 title 기준)
+
+        Args:
+            brand_id: 브랜드 UUID
+            start_date: 시작일
+            rows: 삭제할 기존 프로모션
+        """
+        ids = [p['id'] for p in rows if p.get('id')]
+        titles = [p.get('title') for p in rows if not p.get('id')]
+        for i in range(0, len(ids), 100):
+            self.client.table('promo').delete().in_('id', ids[i:i + 100]).execute()
+        for i in range(0, len(titles), 50):
+            self.client.table('promo').delete().eq('brand_id', brand_id).eq('start_date', start_date) \
+                .in_('title', titles[i:i + 50]).execute()
+        logger.info(f"Deleted {len(rows)} promotions")
+
+    def update_promotion(self, brand_id: str, start_date: str, existing: Dict[str, Any], new: Dict[str, Any]):
+        """
+        기존 프로모션 전체 필드 갱신
+
+        Args:
+            brand_id: 브랜드 UUID
+            start_date: 시작일
+            existing: 기존 프로모션 (id가 있으면 id로, 없으면 title로 대상 지정)
+            new: 새로 크롤링한 프로모션
+        """
+        # merge_promotions/COPY 경로처럼 updated_at 갱신 (로컬 스냅샷 검증 기준)
+        row = {**to_promo_row(new, brand_id), 'updated_at': datetime.now(timezone.utc).isoformat()}
+        query = self.client.table('promo').update(row)
+        if existing.get('id'):
+            query = query.eq('id', existing['id'])
+        else:
+            query = query.eq('brand_id', brand_id).eq('start_date', start_date).eq('title', new.get('title'))
+        query.execute()
+
     def save_promotions(self, brand_name: str, promotions: List[Dict[str, Any]]) -> int:
         """
         프로모션 데이터 저장
@@ -261,33 +419,12 @@ class SupabaseClient:
                 seen_titles.add(title)
 
                 # brand_id 추가 및 필요한 필드만 선택
-                promo_data = {
-                    'brand_id': brand_id,
-                    'title': title,
-                    'raw_title': promo.get('raw_title'),
-                    'barcode': promo.get('barcode'),
-                    'category': promo.get('category'),
-                    'deal_type': promo.get('deal_type'),
-                    'normal_price': promo.get('normal_price'),
-                    'sale_price': promo.get('sale_price'),
-                    'start_date': promo.get('start_date'),
-                    'end_date': promo.get('end_date'),
-                    'image_url': promo.get('image_url'),
-                    'source_url': promo.get('source_url'),
-                    'description': promo.get('description'),  # 상품 설명 또는 중량 정보
-                }
+                promo_data = to_promo_row(promo, brand_id)
                 data_to_insert.append(promo_data)
 
-            # 배치로 삽입 (한 번에 너무 많으면 분할)
-            batch_size = 100
-            total_inserted = 0
-
-            for i in range(0, len(data_to_insert), batch_size):
-                batch = data_to_insert[i:i + batch_size]
-                response = self.client.table('promo').insert(batch).execute()
-                inserted_count = len(response.data) if response.data else 0
-                total_inserted += inserted_count
-                logger.info(f"Inserted batch {i//batch_size + 1}: {inserted_count} promotions")
+            # 배치로 동시 삽입 (기존 데이터 삭제가 끝난 뒤 시작)
+            write_stats = BatchWriter(self.client).insert(data_to_insert)
+            total_inserted = write_stats['rows']
 
             logger.info(f"Successfully saved {total_inserted} promotions for {brand_name}")
             return total_inserted
@@ -299,7 +436,7 @@ class SupabaseClient:
 
 if __name__ == '__main__':
     # 테스트
-    client = SupabaseClient()
+    client = get_client()
 
     # 브랜드 ID 조회 테스트
     try:
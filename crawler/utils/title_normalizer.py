@@ -0,0 +1,154 @@
+"""
+상품명 정규화
+- 전각 문자/괄호/특수 공백을 변환 테이블 한 번으로 정리 (str.translate)
+- 행사 표기((1+1), [2+1] 등) 제거, 용량/중량 단위 표기 통일
+- 용량(ml)/중량(g), 묶음 개수, 중복 판단용 키 추출
+- 같은 상품명이 여러 탭/페이지에 반복되므로 결과를 메모이제이션
+"""
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, NamedTuple, Optional
+
+
+class NormalizedTitle(NamedTuple):
+    """정규화 결과"""
+    title: str                      # 화면 표시용 정규화 제목
+    dedup_key: str                  # 중복 판단 키 (공백/기호/대소문자 무시)
+    volume: Optional[float]         # 용량(ml) 또는 중량(g), 묶음이면 1개 기준
+    volume_unit: Optional[str]      # 'ml' 또는 'g'
+    pack_count: int                 # 묶음 개수 (예: 6입 → 6)
+
+
+def _build_translation() -> dict:
+    """전각 → 반각, 괄호/공백 변형 → 기본 문자 변환 테이블"""
+    table = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}  # ！..～ → !..~
+    table.update({
+        0x3000: ' ',    # 전각 공백
+        0x00A0: ' ',    # NBSP
+        0x200B: None,   # zero-width space
+        0xFEFF: None,   # BOM
+        0x00D7: 'x',    # ×
+    })
+    for chars, replacement in [('【〔［「『〈《', '['), ('】〕］」』〉》', ']'), ('﹙', '('), ('﹚', ')')]:
+        for ch in chars:
+            table[ord(ch)] = replacement
+    return table
+
+
+_TRANSLATION = _build_translation()
+
+_DEAL_MARKER = re.compile(r'[\[(]\s*(?:\d\s*\+\s*\d|덤\s*증정|증정|덤|행사|new|신상)\s*[\])]', re.IGNORECASE)
+_QUANTITY = re.compile(r'(\d+(?:\.\d+)?)\s*(ml|kg|l|g)(?![a-z])', re.IGNORECASE)
+_PACK = re.compile(r'(?:[x*]\s*(\d+)\s*(?:입|개|ea|p)?|(\d+)\s*(?:입|개입|ea))(?![a-z0-9])', re.IGNORECASE)
+_SPACES = re.compile(r'\s+')
+_NON_KEY = re.compile(r'[^0-9a-z가-힣.]+')
+
+# 단위 표기 통일 (표시용 단위, 기준 단위, 배수)
+_UNITS = {
+    'ml': ('ml', 'ml', 1),
+    'l': ('L', 'ml', 1000),
+    'g': ('g', 'g', 1),
+    'kg': ('kg', 'g', 1000),
+}
+
+
+def _unit_repl(match: re.Match) -> str:
+    return f"{match.group(1)}{_UNITS[match.group(2).lower()][0]}"
+
+
+@lru_cache(maxsize=100_000)
+def normalize_title(raw_title: str) -> NormalizedTitle:
+    """
+    상품명 정규화 (같은 입력은 캐시된 결과 반환)
+
+    Args:
+        raw_title: 크롤링한 원본 상품명 (예: "코카콜라 ５００ＭＬ（1+1）")
+
+    Returns:
+        NormalizedTitle(title='코카콜라 500ml', dedup_key='코카콜라500ml', volume=500.0, volume_unit='ml', pack_count=1)
+    """
+    text = raw_title.translate(_TRANSLATION)
+    text = _DEAL_MARKER.sub(' ', text)
+    text = _QUANTITY.sub(_unit_repl, text)
+    title = _SPACES.sub(' ', text).strip() or raw_title.strip()
+
+    volume = volume_unit = None
+    quantities = _QUANTITY.findall(title)
+    if quantities:
+        value, unit = quantities[-1]
+        _, volume_unit, factor = _UNITS[unit.lower()]
+        volume = float(value) * factor
+
+    pack_count = 1
+    pack = _PACK.search(title)
+    if pack:
+        pack_count = int(pack.group(1) or pack.group(2)) or 1
+
+    return NormalizedTitle(title, _NON_KEY.sub('', title.lower()), volume, volume_unit, pack_count)
+
+
+def normalize_products(products: List[Dict[str, Any]]):
+    """
+    상품 목록 일괄 정규화 (제자리 수정)
+
+    raw_title에는 원본 상품명을 유지하고 title을 정규화된 값으로 교체.
+    이미 정규화된 상품(raw_title 보유)도 raw_title 기준으로 다시 계산하므로 여러 번 실행해도 결과가 같음.
+
+    Args:
+        products: 크롤링한 상품 리스트
+    """
+    for product in products:
+        raw_title = product.get('raw_title') or product.get('title')
+        if not raw_title:
+            continue
+        normalized = normalize_title(raw_title)
+        product['raw_title'] = raw_title
+        product['title'] = normalized.title
+        product['dedup_key'] = normalized.dedup_key
+        product['volume'] = normalized.volume
+        product['volume_unit'] = normalized.volume_unit
+        product['pack_count'] = normalized.pack_count
+
+
+def _benchmark(count: int):
+    """정규화 처리량 측정 (캐시 없음 / 캐시 적중)"""
+    import random
+    import time
+
+    random.seed(0)
+    makers = ['농심)', 'CJ)', '롯데)', '오뚜기)', '해태)', '']
+    names = ['신라면', '햇반', '칸쵸컵', '진라면', '홈런볼', '코카콜라', '포카리스웨트', '삼각김밥참치마요']
+    sizes = ['500ml', '５００ＭＬ', '1.5L', '210 g', '120g*5입', '355ml x 6', '']
+    markers = ['', '(1+1)', '［2+1］', '【NEW】', ' ']
+    # 실제 크롤링처럼 같은 상품명이 여러 탭/페이지에 반복 (고유 상품명은 전체의 1/5)
+    pool = [
+        f"{random.choice(makers)}{random.choice(names)}{i} {random.choice(sizes)}{random.choice(markers)}"
+        for i in range(max(1, count // 5))
+    ]
+    titles = [random.choice(pool) for _ in range(count)]
+
+    normalize_title.cache_clear()
+    started = time.perf_counter()
+    for title in titles:
+        normalize_title.__wrapped__(title)
+    uncached = time.perf_counter() - started
+
+    started = time.perf_counter()
+    products = [{'title': t, 'raw_title': t} for t in titles]
+    normalize_products(products)
+    cached = time.perf_counter() - started
+
+    info = normalize_title.cache_info()
+    print(f"\n=== {count} titles ({len(set(titles))} unique) ===")
+    print(f"uncached: {uncached:.3f}s ({count / uncached:,.0f} titles/s)")
+    print(f"normalize_products (memoized): {cached:.3f}s ({count / cached:,.0f} titles/s), "
+          f"cache hits {info.hits}, misses {info.misses}")
+    for title in titles[:5]:
+        print(f"  {title!r} -> {normalize_title(title)}")
+
+
+if __name__ == '__main__':
+    # 벤치마크: python -m utils.title_normalizer [count]
+    import sys
+
+    _benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,217 @@
+"""
+작업 큐 실행기
+- 페이지/상세 요청 같은 작업을 큐에 넣고 워커 스레드 여러 개가 처리 (작업 하나가 실패해도 나머지는 계속)
+- 실패한 작업은 지수 백오프 후 다시 큐에 넣고, 최대 시도 횟수를 넘기면 dead-letter 파일(JSONL)에 기록
+- 처리 함수가 실행 중 새 작업을 추가할 수 있음 (예: 페이지 N 완료 → 페이지 N+1)
+- dead-letter 파일은 다음 실행에서 읽어 같은 작업을 다시 시도하는 데 사용 (--resume), 직전 실행 기록은 .1로 보관
+"""
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+import config
+from utils.logger import setup_logger, update_log_context, get_log_context
+
+logger = setup_logger("work_queue")
+
+
+class Task:
+    """큐 작업 하나"""
+
+    def __init__(self, kind: str, key: str, payload: Dict[str, Any]):
+        self.kind = kind          # 처리 함수 구분 (예: "page", "detail")
+        self.key = key            # 실행 안에서 작업을 구분하는 키 (같은 키는 한 번만 추가됨)
+        self.payload = payload    # 처리 함수에 넘길 데이터 (dead-letter에 그대로 기록되므로 JSON 직렬화 가능해야 함)
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+
+
+class DeadLetterLog:
+    """최대 시도 횟수를 넘긴 작업 기록 (브랜드별 JSONL, 다음 실행에서 재시도용으로 읽음)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: dead-letter 파일 경로
+        """
+        self.path = path
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def load(self) -> List[Dict[str, Any]]:
+        """
+        이전 실행의 dead-letter 항목 읽기
+
+        Returns:
+            [{'kind', 'key', 'payload', 'attempts', 'error', ...}, ...] (깨진 줄은 무시)
+        """
+        if not os.path.exists(self.path):
+            return []
+        entries = []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+        return entries
+
+    def rotate(self):
+        """이번 실행 기록 시작 (이전 파일은 <path>.1로 보관, 그 전 보관본은 덮어씀)"""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.replace(self.path, self.path + '.1')
+            self.count = 0
+
+    def write(self, task: Task):
+        """작업 하나 기록"""
+        entry = {
+            'ts': datetime.now().isoformat(timespec='seconds'),
+            'run': get_log_context()['run'],
+            'kind': task.kind,
+            'key': task.key,
+            'payload': task.payload,
+            'attempts': task.attempts,
+            'error': task.last_error,
+        }
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            self.count += 1
+
+
+class WorkQueue:
+    """재시도/백오프/dead-letter를 지원하는 작업 큐"""
+
+    def __init__(self, handlers: Dict[str, Callable[[Task], None]], workers: int = None,
+                 max_attempts: int = None, backoff: float = None,
+                 on_dead: Callable[[Task], None] = None, dead_letter: DeadLetterLog = None,
+                 log_fields: Dict[str, Any] = None):
+        """
+        Args:
+            handlers: {작업 종류: 처리 함수} 처리 함수가 예외를 던지면 실패로 보고 재시도
+            workers: 워커 스레드 수 (기본값: config.CRAWL_WORKERS)
+            max_attempts: 작업별 최대 시도 횟수 (기본값: config.TASK_MAX_ATTEMPTS)
+            backoff: 첫 재시도 대기 시간(초), 이후 2배씩 (기본값: config.TASK_RETRY_BACKOFF)
+            on_dead: 작업이 최종 실패했을 때 호출 (예: 다음 페이지로 넘어가기)
+            dead_letter: 최종 실패 작업 기록
+            log_fields: 워커 스레드 로그 컨텍스트 (예: {'brand': 'CU'})
+        """
+        self.handlers = handlers
+        self.workers = workers or config.CRAWL_WORKERS
+        self.max_attempts = max_attempts or config.TASK_MAX_ATTEMPTS
+        self.backoff = config.TASK_RETRY_BACKOFF if backoff is None else backoff
+        self.on_dead = on_dead
+        self.dead_letter = dead_letter
+        self.log_fields = log_fields or {}
+        self.stats = {'submitted': 0, 'done': 0, 'retried': 0, 'dead': 0}
+
+        self._heap: List[Any] = []   # (실행 가능 시각, 순번, 작업)
+        self._seq = itertools.count()
+        self._seen = set()           # (종류, 키) 중복 추가 방지
+        self._pending = 0            # 추가됐지만 아직 끝나지(성공/최종 실패) 않은 작업 수
+        self._cond = threading.Condition()
+
+    def submit(self, kind: str, key: str, payload: Dict[str, Any] = None) -> bool:
+        """
+        작업 추가 (처리 함수 안에서도 호출 가능)
+
+        Args:
+            kind: 작업 종류 (handlers 키)
+            key: 작업 키 (이미 추가된 키면 무시)
+            payload: 처리 함수에 넘길 데이터
+
+        Returns:
+            새로 추가했으면 True
+        """
+        with self._cond:
+            if (kind, key) in self._seen:
+                return False
+            self._seen.add((kind, key))
+            self._pending += 1
+            self.stats['submitted'] += 1
+            heapq.heappush(self._heap, (time.monotonic(), next(self._seq), Task(kind, key, payload or {})))
+            self._cond.notify()
+        return True
+
+    def _next_task(self) -> Optional[Task]:
+        """실행할 작업 대기 (남은 작업이 없으면 None)"""
+        with self._cond:
+            while True:
+                if self._pending == 0:
+                    self._cond.notify_all()
+                    return None
+                now = time.monotonic()
+                if self._heap and self._heap[0][0] <= now:
+                    return heapq.heappop(self._heap)[2]
+                # 백오프 중인 작업만 남았으면 가장 빠른 재시도 시각까지 대기
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+
+    def _worker(self):
+        update_log_context(**self.log_fields)
+        while True:
+            task = self._next_task()
+            if task is None:
+                return
+            finished = True
+            try:
+                self.handlers[task.kind](task)
+                with self._cond:
+                    self.stats['done'] += 1
+            except Exception as e:
+                task.attempts += 1
+                task.last_error = f"{type(e).__name__}: {e}"
+                if task.attempts < self.max_attempts:
+                    # 서킷이 열려 있으면 최소한 복구 시도 시각까지 대기
+                    delay = max(self.backoff * 2 ** (task.attempts - 1), getattr(e, 'retry_after', 0) or 0)
+                    logger.warning(
+                        "%s %s failed (attempt %d/%d), retrying in %.0fs: %s",
+                        task.kind, task.key, task.attempts, self.max_attempts, delay, e,
+                    )
+                    with self._cond:
+                        self.stats['retried'] += 1
+                        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), task))
+                    finished = False
+                else:
+                    self._dead(task)
+            finally:
+                # 완료/재예약 모두 대기 중인 워커를 깨움 (재시도 시각 재계산 또는 종료 확인)
+                with self._cond:
+                    if finished:
+                        self._pending -= 1
+                    self._cond.notify_all()
+
+    def _dead(self, task: Task):
+        """최종 실패 처리 (dead-letter 기록 후 on_dead 호출)"""
+        logger.error(f"{task.kind} {task.key} failed after {task.attempts} attempts, dead-lettered: {task.last_error}")
+        with self._cond:
+            self.stats['dead'] += 1
+        if self.dead_letter is not None:
+            self.dead_letter.write(task)
+        if self.on_dead is not None:
+            try:
+                self.on_dead(task)
+            except Exception as e:
+                logger.error(f"on_dead handler failed for {task.kind} {task.key}: {e}")
+
+    def run(self) -> Dict[str, int]:
+        """
+        남은 작업이 없을 때까지 처리
+
+        Returns:
+            통계 (submitted, done, retried, dead)
+        """
+        threads = [
+            threading.Thread(target=self._worker, name=f"work-queue-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return self.stats
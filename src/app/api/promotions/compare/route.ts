@@ -19,44 +19,50 @@ export async function GET(request: NextRequest) {
 
     const supabase = await createClient();
 
-    // 검색어로 모든 프로모션 조회
-    const { data, error } = await supabase
-      .from('promo_with_brand')
-      .select('*')
-      .ilike('title', `%${query}%`)
-      .order('sale_price', { ascending: true }); // 가격 낮은 순
+    // 크롤러가 사전 계산한 비교 그룹 조회 (브랜드가 가장 많이 겹치는 상품)
+    const monthStart = new Date();
+    monthStart.setDate(1);
+    const startDate = `${monthStart.getFullYear()}-${String(monthStart.getMonth() + 1).padStart(2, '0')}-01`;
 
-    if (error) {
-      console.error('Supabase error:', error);
-      return NextResponse.json(
-        { error: 'Failed to fetch promotions' },
-        { status: 500 }
-      );
-    }
+    const { data: groups } = await supabase
+      .from('promo_compare_group')
+      .select('promo_ids')
+      .eq('start_date', startDate)
+      .ilike('title', `%${query}%`)
+      .order('brand_count', { ascending: false })
+      .order('min_unit_price', { ascending: true })
+      .limit(1);
 
-    // 브랜드별로 그룹화 (각 브랜드당 가장 저렴한 1개만)
-    const brandMap = new Map();
+    let comparison;
 
-    for (const promo of data || []) {
-      const brandName = promo.brand_name;
+    if (groups && groups.length > 0) {
+      // 그룹의 브랜드별 최저가 프로모션만 id로 조회
+      const { data, error } = await supabase
+        .from('promo_with_brand')
+        .select('*')
+        .in('id', groups[0].promo_ids);
 
-      if (!brandMap.has(brandName)) {
-        brandMap.set(brandName, promo);
+      if (error) {
+        console.error('Supabase error:', error);
+        return NextResponse.json(
+          { error: 'Failed to fetch promotions' },
+          { status: 500 }
+        );
       }
-      // 이미 해당 브랜드가 있으면 가격이 더 낮은 것으로 교체
-      else {
-        const existing = brandMap.get(brandName);
-        if (promo.sale_price < existing.sale_price) {
-          brandMap.set(brandName, promo);
-        }
+
+      comparison = (data || []).sort((a, b) =>
+        a.brand_name.localeCompare(b.brand_name)
+      );
+    } else {
+      comparison = await compareByTitle(supabase, query);
+      if (!comparison) {
+        return NextResponse.json(
+          { error: 'Failed to fetch promotions' },
+          { status: 500 }
+        );
       }
     }
 
-    // Map을 배열로 변환하고 브랜드명 순 정렬
-    const comparison = Array.from(brandMap.values()).sort((a, b) =>
-      a.brand_name.localeCompare(b.brand_name)
-    );
-
     // 최저가 찾기
     const lowestPrice = comparison.length > 0
       ? Math.min(...comparison.map(p => p.sale_price))
@@ -76,3 +82,46 @@ export async function GET(request: NextRequest) {
     );
   }
 }
+
+/**
+ * 사전 계산된 그룹이 없을 때: 제목 검색 결과에서 브랜드별 최저가 1개씩
+ */
+async function compareByTitle(
+  supabase: Awaited<ReturnType<typeof createClient>>,
+  query: string
+) {
+  // 검색어로 모든 프로모션 조회
+  const { data, error } = await supabase
+    .from('promo_with_brand')
+    .select('*')
+    .ilike('title', `%${query}%`)
+    .order('sale_price', { ascending: true }); // 가격 낮은 순
+
+  if (error) {
+    console.error('Supabase error:', error);
+    return null;
+  }
+
+  // 브랜드별로 그룹화 (각 브랜드당 가장 저렴한 1개만)
+  const brandMap = new Map();
+
+  for (const promo of data || []) {
+    const brandName = promo.brand_name;
+
+    if (!brandMap.has(brandName)) {
+      brandMap.set(brandName, promo);
+    }
+    // 이미 해당 브랜드가 있으면 가격이 더 낮은 것으로 교체
+    else {
+      const existing = brandMap.get(brandName);
+      if (promo.sale_price < existing.sale_price) {
+        brandMap.set(brandName, promo);
+      }
+    }
+  }
+
+  // Map을 배열로 변환하고 브랜드명 순 정렬
+  return Array.from(brandMap.values()).sort((a, b) =>
+    a.brand_name.localeCompare(b.brand_name)
+  );
+}
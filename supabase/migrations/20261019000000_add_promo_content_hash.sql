@@ -0,0 +1,8 @@
+-- 프로모션 콘텐츠 해시 컬럼 추가
+-- 크롤러가 계산한 fingerprint (crawler/utils/promotion.py content_hash)
+-- diff 시 id + content_hash만 조회해서 변경 여부 판단
+ALTER TABLE promo ADD COLUMN IF NOT EXISTS content_hash text;
+
+-- diff 조회 (brand_id + start_date) 시 해시까지 인덱스에서 읽도록 커버링 인덱스
+CREATE INDEX IF NOT EXISTS promo_brand_start_hash_idx
+  ON promo (brand_id, start_date) INCLUDE (title, content_hash);
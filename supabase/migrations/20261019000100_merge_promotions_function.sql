@@ -0,0 +1,100 @@
+-- 브랜드/월 단위 프로모션 병합 함수
+-- 크롤러가 한 번의 RPC로 전체 크롤링 결과를 보내면 INSERT/UPDATE/DELETE를 한 트랜잭션에서 처리
+-- 키: brand_id + title + start_date (crawler/utils/promotion.py make_promotion_key와 동일)
+-- 변경 감지: content_hash 비교
+-- 반환: {"new": 0, "updated": 0, "deleted": 0, "unchanged": 0, "total": 0}
+CREATE OR REPLACE FUNCTION merge_promotions(p_brand_id uuid, p_start_date date, p_rows jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  v_total integer;
+  v_new integer;
+  v_updated integer;
+  v_deleted integer;
+BEGIN
+  -- 같은 브랜드/월 병합이 동시에 실행되지 않도록 직렬화
+  PERFORM pg_advisory_xact_lock(hashtext(p_brand_id::text || p_start_date::text));
+
+  WITH incoming AS (
+    -- 같은 제목이 여러 번 오면 마지막 값 사용 (크롤러 diff와 동일)
+    SELECT DISTINCT ON (r.title) r.*
+    FROM ROWS FROM (
+      jsonb_to_recordset(p_rows) AS (
+        title text,
+        raw_title text,
+        barcode text,
+        category text,
+        deal_type deal_type,
+        normal_price integer,
+        sale_price integer,
+        start_date date,
+        end_date date,
+        image_url text,
+        source_url text,
+        description text,
+        content_hash text
+      )
+    ) WITH ORDINALITY AS r(title, raw_title, barcode, category, deal_type, normal_price, sale_price,
+                           start_date, end_date, image_url, source_url, description, content_hash, ord)
+    WHERE r.start_date = p_start_date
+    ORDER BY r.title, r.ord DESC
+  ),
+  deleted AS (
+    DELETE FROM promo p
+    WHERE p.brand_id = p_brand_id
+      AND p.start_date = p_start_date
+      AND NOT EXISTS (SELECT 1 FROM incoming i WHERE i.title = p.title)
+    RETURNING 1
+  ),
+  updated AS (
+    UPDATE promo p
+    SET raw_title = i.raw_title,
+        barcode = i.barcode,
+        category = i.category,
+        deal_type = i.deal_type,
+        normal_price = i.normal_price,
+        sale_price = i.sale_price,
+        end_date = i.end_date,
+        image_url = i.image_url,
+        source_url = i.source_url,
+        description = i.description,
+        content_hash = i.content_hash,
+        updated_at = now()
+    FROM incoming i
+    WHERE p.brand_id = p_brand_id
+      AND p.start_date = p_start_date
+      AND p.title = i.title
+      AND p.content_hash IS DISTINCT FROM i.content_hash
+    RETURNING 1
+  ),
+  inserted AS (
+    INSERT INTO promo (brand_id, title, raw_title, barcode, category, deal_type, normal_price, sale_price,
+                       start_date, end_date, image_url, source_url, description, content_hash)
+    SELECT p_brand_id, i.title, i.raw_title, i.barcode, i.category, i.deal_type, i.normal_price, i.sale_price,
+           i.start_date, i.end_date, i.image_url, i.source_url, i.description, i.content_hash
+    FROM incoming i
+    WHERE NOT EXISTS (
+      SELECT 1 FROM promo p
+      WHERE p.brand_id = p_brand_id AND p.start_date = p_start_date AND p.title = i.title
+    )
+    RETURNING 1
+  )
+  SELECT (SELECT count(*) FROM incoming),
+         (SELECT count(*) FROM inserted),
+         (SELECT count(*) FROM updated),
+         (SELECT count(*) FROM deleted)
+  INTO v_total, v_new, v_updated, v_deleted;
+
+  RETURN jsonb_build_object(
+    'new', v_new,
+    'updated', v_updated,
+    'deleted', v_deleted,
+    'unchanged', v_total - v_new - v_updated,
+    'total', v_total
+  );
+END;
+$$;
+
+-- 크롤러(service role)만 호출
+REVOKE ALL ON FUNCTION merge_promotions(uuid, date, jsonb) FROM PUBLIC;
@@ -0,0 +1,24 @@
+-- 브랜드 간 가격 비교 그룹 (크롤러가 매 실행 후 사전 계산: crawler/utils/price_compare.py)
+-- 같은 바코드 또는 같은 정규화 제목을 가진 프로모션을 묶고, 브랜드별 최저 실질 개당 가격 프로모션 id를 보관
+CREATE TABLE IF NOT EXISTS promo_compare_group (
+  id uuid PRIMARY KEY DEFAULT gen_random_uuid(),
+  start_date date NOT NULL,
+  group_key text NOT NULL,          -- barcode:<바코드> 또는 title:<정규화 제목>
+  match_type text NOT NULL,         -- barcode / title
+  title text NOT NULL,
+  barcode text,
+  brand_count integer NOT NULL,
+  min_unit_price numeric,
+  cheapest_brand text,
+  promo_ids uuid[] NOT NULL,        -- 브랜드별 최저가 프로모션 (개당 가격 오름차순)
+  updated_at timestamptz NOT NULL DEFAULT now(),
+  UNIQUE (start_date, group_key)
+);
+
+CREATE INDEX IF NOT EXISTS promo_compare_group_title_idx ON promo_compare_group (start_date, title);
+
+ALTER TABLE promo_compare_group ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "promo_compare_group is readable by everyone"
+  ON promo_compare_group FOR SELECT
+  USING (true);
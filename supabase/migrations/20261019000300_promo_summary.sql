@@ -0,0 +1,23 @@
+-- 브랜드/카테고리/행사 유형/월별 프로모션 집계 (크롤러가 업로드 시 변경된 그룹만 갱신: crawler/utils/promo_summary.py)
+-- 가격은 행사를 반영한 실질 개당 가격 (1+1: 1/2, 2+1: 2/3)
+CREATE TABLE IF NOT EXISTS promo_summary (
+  brand_id uuid NOT NULL REFERENCES brand(id) ON DELETE CASCADE,
+  month date NOT NULL,
+  category text NOT NULL DEFAULT '',  -- 카테고리 없음은 빈 문자열
+  deal_type deal_type NOT NULL,
+  item_count integer NOT NULL,
+  min_price numeric,
+  median_price numeric,
+  max_price numeric,
+  newest jsonb NOT NULL DEFAULT '[]',  -- [{title, sale_price, image_url}] 최신순 최대 5개
+  updated_at timestamptz NOT NULL DEFAULT now(),
+  PRIMARY KEY (brand_id, month, category, deal_type)
+);
+
+CREATE INDEX IF NOT EXISTS promo_summary_month_idx ON promo_summary (month, deal_type);
+
+ALTER TABLE promo_summary ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "promo_summary is readable by everyone"
+  ON promo_summary FOR SELECT
+  USING (true);